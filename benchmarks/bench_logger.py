@@ -0,0 +1,149 @@
+# ===== LOGGER BENCHMARK / БЕНЧМАРК ЛОГГЕРА =====
+# Measures the cost of one log call and of caller resolution
+# Измеряет стоимость одного вызова логгера и определения вызывающего кода
+#
+# Run from the project root / Запуск из корня проекта:
+#     python -m benchmarks.bench_logger [calls]
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import contextlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Local application imports / Импорты локального приложения
+from src.core.Logger import Logger
+from src.core.LogWriter import LogWriter
+
+
+# ===== LEGACY CALLER RESOLUTION / ПРЕЖНЕЕ ОПРЕДЕЛЕНИЕ ВЫЗЫВАЮЩЕГО КОДА =====
+def legacy_caller() -> tuple:
+    """
+    Caller resolution as Logger._univ_log did it before / Определение вызывающего кода, как раньше делал Logger._univ_log
+
+    inspect.stack() builds FrameInfo with source context for every frame of the stack.
+    inspect.stack() строит FrameInfo с контекстом исходника для каждого кадра стека.
+    """
+    stack = inspect.stack()
+    caller_frame = stack[2].frame
+    file_name = Path(inspect.getfile(caller_frame)).name
+    module = inspect.getmodule(caller_frame).__name__  # type: ignore
+    deff = caller_frame.f_code.co_name
+    cls_obj = caller_frame.f_locals.get("self", None)
+    cls_name = cls_obj.__class__.__name__ if cls_obj else None
+    return file_name, module, cls_name, deff
+
+
+# ===== LEGACY FILE OUTPUT / ПРЕЖНИЙ ВЫВОД В ФАЙЛ =====
+def legacy_write(path: Path, record: dict) -> None:
+    """
+    Synchronous output as Logger._univ_log did it before / Синхронный вывод, как раньше делал Logger._univ_log
+
+    Console print plus open, append one line and close the file on every call.
+    Вывод в консоль плюс открытие, добавление одной строки и закрытие файла при каждом вызове.
+    """
+    print(record, file=sys.stderr)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+# ===== SAMPLE CALLER / ПРИМЕР ВЫЗЫВАЮЩЕГО КОДА =====
+class Sample:
+    """Stands in for a model or view that logs / Заменяет модель или представление, которое логирует"""
+
+    def __init__(self, lg: Logger):
+        self.lg = lg
+
+    def legacy(self) -> tuple:
+        return self._legacy_level()
+
+    def _legacy_level(self) -> tuple:
+        # Same depth as debug() -> _univ_log / Та же глубина, что debug() -> _univ_log
+        return legacy_caller()
+
+    def current(self) -> tuple:
+        return self._current_level()
+
+    def _current_level(self) -> tuple:
+        return self.lg._caller(1)
+
+    def log(self) -> None:
+        self.lg.debug("Benchmark message.")
+
+
+# ===== MEASUREMENT / ИЗМЕРЕНИЕ =====
+def per_call(fn, calls: int, nested: int) -> float:
+    """
+    Microseconds per call of fn under a stack of nested frames / Микросекунды на вызов fn под стеком вложенных кадров
+
+    The GUI logs from deep Qt call stacks, so the stack depth matters for inspect.stack().
+    GUI логирует из глубоких стеков вызовов Qt, поэтому глубина стека важна для inspect.stack().
+    """
+    if nested > 0:
+        return per_call(fn, calls, nested - 1)
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main(calls: int = 2000) -> None:
+    lg = Logger()
+    sample = Sample(lg)
+
+    # Same file, module and class from both ways / Одинаковые файл, модуль и класс от обоих способов
+    assert sample.legacy()[:3] == sample.current()[:3], (sample.legacy(), sample.current())
+
+    print(f"Logger benchmark, {calls} calls, Python {sys.version.split()[0]}")
+    for nested in (0, 30):
+        legacy_us = per_call(sample.legacy, calls, nested)
+        current_us = per_call(sample.current, calls, nested)
+        print(
+            f"  caller resolution, stack +{nested:<2}: "
+            f"inspect.stack {legacy_us:9.1f} us | _getframe + cache {current_us:6.2f} us "
+            f"| x{legacy_us / current_us:.0f}"
+        )
+
+    # Output cost, console goes to devnull and files to a temporary directory /
+    # Стоимость вывода, консоль уходит в devnull, а файлы во временную папку
+    record = dict.fromkeys(("timestamp", "level", "filename", "module", "class", "def"), "x")
+    record["message"] = "Benchmark message."
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stderr(devnull):
+            legacy_path = Path(tmp) / "legacy.jsonl"
+            sync_us = per_call(lambda: legacy_write(legacy_path, record), calls, 0)
+
+        saved_writer = lg._writer
+        lg._writer = LogWriter(Path(tmp) / "async", echo=False)
+        try:
+            log_us = per_call(sample.log, calls, 0)
+            lg._writer.close()
+            writer_stats = lg._writer.stats()
+        finally:
+            lg._writer = saved_writer
+
+    # Disabled level: f-string is built anyway, %-args and callables are not /
+    # Выключенный уровень: f-строка строится всё равно, %-аргументы и функции нет
+    args = tuple(range(20))
+    saved_debug = lg._debug_on
+    lg._debug_on = False
+    try:
+        fstring_us = per_call(lambda: lg.debug(f"Add method received args: {args}"), calls, 0)
+        lazy_us = per_call(lambda: lg.debug("Add method received args: %s", args), calls, 0)
+    finally:
+        lg._debug_on = saved_debug
+
+    print(f"  disabled lg.debug(): f-string {fstring_us:.2f} us | %-args {lazy_us:.2f} us")
+    print(f"  output per record: print + open/append/close {sync_us:.1f} us")
+    print(f"  full lg.debug() call with background writer: {log_us:.1f} us")
+    print(f"  writer: {writer_stats}")
+
+
+# ===== MAIN EXECUTION BLOCK / БЛОК ГЛАВНОГО ВЫПОЛНЕНИЯ =====
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
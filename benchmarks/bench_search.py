@@ -0,0 +1,89 @@
+# ===== SEARCH BENCHMARK / БЕНЧМАРК ПОИСКА =====
+# Measures latency of the ranked trigram search of the search bar on the configured database
+# Измеряет задержку ранжированного триграммного поиска строки поиска на настроенной базе данных
+#
+# Run from the project root / Запуск из корня проекта:
+#     python -m benchmarks.bench_search [table] [queries]
+#
+# The target is p95 under 50 ms on a 500k row Student table. /
+# Цель - p95 меньше 50 мс на таблице Student из 500 тыс. строк.
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import random
+import sys
+import time
+
+# Local application imports / Импорты локального приложения
+from src.database.Connection import Connection
+from src.database.QueryExecutor import QueryHandle
+from src.database.Schema import Schema
+from src.database.queries.QueryBuilder import AdvancedQueryBuilder, QueryCriteria
+
+# Searched columns per table, as in the models / Колонки поиска по таблицам, как в моделях
+COLUMNS = {
+    "Teacher": ["f_fio", "f_phone", "f_email", "f_comment"],
+    "Student": ["f_fio", "f_email", "f_comment"],
+    "StGroup": ["f_title", "f_comment"],
+}
+
+
+# ===== SEARCH TERMS / ПОИСКОВЫЕ ТЕРМИНЫ =====
+def sample_terms(condb: Connection, table: str, column: str, count: int) -> list:
+    """
+    Fragments of real values, as a user would type them / Фрагменты реальных значений, как их набрал бы пользователь
+
+    Args:
+        condb: Connection handler / Обработчик соединения
+        table: Table name / Имя таблицы
+        column: Column to take values from / Колонка, из которой берутся значения
+        count: Number of terms / Количество терминов
+    """
+    query, params = AdvancedQueryBuilder.select(table, QueryCriteria(columns=[column]), limit=5000)
+    values = [row[column] for row in condb.execute_query(query, params) or () if row[column]]
+    rng = random.Random(42)
+    terms = []
+    for _ in range(count):
+        value = rng.choice(values) if values else "ivan"
+        size = rng.randint(3, min(8, max(3, len(value))))
+        start = rng.randint(0, max(0, len(value) - size))
+        terms.append(value[start : start + size])
+    return terms
+
+
+def main(table: str = "Student", queries: int = 200) -> None:
+    condb = Connection()
+    columns = COLUMNS[table]
+
+    indexed = Schema(condb).ensure_search_index(QueryHandle(), table, columns)
+    terms = sample_terms(condb, table, columns[0], queries)
+    print(f"Search benchmark, {table}, {queries} queries, trigram index: {indexed}")
+
+    # Plan of one query shows whether the index is used / План одного запроса показывает, используется ли индекс
+    query, params = AdvancedQueryBuilder.select(
+        table, QueryCriteria().search(terms[0], columns), limit=200
+    )
+    plan = condb.execute_query("EXPLAIN " + condb.render(query), params) or []
+    print("  plan: " + " | ".join(row["QUERY PLAN"].strip() for row in plan[:6]))
+
+    timings = []
+    for term in terms:
+        query, params = AdvancedQueryBuilder.select(
+            table, QueryCriteria().search(term, columns), limit=200
+        )
+        started = time.perf_counter()
+        condb.execute_query(query, params)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    p50 = timings[len(timings) // 2]
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"  p50 {p50:.1f} ms | p95 {p95:.1f} ms | max {timings[-1]:.1f} ms")
+
+
+# ===== MAIN EXECUTION BLOCK / БЛОК ГЛАВНОГО ВЫПОЛНЕНИЯ =====
+if __name__ == "__main__":
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else "Student",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -4,23 +4,52 @@
 # Standard library imports / Импорты стандартной библиотеки
 import sys
 
-# Local application imports / Импорты локального приложения
-from src.core.Application import Application
-from src.ui.MainWindow import MainWindow
+# Startup profiler goes first, it is the time origin / Профилировщик запуска идёт первым, он - начало отсчёта
+from src.core.StartupProfiler import StartupProfiler
 
 
 # ===== APPLICATION STARTUP / ЗАПУСК ПРИЛОЖЕНИЯ =====
+# The window is shown first; entity controllers are imported on their first mode switch (EntityRegistry)
+# and the database driver with its connections is warmed up in the background after the first paint.
+# --profile-startup prints the time of each phase to stderr.
+# Сначала показывается окно; контроллеры сущностей импортируются при первом переключении на их режим (EntityRegistry),
+# а драйвер БД с соединениями прогревается в фоне после первой отрисовки.
+# --profile-startup выводит время каждой фазы в stderr.
 if __name__ == "__main__":
+    profiler = StartupProfiler()
+    if "--profile-startup" in sys.argv[1:]:
+        profiler.enable()
+
+    # Qt, settings and logging / Qt, настройки и логирование
+    from src.core.Application import Application
+
+    profiler.mark("import Application")
+
     # Create application instance with command line arguments /
     # Создание экземпляра приложения с аргументами командной строки
     app = Application(sys.argv)
+    profiler.mark("Application")
+
+    from PyQt6.QtCore import QTimer
+    from src.ui.MainWindow import MainWindow
+
+    profiler.mark("import MainWindow")
 
     # Create main window instance and configure display /
     # Создание экземпляра главного окна и настройка отображения
     main_window = MainWindow()
+    profiler.mark("MainWindow")
     # Show window in maximized state for better user experience /
     # Отображение окна в развернутом состоянии для лучшего пользовательского опыта
     main_window.showMaximized()
+    profiler.mark("show")
+
+    def window_ready() -> None:
+        """First event loop turn, the window is on screen / Первый проход цикла событий, окно на экране"""
+        profiler.mark("first event loop turn")
+        app.warm_up_database()
+
+    QTimer.singleShot(0, window_ready)
 
     # Start application event loop and capture exit code /
     # Запуск цикла событий приложения и захват кода выхода
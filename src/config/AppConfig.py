@@ -6,8 +6,10 @@
 # ===== IMPORTS / ИМПОРТЫ =====
 import json
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 
 # ===== CONFIGURATION CLASS / КЛАСС КОНФИГУРАЦИИ =====
@@ -18,9 +20,13 @@ class AppConfig:
 
     This class manages application configuration files, directories and settings.
     It implements the Singleton pattern to ensure only one instance exists.
+    Settings files are parsed once and kept in memory; a watcher thread re-reads a file only
+    when its modification time or size changes and notifies subscribers of the new contents.
 
     Этот класс управляет конфигурационными файлами приложения, директориями и настройками.
     Он реализует паттерн Singleton для обеспечения существования только одного экземпляра.
+    Файлы настроек разбираются один раз и хранятся в памяти; поток наблюдения перечитывает файл только
+    при изменении его времени модификации или размера и уведомляет подписчиков о новом содержимом.
     """
 
     # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
@@ -29,6 +35,9 @@ class AppConfig:
         False  # Single initialization flag / Флаг на единственную инициализацию
     )
 
+    # ===== SETTINGS WATCHER / НАБЛЮДЕНИЕ ЗА НАСТРОЙКАМИ =====
+    _DEF_WATCH_INTERVAL = 1.0  # Seconds between file checks / Секунд между проверками файлов
+
     # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
     def __new__(cls):
         """
@@ -103,14 +112,89 @@ class AppConfig:
                 "password": "345627",  # Database password / Пароль базы данных
             }
 
+            # ===== PERFORMANCE CONFIGURATION SETUP / НАСТРОЙКА КОНФИГУРАЦИИ ПРОИЗВОДИТЕЛЬНОСТИ =====
+            # Performance settings file path / Путь к файлу настроек производительности
+            self._SAVE_SET_PERF_FILE = Path(f"{self._SAVE_SET_DIR}/perf_settings.json")
+            # Default performance settings / Настройки производительности по умолчанию
+            self._PERF_DEF_SET = {
+                "pool_min_size": 1,  # Connections kept open while idle / Соединений, держимых открытыми в простое
+                "pool_max_size": 5,  # Upper bound of open connections / Верхняя граница открытых соединений
+                "pool_idle_timeout_s": 300.0,  # Idle extra connection lifetime / Время жизни лишнего простаивающего соединения
+                "pool_checkout_timeout_s": 10.0,  # Wait for a free connection / Ожидание свободного соединения
+                "statement_timeout_ms": 0,  # Server-side query limit, 0 - none / Лимит запроса на сервере, 0 - нет
+                "statement_cache_size": 64,  # Prepared statements per connection / Подготовленных запросов на соединение
+                "fetch_chunk_size": 2000,  # Rows per server-side cursor round trip / Строк за обмен серверного курсора
+                "fetch_first_rows": 100,  # First screenful of a streamed table / Первый экран потоковой таблицы
+                "page_size": 500,  # Rows exposed to the view per fetchMore / Строк, показываемых представлению за fetchMore
+                "search_debounce_ms": 250,  # Pause in typing before a search / Пауза в наборе перед поиском
+                "search_limit": 200,  # Best matches shown by a search / Лучших совпадений, показываемых поиском
+                "result_cache_size": 32,  # Cached query results, 0 - off / Кэшированных результатов запросов, 0 - выкл
+                "result_cache_ttl_s": 60.0,  # Lifetime of a cached result / Время жизни кэшированного результата
+                "result_cache_max_rows": 50000,  # Larger results are not cached / Большие результаты не кэшируются
+                "live_refresh": False,  # Follow edits of other clients via LISTEN/NOTIFY / Следить за правками других клиентов через LISTEN/NOTIFY
+                "live_refresh_batch_ms": 100,  # Changes collected into one patch / Изменения, собираемые в одно обновление
+                "live_refresh_max_rows": 500,  # More changed rows reload the table / При большем числе изменённых строк таблица перезагружается
+                "view_cache_size": 3,  # Mode views kept, current included / Хранимых представлений режимов, включая текущее
+                "view_cache_max_cells": 5000000,  # Loaded cells of hidden views / Загруженных ячеек скрытых представлений
+                "view_cache_idle_s": 600.0,  # Unused hidden views released after, 0 - never / Неиспользуемые скрытые представления освобождаются через, 0 - никогда
+                "log_queue_size": 10000,  # Records waiting for the log writer / Записей в ожидании записи логов
+                "metrics_dump_interval_s": 300.0,  # Seconds between metrics snapshots / Секунд между снимками метрик
+                "stall_threshold_ms": 500,  # GUI stall reported above / Порог сообщения о зависании GUI
+                "tracing": False,  # Record timing spans / Запись временных интервалов
+            }
+            # Allowed type and range of each setting / Допустимые тип и диапазон каждой настройки
+            self._PERF_LIMITS = {
+                "pool_min_size": (int, 0, 100),
+                "pool_max_size": (int, 1, 100),
+                "pool_idle_timeout_s": (float, 1.0, 86400.0),
+                "pool_checkout_timeout_s": (float, 0.1, 600.0),
+                "statement_timeout_ms": (int, 0, 3600000),
+                "statement_cache_size": (int, 0, 10000),
+                "fetch_chunk_size": (int, 1, 1000000),
+                "fetch_first_rows": (int, 1, 100000),
+                "page_size": (int, 1, 1000000),
+                "search_debounce_ms": (int, 0, 5000),
+                "search_limit": (int, 1, 100000),
+                "result_cache_size": (int, 0, 10000),
+                "result_cache_ttl_s": (float, 0.0, 86400.0),
+                "result_cache_max_rows": (int, 0, 10000000),
+                "live_refresh": (bool, None, None),
+                "live_refresh_batch_ms": (int, 0, 10000),
+                "live_refresh_max_rows": (int, 1, 1000000),
+                "view_cache_size": (int, 1, 100),
+                "view_cache_max_cells": (int, 0, 1000000000),
+                "view_cache_idle_s": (float, 0.0, 86400.0),
+                "log_queue_size": (int, 100, 10000000),
+                "metrics_dump_interval_s": (float, 1.0, 86400.0),
+                "stall_threshold_ms": (int, 50, 600000),
+                "tracing": (bool, None, None),
+            }
+            # Problems found by the last validation / Проблемы, найденные последней проверкой
+            self._perf_errors: list[str] = []
+
+            # ===== SETTINGS CACHE / КЭШ НАСТРОЕК =====
+            # Parsed settings and the (mtime, size) they were read at, per file /
+            # Разобранные настройки и (mtime, размер), при которых они прочитаны, для каждого файла
+            self._lock = threading.RLock()
+            self._cache: dict[Path, Any] = {}
+            self._signatures: dict[Path, tuple[int, int] | None] = {}
+            self._subscribers: dict[Path, list[Callable[[Any], None]]] = {}
+            # Files whose contents are checked and completed with defaults / Файлы, содержимое которых проверяется и дополняется значениями по умолчанию
+            self._validators: dict[Path, Callable[[Any], Any]] = {
+                self._SAVE_SET_PERF_FILE: self._validate_perf,
+            }
+            self._watch_thread: threading.Thread | None = None
+            self._watch_stop = threading.Event()
+            self.watch_interval = self._DEF_WATCH_INTERVAL
+
             # ===== FILE AND DIRECTORY INITIALIZATION / ИНИЦИАЛИЗАЦИЯ ФАЙЛОВ И ДИРЕКТОРИЙ =====
             self._init_files()
 
             # ===== RUNTIME CONFIGURATION LOADING / ЗАГРУЗКА КОНФИГУРАЦИИ ВРЕМЕНИ ВЫПОЛНЕНИЯ =====
-            # Load all logging settings from file / Загрузка всех настроек логирования из файла
-            self._LG_ALL_SET = self.load_from_file(self._SAVE_SET_LG_FILE)
-            # Current logging level / Текущий уровень логирования
-            self._LG_LVL = self._LG_ALL_SET["lg_lvl_set"]  # type: ignore # !
+            # Load logging and performance settings into the cache, database settings are read on first connect /
+            # Загрузка настроек логирования и производительности в кэш, настройки БД читаются при первом подключении
+            self.settings(self._SAVE_SET_LG_FILE)
+            self.settings(self._SAVE_SET_PERF_FILE)
 
     # ===== PROPERTY METHODS - LOGGING CONFIGURATION / МЕТОДЫ-СВОЙСТВА - КОНФИГУРАЦИЯ ЛОГИРОВАНИЯ =====
 
@@ -142,7 +226,7 @@ class AppConfig:
         Returns:
             dict: Dictionary containing all logging settings
         """
-        return self._LG_ALL_SET
+        return self.settings(self._SAVE_SET_LG_FILE)
 
     @property
     def lg_lvl(self) -> int | None:
@@ -152,7 +236,8 @@ class AppConfig:
         Returns:
             int: Current logging level value
         """
-        return self._LG_LVL
+        lg_all_set = self.lg_all_set
+        return lg_all_set["lg_lvl_set"] if lg_all_set else None
 
     # ===== PROPERTY METHODS - DATABASE CONFIGURATION / МЕТОДЫ-СВОЙСТВА - КОНФИГУРАЦИЯ БАЗЫ ДАННЫХ =====
 
@@ -166,6 +251,53 @@ class AppConfig:
         """
         return self._SAVE_SET_DB_FILE
 
+    @property
+    def db_settings(self) -> Any:
+        """
+        Get database connection settings / Получить настройки подключения к БД
+
+        Returns:
+            dict: Cached connection parameters for psycopg2.connect
+        """
+        return self.settings(self._SAVE_SET_DB_FILE)
+
+    # ===== PROPERTY METHODS - PERFORMANCE CONFIGURATION / МЕТОДЫ-СВОЙСТВА - КОНФИГУРАЦИЯ ПРОИЗВОДИТЕЛЬНОСТИ =====
+
+    @property
+    def save_set_perf_file(self) -> Path:
+        """
+        Get performance settings file path / Получить путь к файлу настроек производительности
+
+        Returns:
+            Path: Path to the performance settings file
+        """
+        return self._SAVE_SET_PERF_FILE
+
+    @property
+    def perf_settings(self) -> dict:
+        """
+        Get validated performance settings / Получить проверенные настройки производительности
+
+        Every key of the defaults is present, invalid values are replaced by defaults.
+        Read a value at the moment it is used, the dict is replaced when the file changes.
+        Присутствуют все ключи значений по умолчанию, неверные значения заменены значениями по умолчанию.
+        Значение читается в момент использования, словарь заменяется при изменении файла.
+
+        Returns:
+            dict: Performance settings
+        """
+        return self.settings(self._SAVE_SET_PERF_FILE)
+
+    @property
+    def perf_errors(self) -> list[str]:
+        """
+        Get problems found in the performance settings file / Получить проблемы, найденные в файле настроек производительности
+
+        Returns:
+            list[str]: Messages of the last validation, empty if the file is valid
+        """
+        return list(self._perf_errors)
+
     # ===== PRIVATE METHODS - FILE OPERATIONS / ПРИВАТНЫЕ МЕТОДЫ - ОПЕРАЦИИ С ФАЙЛАМИ =====
 
     def _init_files(self) -> None:
@@ -195,6 +327,11 @@ class AppConfig:
             if not self._SAVE_SET_DB_FILE.exists():
                 self.save_to_file(self._SAVE_SET_DB_FILE, self._DB_DEF_SET)
 
+            # ===== PERFORMANCE SETUP / НАСТРОЙКА ПРОИЗВОДИТЕЛЬНОСТИ =====
+            # Create performance settings file with defaults if it doesn't exist / Создание файла настроек производительности со значениями по умолчанию, если он не существует
+            if not self._SAVE_SET_PERF_FILE.exists():
+                self.save_to_file(self._SAVE_SET_PERF_FILE, self._PERF_DEF_SET)
+
         except Exception as e:
             # Set internal error flag to prevent infinite recursion / Установка флага внутренней ошибки для предотвращения бесконечной рекурсии
             self._internal_error_occurred = True
@@ -218,6 +355,220 @@ class AppConfig:
             # Set error flag and return None on failure / Установка флага ошибки и возврат None при неудаче
             self._internal_error_occurred = True
 
+    # ===== PUBLIC METHODS - CACHED SETTINGS / ПУБЛИЧНЫЕ МЕТОДЫ - КЭШИРОВАННЫЕ НАСТРОЙКИ =====
+
+    def settings(self, file_path: Path) -> Any | None:
+        """
+        Get parsed settings of a JSON file from memory / Получение разобранных настроек JSON файла из памяти
+
+        The file is read on the first call only, later changes arrive through reload() or the watcher.
+        Файл читается только при первом вызове, дальнейшие изменения приходят через reload() или наблюдение.
+
+        Args:
+            file_path (Path): Settings file / Файл настроек
+
+        Returns:
+            dict: Cached settings, or None if the file could not be read
+        """
+        file_path = Path(file_path)
+        with self._lock:
+            if file_path in self._cache:
+                return self._cache[file_path]
+            signature = self._signature(file_path)
+            data = self._validated(file_path, self.load_from_file(file_path))
+            self._cache[file_path] = data
+            self._signatures[file_path] = signature
+            return data
+
+    def reload(self, file_path: Path | None = None) -> list[Path]:
+        """
+        Re-read changed settings files and notify subscribers / Перечитывание изменённых файлов настроек и уведомление подписчиков
+
+        A file is read only if its modification time or size differs from the cached read.
+        A file that does not parse (e.g. saved half-way by an editor) keeps its old settings and is retried on the next check.
+
+        Файл читается, только если его время модификации или размер отличаются от кэшированного чтения.
+        Файл, который не разбирается (например, сохранён редактором наполовину), сохраняет старые настройки и проверяется снова.
+
+        Args:
+            file_path (Path, optional): One file, every cached file if None / Один файл, все кэшированные файлы если None
+
+        Returns:
+            list[Path]: Files whose settings changed / Файлы, настройки которых изменились
+        """
+        with self._lock:
+            paths = [Path(file_path)] if file_path is not None else list(self._cache)
+
+        changed = []
+        for path in paths:
+            with self._lock:
+                signature = self._signature(path)
+                if path in self._cache and signature == self._signatures.get(path):
+                    continue
+                data = self.load_from_file(path)
+                if data is None and signature is not None:
+                    # Not parsable yet, retry later / Пока не разбирается, повтор позже
+                    continue
+                data = self._validated(path, data)
+                self._signatures[path] = signature
+                if path in self._cache and data == self._cache[path]:
+                    continue
+                self._cache[path] = data
+                callbacks = list(self._subscribers.get(path, ()))
+            changed.append(path)
+            for callback in callbacks:
+                try:
+                    callback(data)
+                except Exception as e:
+                    # ! Subscriber errors go to the console only / ! Ошибки подписчиков выводятся только в консоль
+                    self._internal_error_occurred = True
+                    print(f"AppConfig internal error: {e}", file=sys.stderr)
+        return changed
+
+    def subscribe(self, file_path: Path, callback: Callable[[Any], None]) -> None:
+        """
+        Call a function with the new settings whenever a file changes / Вызов функции с новыми настройками при каждом изменении файла
+
+        ! Callbacks run on the watcher thread, Qt objects must pass the change on through a signal. /
+        ! Функции вызываются в потоке наблюдения, объекты Qt должны передавать изменение через сигнал.
+
+        Args:
+            file_path (Path): Settings file / Файл настроек
+            callback: Function taking the new settings / Функция, принимающая новые настройки
+        """
+        file_path = Path(file_path)
+        self.settings(file_path)
+        with self._lock:
+            self._subscribers.setdefault(file_path, []).append(callback)
+
+    def unsubscribe(self, file_path: Path, callback: Callable[[Any], None]) -> None:
+        """
+        Stop notifying a function / Прекращение уведомления функции
+
+        Args:
+            file_path (Path): Settings file / Файл настроек
+            callback: Previously subscribed function / Ранее подписанная функция
+        """
+        with self._lock:
+            callbacks = self._subscribers.get(Path(file_path), [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def start_watching(self, interval: float | None = None) -> None:
+        """
+        Start the settings watcher thread / Запуск потока наблюдения за настройками
+
+        Args:
+            interval (float, optional): Seconds between checks / Секунд между проверками
+        """
+        if interval is not None:
+            self.watch_interval = interval
+        if self._watch_thread is not None:
+            return
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop, name="config-watch", daemon=True
+        )
+        self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        """Stop the settings watcher thread / Остановка потока наблюдения за настройками"""
+        self._watch_stop.set()
+        self._watch_thread = None
+
+    # ===== PRIVATE METHODS - SETTINGS WATCHER / ПРИВАТНЫЕ МЕТОДЫ - НАБЛЮДЕНИЕ ЗА НАСТРОЙКАМИ =====
+
+    def _validated(self, file_path: Path, data: Any) -> Any:
+        """
+        Apply the validator of a file, if it has one / Применение проверки файла, если она есть
+
+        Args:
+            file_path (Path): Settings file / Файл настроек
+            data: Parsed contents, None if missing or unreadable / Разобранное содержимое, None если нет или не читается
+
+        Returns:
+            Settings to cache / Настройки для кэширования
+        """
+        validator = self._validators.get(file_path)
+        if validator is None:
+            return data
+        return validator({} if data is None else data)
+
+    def _validate_perf(self, data: Any) -> dict:
+        """
+        Check performance settings against their types and ranges / Проверка настроек производительности по типам и диапазонам
+
+        Missing keys and invalid values fall back to defaults, so consumers can always index every key.
+        Problems are kept in perf_errors and written to the log by the Logger.
+        Отсутствующие ключи и неверные значения заменяются значениями по умолчанию, поэтому потребители всегда
+        могут обращаться к любому ключу. Проблемы сохраняются в perf_errors и записываются в лог логгером.
+
+        Args:
+            data: Parsed perf_settings.json / Разобранный perf_settings.json
+
+        Returns:
+            dict: Complete, valid settings / Полные, верные настройки
+        """
+        errors = []
+        settings = dict(self._PERF_DEF_SET)
+        if not isinstance(data, dict):
+            errors.append("perf settings must be a JSON object, defaults used")
+            data = {}
+
+        for key, value in data.items():
+            if key not in self._PERF_LIMITS:
+                errors.append(f"unknown setting {key!r} ignored")
+                continue
+            kind, low, high = self._PERF_LIMITS[key]
+            if kind is bool:
+                valid = isinstance(value, bool)
+            elif kind is float:
+                valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+            else:
+                valid = isinstance(value, int) and not isinstance(value, bool)
+            if valid and kind is not bool:
+                valid = low <= value <= high
+            if not valid:
+                limits = kind.__name__ if kind is bool else f"{kind.__name__} in [{low}, {high}]"
+                errors.append(
+                    f"{key}={value!r} must be {limits}, default {settings[key]!r} used"
+                )
+                continue
+            settings[key] = kind(value)
+
+        if settings["pool_min_size"] > settings["pool_max_size"]:
+            errors.append(
+                f"pool_min_size={settings['pool_min_size']} is above pool_max_size="
+                f"{settings['pool_max_size']}, pool_max_size used"
+            )
+            settings["pool_min_size"] = settings["pool_max_size"]
+
+        self._perf_errors = errors
+        return settings
+
+    @staticmethod
+    def _signature(file_path: Path) -> tuple[int, int] | None:
+        """
+        Modification time and size of a file / Время модификации и размер файла
+
+        Returns:
+            tuple: (mtime_ns, size), or None if the file does not exist
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _watch_loop(self) -> None:
+        """Watcher thread loop / Цикл потока наблюдения"""
+        while not self._watch_stop.wait(self.watch_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                self._internal_error_occurred = True
+                print(f"AppConfig internal error: {e}", file=sys.stderr)
+
     def save_to_file(
         self, file_path: Path, var: dict, jsonl: bool = False, mode: str = "w"
     ) -> Any | None:
@@ -240,6 +591,9 @@ class AppConfig:
             else:
                 with open(file_path, mode, encoding="utf-8") as f:
                     json.dump(var, f, ensure_ascii=False)
+                # Settings saved by the program take effect at once / Настройки, сохранённые программой, применяются сразу
+                if Path(file_path) in self._cache:
+                    self.reload(file_path)
         except Exception as e:
             # Set error flag on failure / Установка флага ошибки при неудаче
             self._internal_error_occurred = True
@@ -3,7 +3,7 @@
 
 # ===== IMPORTS / ИМПОРТЫ =====
 # Base controller classes for MVC pattern / Базовые классы контроллеров для паттерна MVC
-from src.controllers.base_controller.BaseModel import BaseModel
+from src.controllers.base_controller.ColumnarModel import ColumnarModel
 from src.controllers.base_controller.BaseView import BaseView
 from src.controllers.base_controller.BaseDialog import BaseDialog
 
@@ -12,7 +12,7 @@ from src.core.Logger import Logger
 
 
 # ===== MODEL CLASS / КЛАСС МОДЕЛИ =====
-class Model(BaseModel):
+class Model(ColumnarModel):
     """
     Student model class for data management / Класс модели студента для управления данными
 
@@ -23,6 +23,12 @@ class Model(BaseModel):
     - Database connection management / Управление соединениями с базой данных
     """
 
+    # District-wide table is loaded in chunks through a server-side cursor
+    # into compact columnar storage /
+    # Таблица всего района загружается порциями через серверный курсор
+    # в компактное колоночное хранилище
+    STREAMING = True
+
     # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
     def __init__(self, parent=None):
         """
@@ -23,6 +23,10 @@ class Model(BaseModel):
     - Database connection management / Управление соединениями с базой данных
     """
 
+    # Staff list grows over the years, pages of page_size rows load as the view scrolls /
+    # Список сотрудников растёт с годами, страницы по page_size строк загружаются при прокрутке
+    PAGED = True
+
     # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
     def __init__(self, parent=None):
         """
@@ -16,6 +16,7 @@ from PyQt6.QtWidgets import (
 )
 import re
 from src.core.Logger import Logger
+from src.core.Tracer import Tracer, traced
 
 
 # ===== BASE DIALOG CLASS / БАЗОВЫЙ КЛАСС ДИАЛОГА =====
@@ -34,6 +35,7 @@ class BaseDialog(QDialog):
     """
 
     # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    @traced()
     def __init__(self, window_title: str, fields: list, parent=None):
         """
         Initialize base dialog with dynamic field generation / Инициализация базового диалога с динамической генерацией полей
@@ -158,9 +160,22 @@ class BaseDialog(QDialog):
 
         return value or None
 
+    def exec(self) -> int:
+        """
+        Run the dialog modally, traced from opening to closing / Модальный запуск диалога с трассировкой от открытия до закрытия
+
+        Returns:
+            int: Dialog result / Результат диалога
+        """
+        with Tracer().span("BaseDialog.exec", "ui", title=self.windowTitle()) as span:
+            result = super().exec()
+            span.set(result=result)
+            return result
+
     # ===== SLOT METHODS - EVENT HANDLERS / МЕТОДЫ-СЛОТЫ - ОБРАБОТЧИКИ СОБЫТИЙ =====
 
     @pyqtSlot()
+    @traced()
     def finish(self) -> None:
         """
         Dialog completion handler / Обработчик завершения диалога
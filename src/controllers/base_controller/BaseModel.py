@@ -6,15 +6,11 @@
 from typing import Any
 from PyQt6.QtCore import pyqtSignal, Qt, QModelIndex
 from PyQt6.QtGui import QStandardItemModel, QStandardItem
-from PyQt6.QtWidgets import QMessageBox
-import psycopg2
-from src.core.Logger import Logger
-from src.database.Connection import Connection
-from src.database.queries.QueryBuilder import QueryBuilder
+from src.controllers.base_controller.DatabaseModelMixin import DatabaseModelMixin
 
 
 # ===== BASE MODEL CLASS / БАЗОВЫЙ КЛАСС МОДЕЛИ =====
-class BaseModel(QStandardItemModel):
+class BaseModel(DatabaseModelMixin, QStandardItemModel):
     """
     Base model class for data management / Базовый класс модели для управления данными
     Handles database operations and data validation / Обрабатывает операции с БД и валидацию данных
@@ -22,15 +18,19 @@ class BaseModel(QStandardItemModel):
     This class provides a unified interface for database operations across all entities.
     It extends QStandardItemModel to provide table view functionality with database integration.
     Supports CRUD operations, data validation, and automatic UI updates.
+    Database logic lives in DatabaseModelMixin, this class stores every cell as a QStandardItem.
 
     Этот класс предоставляет унифицированный интерфейс для операций с базой данных для всех сущностей.
     Он расширяет QStandardItemModel для предоставления функциональности представления таблицы с интеграцией базы данных.
     Поддерживает операции CRUD, валидацию данных и автоматические обновления UI.
+    Логика работы с БД находится в DatabaseModelMixin, этот класс хранит каждую ячейку как QStandardItem.
     """
 
     # ===== SIGNALS / СИГНАЛЫ =====
     # Signal emitted when data changes in the model / Сигнал, испускаемый при изменении данных в модели
     data_changed = pyqtSignal()
+    # Signal emitted when a background write fails / Сигнал, испускаемый при ошибке фоновой записи
+    write_failed = pyqtSignal(str)
 
     # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
     def __init__(self, table_name: str, columns: list, parent=None):
@@ -48,299 +48,149 @@ class BaseModel(QStandardItemModel):
             columns (list): List of column names (excluding ID) / Список колонок (без ID)
             parent: Parent object / Родительский объект
         """
-        super().__init__(parent)
-
-        # ===== LOGGER INITIALIZATION / ИНИЦИАЛИЗАЦИЯ ЛОГЕРА =====
-        self.lg = Logger()
-        self.lg.debug("Constructor launched.")
-        self.lg.debug("Logger created.")
-
-        # ===== CONFIGURATION STORAGE / СОХРАНЕНИЕ КОНФИГУРАЦИИ =====
-        # Store table configuration for later use / Сохранение конфигурации таблицы для последующего использования
-        self.table_name = table_name
-        self.column_names = (
-            []
-        )  # Will be populated when loading data / Будет заполнено при загрузке данных
-
-        # ===== SQL QUERY GENERATION / ГЕНЕРАЦИЯ SQL ЗАПРОСОВ =====
-        # Generate all necessary CRUD queries using QueryBuilder / Генерация всех необходимых CRUD запросов с использованием QueryBuilder
-        self.queries = {
-            "select": QueryBuilder.select_all(table_name),
-            "insert": QueryBuilder.insert(table_name, columns),
-            "update": QueryBuilder.update(table_name, columns),
-            "delete": QueryBuilder.delete(table_name),
-        }
-
-        self.lg.debug(f"Generated queries for {table_name}.")
-
-        # ===== DATABASE CONNECTION SETUP / НАСТРОЙКА ПОДКЛЮЧЕНИЯ К БД =====
-        self.condb = Connection()
-
-        # ===== INITIAL DATA LOAD / НАЧАЛЬНАЯ ЗАГРУЗКА ДАННЫХ =====
-        self._initialized = False
-        self.refresh_data()
+        QStandardItemModel.__init__(self, parent)
 
-    # ===== PUBLIC METHODS - DATA OPERATIONS / ПУБЛИЧНЫЕ МЕТОДЫ - ОПЕРАЦИИ С ДАННЫМИ =====
+        # Full model reset happens only on the first load / Полный сброс модели только при первой загрузке
+        self._initialized = False
+        # ID text -> row, None when stale / Текст ID -> строка, None если устарел
+        self._id_index: dict | None = {}
 
-    def refresh_data(self) -> None:
-        """
-        Load data from database into model / Загрузка данных из БД в модель
+        self._setup_model(table_name, columns)
 
-        Retrieves all records from the database table and populates the model.
-        Clears existing data first to ensure consistency.
-        Updates the UI automatically after loading.
+    # ===== LAZY LOADING / ЛЕНИВАЯ ЗАГРУЗКА =====
 
-        Получает все записи из таблицы базы данных и заполняет модель.
-        Сначала очищает существующие данные для обеспечения согласованности.
-        Автоматически обновляет пользовательский интерфейс после загрузки.
-        """
-        try:
-            rows = self.condb.execute_query(self.queries["select"])
-
-            # Полная инициализация только при первом запуске
-            if not self._initialized:
-                self.clear()
-                self.setRowCount(0)
-                self.setColumnCount(0)
-                self._initialized = True
-            else:
-                # При последующих обновлениях очищаем только строки
-                self.removeRows(0, self.rowCount())
-
-            if rows:
-                self.column_names = list(rows[0].keys())
-                columns = self.column_names
-
-                # Настройка колонок только при первой инициализации
-                if self.columnCount() == 0:
-                    self.setColumnCount(len(columns))
-                    self.setHorizontalHeaderLabels(columns)
-
-                # Заполнение данными
-                self.setRowCount(len(rows))
-                for row_idx, row in enumerate(rows):
-                    for col_idx, column_name in enumerate(columns):
-                        cell_value = row[column_name]
-                        item = QStandardItem(
-                            str(cell_value) if cell_value is not None else ""
-                        )
-                        self.setItem(row_idx, col_idx, item)
-
-            self.lg.debug("Refresh data successfully.")
-        except psycopg2.Error as e:
-            # Handle PostgreSQL specific errors / Обработка специфических ошибок PostgreSQL
-            self.lg.error(f"Psycopg2 internal error: {e}.")
-        except Exception as e:
-            # Handle general exceptions / Обработка общих исключений
-            self.lg.critical(f"Internal error: {e}.")
-
-    def add(self, *args: Any | None) -> bool:
-        """
-        Add new record to database / Добавление новой записи в БД
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Check if paged mode has more pages / Проверка, есть ли в постраничном режиме ещё страницы"""
+        return not parent.isValid() and self.can_fetch_page()
 
-        Inserts a new record with the provided data into the database table.
-        Automatically refreshes the model after successful insertion.
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Load the next page, called by the view at the end of the table / Загрузка следующей страницы, вызывается представлением в конце таблицы"""
+        if not parent.isValid():
+            self.fetch_next_page()
 
-        Вставляет новую запись с предоставленными данными в таблицу базы данных.
-        Автоматически обновляет модель после успешной вставки.
+    # ===== STORAGE PRIMITIVES / ПРИМИТИВЫ ХРАНЕНИЯ =====
 
-        ! May throw error if no data entered! / ! Может выдавать ошибку если не ввести данные!!!
+    def _reset_rows(self, columns: list) -> None:
+        """
+        Remove all rows and set up columns / Удаление всех строк и настройка колонок
 
         Args:
-            *args: Variable number of arguments matching table columns / Переменное количество аргументов, соответствующих столбцам таблицы
-
-        Returns:
-            bool: True if successful, False otherwise / True при успехе, False в противном случае
+            columns: Column names, empty if unknown / Имена колонок, пустой список если неизвестны
         """
-        try:
-            self.lg.debug(f"Add method received args: {args}")
-            self.lg.debug(f"Table columns: {self.column_names}")
-            self.lg.debug(f"Insert query: {self.queries['insert']}")
-
-            # Establish connection and execute INSERT query / Установка соединения и выполнение INSERT запроса
-            self.condb.connect_to_db()
-            self.condb.execute_query(self.queries["insert"], args)
-            # Refresh model to show new data / Обновление модели для отображения новых данных
-            self.refresh_data()
-            self.condb.close_connection()
-
-            self.lg.debug("Add data successfully.")
-            return True
-        except Exception as e:
-            self.lg.critical(f"Internal error: {e}.")
-            return False
-
-    def delete_record(self, record_id: int | str) -> bool:
+        # Полная инициализация только при первом запуске
+        if not self._initialized:
+            self.clear()
+            self.setRowCount(0)
+            self.setColumnCount(0)
+            self._initialized = True
+        else:
+            # При последующих обновлениях очищаем только строки
+            self.removeRows(0, self.rowCount())
+        self._id_index = {}
+
+        if columns:
+            self.column_names = columns
+
+            # Настройка колонок только при первой инициализации
+            if self.columnCount() == 0:
+                self.setColumnCount(len(columns))
+                self.setHorizontalHeaderLabels(columns)
+
+    def _append_rows(self, rows: list) -> None:
         """
-        Delete record from database / Удаление записи из БД
+        Append rows to the end of the model / Добавление строк в конец модели
 
-        Removes a record with the specified ID from the database table.
-        Automatically refreshes the model after successful deletion.
+        Args:
+            rows: Rows as tuples in column order / Строки в виде кортежей в порядке колонок
+        """
+        # Заполнение данными
+        if self._id_index is not None:
+            first = self.rowCount()
+            for offset, row in enumerate(rows):
+                self._id_index["" if row[0] is None else str(row[0])] = first + offset
+        for row in rows:
+            self.appendRow(
+                [
+                    QStandardItem(str(cell_value) if cell_value is not None else "")
+                    for cell_value in row
+                ]
+            )
 
-        Удаляет запись с указанным ID из таблицы базы данных.
-        Автоматически обновляет модель после успешного удаления.
+    def _store_cell(self, index: QModelIndex, value: Any) -> bool:
+        """
+        Store a cell value without touching the database / Сохранение значения ячейки без обращения к БД
 
         Args:
-            record_id: ID of the record to delete / ID записи для удаления
+            index: Model index of the cell / Индекс модели ячейки
+            value: New value / Новое значение
 
         Returns:
-            bool: True if successful, False otherwise / True при успехе, False в противном случае
-        """
-        try:
-            # Establish connection and execute DELETE query / Установка соединения и выполнение DELETE запроса
-            self.condb.connect_to_db()
-            self.condb.execute_query(self.queries["delete"], (record_id,))
-            # Refresh model to reflect deletion / Обновление модели для отражения удаления
-            self.refresh_data()
-            self.condb.close_connection()
-
-            self.lg.debug("Delete data successfully.")
-            return True
-        except Exception as e:
-            self.lg.critical(f"Internal error: {e}.")
-            return False
-
-    # ===== OVERRIDE METHODS - EDITING OPERATIONS / ПЕРЕОПРЕДЕЛЕННЫЕ МЕТОДЫ - ОПЕРАЦИИ РЕДАКТИРОВАНИЯ =====
-
-    def flags(self, index: QModelIndex):
+            bool: True if stored / True если сохранено
         """
-        Determine which cells can be edited / Определяет какие ячейки можно редактировать
-
-        Controls the editing behavior of individual cells in the table view.
-        ID column (first column) is read-only, other columns are editable.
+        return QStandardItemModel.setData(self, index, value, Qt.ItemDataRole.EditRole)
 
-        Управляет поведением редактирования отдельных ячеек в представлении таблицы.
-        Столбец ID (первый столбец) только для чтения, остальные столбцы редактируемы.
+    def _store_value(self, row: int, column: int, value: Any) -> bool:
+        """
+        Store a value by position / Сохранение значения по позиции
 
         Args:
-            index: Model index of the cell / Индекс модели ячейки
+            row: Row number / Номер строки
+            column: Column number / Номер колонки
+            value: New value / Новое значение
 
         Returns:
-            Qt.ItemFlag: Flags determining cell behavior / Флаги, определяющие поведение ячейки
+            bool: True if stored / True если сохранено
         """
-        try:
-            if not index.isValid():
-                return Qt.ItemFlag.NoItemFlags
-
-            # ID column cannot be edited (assuming it's the first column) / ID колонку нельзя редактировать (предполагаем что это первая колонка)
-            if index.column() == 0:
-                return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-
-            # Other columns can be edited / Остальные колонки можно редактировать
-            return (
-                Qt.ItemFlag.ItemIsEnabled
-                | Qt.ItemFlag.ItemIsSelectable
-                | Qt.ItemFlag.ItemIsEditable
-            )
-        except Exception as e:
-            self.lg.error(f"Internal error: {e}.")
-            return Qt.ItemFlag.NoItemFlags
+        return self._store_cell(self.index(row, column), value)
 
-    def setData(
-        self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole
-    ) -> bool:
+    def record_id(self, row: int) -> str | None:
         """
-        Handle cell data changes / Обработка изменения данных в ячейке
+        ID of the record shown in a row / ID записи, показанной в строке
 
-        Processes user edits in table cells and updates the corresponding database record.
-        Validates the index and value before executing the update query.
-        Emits data_changed signal on successful update.
+        Args:
+            row: Row number / Номер строки
+
+        Returns:
+            str | None: Record ID from the first column, None if missing / ID записи из первой колонки, None если нет
+        """
+        id_item = self.item(row, 0)
+        return id_item.text() if id_item else None
 
-        Обрабатывает пользовательские правки в ячейках таблицы и обновляет соответствующую запись базы данных.
-        Проверяет индекс и значение перед выполнением запроса обновления.
-        Испускает сигнал data_changed при успешном обновлении.
+    def cell_text(self, row: int, column: int) -> str:
+        """
+        Text of a cell as shown in the view / Текст ячейки, как он показан в представлении
 
         Args:
-            index: Model index of the edited cell / Индекс модели редактируемой ячейки
-            value: New value for the cell / Новое значение для ячейки
-            role: Data role (usually EditRole) / Роль данных (обычно EditRole)
+            row: Row number / Номер строки
+            column: Column number / Номер колонки
 
         Returns:
-            bool: True if update successful, False otherwise / True если обновление успешно, False в противном случае
+            str: Cell text, empty string if missing / Текст ячейки, пустая строка если нет
         """
-        # Only process edit role changes on valid indices / Обрабатывать только изменения роли редактирования для действительных индексов
-        if role != Qt.ItemDataRole.EditRole or not index.isValid():
-            return False
-
-        try:
-            # Clean and validate new value / Очистка и валидация нового значения
-            new_value = str(value).strip()
-            column_name = self.column_names[index.column()]
-
-            if not self._validate_data(column_name, new_value):
-                return False
-
-            # Get record ID from first column / Получаем ID записи (первая колонка)
-            id_item = self.item(index.row(), 0)
-            if not id_item:
-                self.lg.error(f"{self.table_name} Model: no id item in setData.")
-                return False
-
-            record_id = id_item.text()
-
-            # Collect all row data for update query / Сбор всех данных строки для запроса обновления
-            row_data = []
-            for col_idx in range(
-                1, self.columnCount()
-            ):  # Skip ID column (column 0) / Пропускаем ID (колонка 0)
-                if col_idx == index.column():
-                    row_data.append(
-                        new_value
-                    )  # Use new value / Используем новое значение
-                else:
-                    item = self.item(index.row(), col_idx)
-                    row_data.append(item.text() if item else "")
-
-            # Execute database update / Выполнение обновления базы данных
-            self.condb.connect_to_db()
-            self.condb.execute_query(self.queries["update"], (*row_data, record_id))
-            self.condb.close_connection()
-
-            # Update model and emit signal / Обновление модели и испускание сигнала
-            result = super().setData(index, value, role)
-            if result:
-                self.data_changed.emit()
-                self.lg.debug(
-                    f"{self.table_name} Model: updated {column_name} for record {record_id}."
-                )
-
-            return result
-
-        except Exception as e:
-            self.lg.critical(f"Internal error: {e}.")
-            # Show user-friendly error message / Показать удобное для пользователя сообщение об ошибке
-            QMessageBox.warning(
-                None, "Update error", f"Record could not be updated: {str(e)}"
-            )
-            return False
+        item = self.item(row, column)
+        return item.text() if item else ""
 
-    def _validate_data(self, column_name: str, value: str) -> bool:
+    def row_of(self, record_id) -> int | None:
         """
-        Базовая валидация данных
-        Переопределяется в наследниках для специфичной валидации
+        Row that holds a record / Строка, в которой находится запись
 
         Args:
-            column_name: Имя колонки
-            value: Значение для валидации
+            record_id: Record ID as int or text / ID записи числом или текстом
 
         Returns:
-            bool: True если валидация прошла успешно
+            int | None: Row number, None if the record is not loaded / Номер строки, None если запись не загружена
+        """
+        if self._id_index is None:
+            self._id_index = {self.record_id(row): row for row in range(self.rowCount())}
+        return self._id_index.get(str(record_id))
+
+    def _remove_row(self, row: int) -> None:
+        """
+        Remove one row from the model / Удаление одной строки из модели
+
+        Args:
+            row: Row number / Номер строки
         """
-        try:
-            # Проверка на пустоту нового значения колонки, для обязательно заполненных полей
-            if not value and column_name in ["f_fio", "f_title"]:
-                self.lg.debug(
-                    f"Input FIO or Title in field {column_name}, this is necessary!"
-                )
-                QMessageBox.warning(
-                    None,
-                    "Input necessary fields!!!",
-                    f"Field {column_name} necessary to input!!!",
-                )
-                return False
-
-            self.lg.debug("Validation success.")
-            return True
-        except Exception as e:
-            self.lg.critical(f"Internal error: {e}.")
-            return False
+        self.removeRow(row)
+        # Rows below have shifted up / Строки ниже сдвинулись вверх
+        self._id_index = None
@@ -3,10 +3,17 @@
 # Универсальный класс представления таблицы для отображения данных базы данных
 
 # ===== IMPORTS / ИМПОРТЫ =====
-from PyQt6.QtCore import pyqtSlot, Qt
+from PyQt6.QtCore import pyqtSlot, Qt, QModelIndex
 from PyQt6.QtGui import QShortcut, QKeySequence
-from PyQt6.QtWidgets import QTableView, QMessageBox, QHeaderView
+from PyQt6.QtWidgets import (
+    QTableView,
+    QMessageBox,
+    QHeaderView,
+    QFileDialog,
+    QProgressDialog,
+)
 from src.core.Logger import Logger
+from src.core.Tracer import traced
 
 
 # ===== BASE VIEW CLASS / БАЗОВЫЙ КЛАСС ПРЕДСТАВЛЕНИЯ =====
@@ -67,11 +74,27 @@ class BaseView(QTableView):
 
         # ===== SIGNAL CONNECTIONS / ПОДКЛЮЧЕНИЕ СИГНАЛОВ =====
         self._model.data_changed.connect(self.on_data_changed)
+        self._model.write_failed.connect(self.on_write_failed)
+        # Next rows are requested one screen before the end / Следующие строки запрашиваются за один экран до конца
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+        # ===== BACKGROUND DELETE STATE / СОСТОЯНИЕ ФОНОВЫХ УДАЛЕНИЙ =====
+        # Queued single deletes: handle -> record name / Поставленные удаления: дескриптор -> имя записи
+        self._pending_deletes = {}
+
+        # ===== BACKGROUND IMPORT STATE / СОСТОЯНИЕ ФОНОВОГО ИМПОРТА =====
+        self._import_handle = None
+        self._import_progress = None
+
+        # ===== BACKGROUND EXPORT STATE / СОСТОЯНИЕ ФОНОВОГО ЭКСПОРТА =====
+        self._export_handle = None
+        self._export_progress = None
 
         self.lg.debug("Setup shortcuts and view completed successfully.")
 
     # ===== PRIVATE METHODS - UI SETUP / ПРИВАТНЫЕ МЕТОДЫ - НАСТРОЙКА UI =====
 
+    @traced()
     def setup_table_view(self) -> None:
         """
         Table appearance configuration / Настройка внешнего вида таблицы
@@ -102,9 +125,13 @@ class BaseView(QTableView):
             self.setEditTriggers(QTableView.EditTrigger.DoubleClicked)
 
             # ===== SORTING AND DISPLAY / СОРТИРОВКА И ОТОБРАЖЕНИЕ =====
-            # Enable column sorting / Включить сортировку колонок
-            self.setSortingEnabled(True)
-            self.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+            # Header clicks sort on the server, see DatabaseModelMixin.sort; enabling sorts by the indicator,
+            # which starts the model's deferred first load in this order /
+            # Клики по заголовку сортируют на сервере, см. DatabaseModelMixin.sort; включение сортирует по индикатору,
+            # что запускает отложенную первую загрузку модели в этом порядке
+            if not self.isSortingEnabled():
+                self.horizontalHeader().setSortIndicator(1, Qt.SortOrder.DescendingOrder)
+                self.setSortingEnabled(True)
             # Hide ID column (first column) from user view / Скрыть ID колонку (первая колонка) от пользователя
             self.hideColumn(0)
 
@@ -116,8 +143,9 @@ class BaseView(QTableView):
 
             self.lg.debug("Table setup successfully.")
         except Exception as e:
-            self.lg.critical(f"Internal error: {e}.")
+            self.lg.critical("Internal error: %s.", e)
 
+    @traced()
     def setup_shortcuts(self) -> None:
         """
         Keyboard shortcuts configuration / Настройка горячих клавиш
@@ -154,7 +182,7 @@ class BaseView(QTableView):
 
             self.lg.debug("Shortcuts setup successfully.")
         except Exception as e:
-            self.lg.error(f"Internal error: {e}.")
+            self.lg.error("Internal error: %s.", e)
 
     # ===== PUBLIC METHODS - CRUD OPERATIONS / ПУБЛИЧНЫЕ МЕТОДЫ - ОПЕРАЦИИ CRUD =====
 
@@ -198,6 +226,7 @@ class BaseView(QTableView):
             "• Ctrl+A - select all",
         )
 
+    @traced()
     def delete(self) -> None:
         """
         Delete single selected record / Удаление выбранной записи
@@ -222,18 +251,15 @@ class BaseView(QTableView):
             selected_row = selection[0].row()
 
             # Get record ID from first column / Получаем ID записи (первая колонка)
-            id_item = self.model().item(selected_row, 0)
-            if not id_item:
+            record_id = self.model().record_id(selected_row)
+            if record_id is None:
                 QMessageBox.warning(self, "Error", "Record ID could not be retrieved")
                 return
 
-            record_id = id_item.text()
-
             # Get main field for confirmation dialog / Получаем основное поле для диалога подтверждения
-            main_field_item = self.model().item(
-                selected_row, 1
+            main_field_value = (
+                self.model().cell_text(selected_row, 1) or "Unknown"
             )  # Second column / Вторая колонка
-            main_field_value = main_field_item.text() if main_field_item else "Unknown"
 
             # ===== CONFIRMATION DIALOG / ДИАЛОГ ПОДТВЕРЖДЕНИЯ =====
             reply = QMessageBox.question(
@@ -248,14 +274,15 @@ class BaseView(QTableView):
             )
 
             # ===== DELETION EXECUTION / ВЫПОЛНЕНИЕ УДАЛЕНИЯ =====
+            # Result is reported when the background delete commits /
+            # Результат сообщается, когда фоновое удаление зафиксировано
             if reply == QMessageBox.StandardButton.Yes:
-                if self.model().delete_record(record_id):
-                    QMessageBox.information(
-                        self,
-                        "Deletion",
-                        f"Record '{main_field_value}' successfully deleted",
-                    )
-                    self.lg.debug(f"BaseView Successfully deleted record {record_id}")
+                handle = self.model().delete_record(record_id)
+                if handle is not None:
+                    handle.finished.connect(self._on_delete_finished)
+                    handle.failed.connect(self._on_delete_failed)
+                    self._pending_deletes[handle] = main_field_value
+                    self.lg.debug("BaseView queued delete of record %s", record_id)
                 else:
                     QMessageBox.critical(
                         self,
@@ -264,19 +291,20 @@ class BaseView(QTableView):
                         "Check the log for details.",
                     )
         except Exception as e:
-            self.lg.error(f"BaseView internal error: {e}. In DEF delete().")
+            self.lg.error("BaseView internal error: %s. In DEF delete().", e)
 
+    @traced()
     def delete_selected(self) -> None:
         """
         Delete all selected records / Удаление всех выбранных записей
 
         Allows bulk deletion of multiple selected records with confirmation.
+        All records are deleted by one DELETE in one transaction and the view is updated once.
         Provides detailed feedback on the number of successfully and unsuccessfully deleted records.
-        Processes deletions in reverse order to maintain index consistency.
 
         Позволяет массовое удаление нескольких выбранных записей с подтверждением.
+        Все записи удаляются одним DELETE в одной транзакции, представление обновляется один раз.
         Предоставляет подробную обратную связь о количестве успешно и неуспешно удаленных записей.
-        Обрабатывает удаления в обратном порядке для поддержания согласованности индексов.
         """
         try:
             # ===== SELECTION VALIDATION / ПРОВЕРКА ВЫБОРА =====
@@ -299,40 +327,321 @@ class BaseView(QTableView):
 
             # ===== BULK DELETION EXECUTION / ВЫПОЛНЕНИЕ МАССОВОГО УДАЛЕНИЯ =====
             if reply == QMessageBox.StandardButton.Yes:
-                deleted_count = 0
-                failed_count = 0
+                record_ids = [
+                    record_id
+                    for index in selection
+                    if (record_id := self.model().record_id(index.row())) is not None
+                ]
+
+                handle = self.model().delete_records(record_ids)
+                if handle is not None:
+                    handle.finished.connect(self._on_batch_delete_finished)
+                    handle.failed.connect(self._on_batch_delete_failed)
+                    self.lg.debug("BaseView queued delete of %s records", len(record_ids))
+                else:
+                    self._report_batch_delete(0, {}, count)
+        except Exception as e:
+            self.lg.error("BaseView delete_selected error: %s", e)
+
+    def import_data(self) -> None:
+        """
+        Bulk import records from a CSV/XLSX file / Массовый импорт записей из CSV/XLSX файла
+
+        The file is loaded in the background while a progress dialog shows the rows read.
+        Cancelling rolls the import back. Rejected rows are saved next to the file.
 
-                # Sort indices in descending order to prevent index shifting during deletion
-                # Сортируем индексы по убыванию, чтобы удаление не сбивало нумерацию
-                sorted_selection = sorted(
-                    selection, key=lambda x: x.row(), reverse=True
+        Файл загружается в фоне, пока диалог прогресса показывает прочитанные строки.
+        Отмена откатывает импорт. Отклонённые строки сохраняются рядом с файлом.
+        """
+        try:
+            if self._import_handle is not None:
+                QMessageBox.information(self, "Import", "Import is already running")
+                return
+
+            path, _ = QFileDialog.getOpenFileName(
+                self,
+                "Import",
+                "",
+                "Tables (*.csv *.txt *.xlsx);;CSV (*.csv *.txt);;Excel (*.xlsx)",
+            )
+            if not path:
+                return
+
+            handle = self.model().import_file(path)
+            if handle is None:
+                QMessageBox.critical(
+                    self, "Error", "Import could not be started.\nCheck the log for details."
                 )
+                return
 
-                for index in sorted_selection:
-                    row = index.row()
-                    id_item = self.model().item(row, 0)
-
-                    if id_item:
-                        record_id = id_item.text()
-                        if self.model().delete_record(record_id):
-                            deleted_count += 1
-                        else:
-                            failed_count += 1
-
-                # ===== RESULTS REPORTING / ОТЧЕТ О РЕЗУЛЬТАТАХ =====
-                message = f"Deleted entries: {deleted_count}"
-                if failed_count > 0:
-                    message += f"\nFailed to delete: {failed_count}"
-                    QMessageBox.warning(self, "Deletion result", message)
-                else:
-                    QMessageBox.information(self, "Deletion result", message)
+            # ===== PROGRESS DIALOG / ДИАЛОГ ПРОГРЕССА =====
+            # Total is unknown while streaming, range 0..0 shows a busy bar /
+            # Общее число неизвестно при потоковом чтении, диапазон 0..0 показывает занятость
+            progress = QProgressDialog("Reading rows...", "Cancel", 0, 0, self)
+            progress.setWindowTitle("Import")
+            progress.setMinimumDuration(0)
+            progress.canceled.connect(handle.cancel)
+
+            handle.progress.connect(self._on_import_progress)
+            handle.finished.connect(self._on_import_finished)
+            handle.failed.connect(self._on_import_failed)
+            handle.cancelled.connect(self._on_import_cancelled)
+            self._import_handle = handle
+            self._import_progress = progress
+            progress.show()
+            self.lg.debug("BaseView queued import of %s", path)
+        except Exception as e:
+            self.lg.error("BaseView import_data error: %s", e)
+
+    def export_data(self) -> None:
+        """
+        Export the whole table to CSV/JSONL / Экспорт всей таблицы в CSV/JSONL
+
+        Rows are streamed from the database straight to disk in the background,
+        memory use does not depend on table size. A .gz name writes gzip.
+
+        Строки передаются из базы данных прямо на диск в фоне,
+        расход памяти не зависит от размера таблицы. Имя .gz записывает gzip.
+        """
+        try:
+            if self._export_handle is not None:
+                QMessageBox.information(self, "Export", "Export is already running")
+                return
+
+            path, selected_filter = QFileDialog.getSaveFileName(
+                self,
+                "Export",
+                f"{self.model().table_name}.csv",
+                "CSV (*.csv);;CSV gzip (*.csv.gz);;JSON Lines (*.jsonl);;JSON Lines gzip (*.jsonl.gz)",
+            )
+            if not path:
+                return
+
+            # Add the extension of the chosen filter if missing / Добавление расширения выбранного фильтра, если его нет
+            if not path.lower().endswith((".csv", ".jsonl", ".json", ".gz")):
+                path += selected_filter[selected_filter.find("*") + 1 : -1]
 
-                self.lg.debug(
-                    f"BaseView: Multiple delete - success: {deleted_count}, failed: {failed_count}"
+            handle = self.model().export_file(path)
+            if handle is None:
+                QMessageBox.critical(
+                    self, "Error", "Export could not be started.\nCheck the log for details."
                 )
+                return
+
+            # ===== PROGRESS DIALOG / ДИАЛОГ ПРОГРЕССА =====
+            progress = QProgressDialog("Writing rows...", "Cancel", 0, 0, self)
+            progress.setWindowTitle("Export")
+            progress.setMinimumDuration(0)
+            progress.canceled.connect(handle.cancel)
+
+            handle.progress.connect(self._on_export_progress)
+            handle.finished.connect(self._on_export_finished)
+            handle.failed.connect(self._on_export_failed)
+            handle.cancelled.connect(self._on_export_cancelled)
+            self._export_handle = handle
+            self._export_progress = progress
+            progress.show()
+            self.lg.debug("BaseView queued export to %s", path)
         except Exception as e:
-            self.lg.error(f"BaseView delete_selected error: {e}")
+            self.lg.error("BaseView export_data error: %s", e)
+
+    # ===== SLOT METHODS - BACKGROUND RESULTS / МЕТОДЫ-СЛОТЫ - РЕЗУЛЬТАТЫ ФОНОВЫХ ОПЕРАЦИЙ =====
+
+    @pyqtSlot(int)
+    def _on_export_progress(self, bytes_written: int) -> None:
+        """Show data written by the export / Показ данных, записанных экспортом"""
+        if self._export_progress is not None:
+            self._export_progress.setLabelText(
+                f"Written: {bytes_written / (1024 * 1024):.1f} MB"
+            )
+
+    def _close_export(self) -> None:
+        """Forget the finished export and close its dialog / Забыть завершённый экспорт и закрыть его диалог"""
+        self._export_handle = None
+        if self._export_progress is not None:
+            # Closing must not count as a cancel / Закрытие не должно считаться отменой
+            self._export_progress.canceled.disconnect()
+            self._export_progress.close()
+            self._export_progress = None
+
+    @pyqtSlot(object)
+    def _on_export_finished(self, stats: dict) -> None:
+        """Show export statistics / Показ статистики экспорта"""
+        self._close_export()
+        QMessageBox.information(
+            self,
+            "Export result",
+            f"Exported rows: {stats['rows']}\n"
+            f"File size: {stats['file_bytes'] / (1024 * 1024):.1f} MB\n"
+            f"Time: {stats['seconds']} s ({stats['rows_per_s']} rows/s)\n\n"
+            f"{stats['path']}",
+        )
+
+    @pyqtSlot(str)
+    def _on_export_failed(self, message: str) -> None:
+        """Report a failed export / Сообщение о неудачном экспорте"""
+        self._close_export()
+        QMessageBox.critical(
+            self,
+            "Export result",
+            f"Export failed:\n{message}\n\nCheck the log for details.",
+        )
+
+    @pyqtSlot()
+    def _on_export_cancelled(self) -> None:
+        """Report a cancelled export / Сообщение об отменённом экспорте"""
+        self._close_export()
+        QMessageBox.information(self, "Export result", "Export cancelled.")
+
+    @pyqtSlot(int)
+    def _on_import_progress(self, rows_read: int) -> None:
+        """Show rows read by the import / Показ строк, прочитанных импортом"""
+        if self._import_progress is not None:
+            self._import_progress.setLabelText(f"Rows read: {rows_read}")
+
+    def _close_import(self) -> None:
+        """Forget the finished import and close its dialog / Забыть завершённый импорт и закрыть его диалог"""
+        self._import_handle = None
+        if self._import_progress is not None:
+            # Closing must not count as a cancel / Закрытие не должно считаться отменой
+            self._import_progress.canceled.disconnect()
+            self._import_progress.close()
+            self._import_progress = None
+
+    @pyqtSlot(object)
+    def _on_import_finished(self, stats: dict) -> None:
+        """Show import statistics / Показ статистики импорта"""
+        self._close_import()
+        message = (
+            f"Rows read: {stats['read']}\n"
+            f"Inserted: {stats['inserted']}\n"
+            f"Skipped duplicates: {stats['loaded'] - stats['inserted']}\n"
+            f"Rejected: {stats['rejected']}\n"
+            f"Time: {stats['seconds']} s ({stats['rows_per_s']} rows/s)"
+        )
+        if stats["reject_path"]:
+            message += f"\n\nRejected rows saved to:\n{stats['reject_path']}"
+            QMessageBox.warning(self, "Import result", message)
+        else:
+            QMessageBox.information(self, "Import result", message)
+
+    @pyqtSlot(str)
+    def _on_import_failed(self, message: str) -> None:
+        """Report a failed import, nothing was imported / Сообщение о неудачном импорте, ничего не импортировано"""
+        self._close_import()
+        QMessageBox.critical(
+            self,
+            "Import result",
+            f"Nothing was imported:\n{message}\n\nCheck the log for details.",
+        )
+
+    @pyqtSlot()
+    def _on_import_cancelled(self) -> None:
+        """Report a cancelled import / Сообщение об отменённом импорте"""
+        self._close_import()
+        QMessageBox.information(
+            self, "Import result", "Import cancelled, nothing was imported."
+        )
+
+    @pyqtSlot(object)
+    def _on_delete_finished(self, _result) -> None:
+        """Report a committed single delete / Сообщение о зафиксированном удалении записи"""
+        main_field_value = self._pending_deletes.pop(self.sender(), "Unknown")
+        QMessageBox.information(
+            self,
+            "Deletion",
+            f"Record '{main_field_value}' successfully deleted",
+        )
+        self.lg.debug("BaseView Successfully deleted record")
+
+    @pyqtSlot(str)
+    def _on_delete_failed(self, _message: str) -> None:
+        """Forget a failed single delete, the error is shown by on_write_failed / Забыть неудачное удаление, ошибку показывает on_write_failed"""
+        self._pending_deletes.pop(self.sender(), None)
+
+    @pyqtSlot(object)
+    def _on_batch_delete_finished(self, result: dict) -> None:
+        """Report a committed bulk delete / Сообщение о зафиксированном массовом удалении"""
+        # Rows already deleted elsewhere count as deleted / Строки, уже удалённые в другом месте, считаются удалёнными
+        deleted = len(result["deleted"]) + len(result["missing"])
+        self._report_batch_delete(deleted, result["failed"])
+
+    @pyqtSlot(str)
+    def _on_batch_delete_failed(self, message: str) -> None:
+        """Report a bulk delete whose transaction failed / Сообщение о массовом удалении с неудавшейся транзакцией"""
+        QMessageBox.critical(
+            self,
+            "Deletion result",
+            f"No entries were deleted:\n{message}\n\nCheck the log for details.",
+        )
+
+    def _report_batch_delete(
+        self, deleted: int, failed: dict, not_queued: int = 0
+    ) -> None:
+        """
+        Show bulk delete result / Показ результата массового удаления
+
+        Args:
+            deleted: Number of deleted records / Количество удалённых записей
+            failed: Records that could not be deleted: id -> error / Записи, которые не удалось удалить: id -> ошибка
+            not_queued: Number of records whose delete could not be queued / Количество записей, удаление которых не удалось поставить
+        """
+        # ===== RESULTS REPORTING / ОТЧЕТ О РЕЗУЛЬТАТАХ =====
+        failed_count = len(failed) + not_queued
+        message = f"Deleted entries: {deleted}"
+        if failed_count > 0:
+            message += f"\nFailed to delete: {failed_count}"
+            # First few reasons are enough / Достаточно первых нескольких причин
+            for record_id, error in list(failed.items())[:5]:
+                message += f"\n• ID {record_id}: {error.splitlines()[0]}"
+            QMessageBox.warning(self, "Deletion result", message)
+        else:
+            QMessageBox.information(self, "Deletion result", message)
+
+        self.lg.debug(
+            "BaseView: Multiple delete - success: %s, failed: %s", deleted, failed_count
+        )
+
+    @pyqtSlot(str)
+    def on_write_failed(self, message: str) -> None:
+        """
+        Show error of a failed background write / Показ ошибки неудавшейся фоновой записи
+
+        Args:
+            message: Error message / Сообщение об ошибке
+        """
+        # Bulk delete reports through its own handle, see _on_batch_delete_failed /
+        # Массовое удаление сообщает через свой дескриптор, см. _on_batch_delete_failed
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"The operation could not be completed:\n{message}\n\n"
+            "Check the log for details.",
+        )
+
+    @pyqtSlot(int)
+    def _on_scrolled(self, value: int) -> None:
+        """
+        Prefetch rows when the view nears the end / Предзагрузка строк при приближении представления к концу
+
+        Qt itself asks for more rows only at the very bottom, this starts a page load a screen earlier.
+        Qt сам запрашивает строки только в самом низу, здесь загрузка страницы начинается на экран раньше.
+
+        Args:
+            value: Scroll bar position / Позиция полосы прокрутки
+        """
+        bar = self.verticalScrollBar()
+        if value >= bar.maximum() - bar.pageStep() and self._model.canFetchMore(QModelIndex()):
+            self._model.fetchMore(QModelIndex())
+
+    def cancel_pending(self) -> None:
+        """
+        Cancel running refresh of the model, used when the view is released /
+        Отмена выполняющегося обновления модели, используется при освобождении представления
+        """
+        self._model.cancel_pending()
 
+    @traced()
     def on_data_changed(self):
         """Обрабатывает изменения данных в таблице и применяет новые настройки при изменении"""
         self.resizeColumnsToContents()
@@ -0,0 +1,321 @@
+# ===== COLUMNAR MODEL CLASS FOR LARGE TABLES / КЛАСС КОЛОНОЧНОЙ МОДЕЛИ ДЛЯ БОЛЬШИХ ТАБЛИЦ =====
+# Lazy table model backed by compact per-column arrays
+# Ленивая модель таблицы на основе компактных массивов по колонкам
+
+# ===== IMPORTS / ИМПОРТЫ =====
+import sys
+from array import array
+from typing import Any
+from PyQt6.QtCore import pyqtSignal, Qt, QModelIndex, QAbstractTableModel
+from src.controllers.base_controller.DatabaseModelMixin import DatabaseModelMixin
+
+
+# ===== COLUMNAR MODEL CLASS / КЛАСС КОЛОНОЧНОЙ МОДЕЛИ =====
+class ColumnarModel(DatabaseModelMixin, QAbstractTableModel):
+    """
+    Columnar model class for big tables / Класс колоночной модели для больших таблиц
+    Drop-in alternative to BaseModel with the same constructor / Замена BaseModel с тем же конструктором
+
+    Instead of one QStandardItem and one str() copy per cell, values are kept as native Python types
+    in one list per column (the ID column in an int64 array), strings are interned and an id -> row index
+    finds records. Cell text is produced only when the view asks for it, and rows are exposed to the view
+    in batches through canFetchMore/fetchMore.
+
+    Вместо одного QStandardItem и одной копии str() на ячейку значения хранятся в родных типах Python
+    в одном списке на колонку (колонка ID в массиве int64), строки интернируются, а индекс id -> строка
+    находит записи. Текст ячейки создаётся только по запросу представления, а строки показываются
+    представлению порциями через canFetchMore/fetchMore.
+
+    Entity models opt in by inheriting from ColumnarModel instead of BaseModel.
+    Модели сущностей подключаются, наследуясь от ColumnarModel вместо BaseModel.
+    """
+
+    # ===== SIGNALS / СИГНАЛЫ =====
+    # Signal emitted when data changes in the model / Сигнал, испускаемый при изменении данных в модели
+    data_changed = pyqtSignal()
+    # Signal emitted when a background write fails / Сигнал, испускаемый при ошибке фоновой записи
+    write_failed = pyqtSignal(str)
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self, table_name: str, columns: list, parent=None):
+        """
+        Initialize columnar model with database configuration / Инициализация колоночной модели с конфигурацией базы данных
+
+        Args:
+            table_name (str): Name of the database table / Имя таблицы в БД
+            columns (list): List of column names (excluding ID) / Список колонок (без ID)
+            parent: Parent object / Родительский объект
+        """
+        QAbstractTableModel.__init__(self, parent)
+
+        # ===== COLUMN STORAGE / ХРАНЕНИЕ КОЛОНОК =====
+        self._columns: list = []  # One array or list per column / Один массив или список на колонку
+        self._total = 0  # Rows stored / Строк хранится
+        self._visible = 0  # Rows exposed to the view / Строк показано представлению
+        self._id_index: dict | None = {}  # id -> row, None when stale / id -> строка, None если устарел
+
+        self._setup_model(table_name, columns)
+
+    # ===== QT MODEL INTERFACE / ИНТЕРФЕЙС МОДЕЛИ QT =====
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of rows exposed to the view / Количество строк, показанных представлению"""
+        return 0 if parent.isValid() else self._visible
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of columns / Количество колонок"""
+        return 0 if parent.isValid() else len(self.column_names)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Serve cell text lazily / Ленивая выдача текста ячейки
+
+        Args:
+            index: Model index of the cell / Индекс модели ячейки
+            role: Data role / Роль данных
+
+        Returns:
+            str | None: Cell text for display and edit roles / Текст ячейки для ролей отображения и редактирования
+        """
+        if not index.isValid() or role not in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.EditRole,
+        ):
+            return None
+        return self.cell_text(index.row(), index.column())
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """
+        Column names and row numbers / Имена колонок и номера строк
+        """
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self.column_names):
+                return self.column_names[section]
+            return None
+        return str(section + 1)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """
+        Check if stored rows are still hidden from the view or more pages can be loaded /
+        Проверка, остались ли скрытые от представления строки или можно загрузить ещё страницы
+        """
+        return not parent.isValid() and (
+            self._visible < self._total or self.can_fetch_page()
+        )
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """
+        Expose the next batch of stored rows, then load the next page / Показ следующей порции хранимых строк, затем загрузка следующей страницы
+        """
+        if parent.isValid():
+            return
+        if self._visible >= self._total:
+            self.fetch_next_page()
+            return
+        # Rows per fetchMore are page_size in perf_settings.json / Строк за fetchMore - page_size в perf_settings.json
+        count = min(self.appcfg.perf_settings["page_size"], self._total - self._visible)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._visible, self._visible + count - 1)
+        self._visible += count
+        self.endInsertRows()
+
+    # ===== STORAGE PRIMITIVES / ПРИМИТИВЫ ХРАНЕНИЯ =====
+
+    def _reset_rows(self, columns: list) -> None:
+        """
+        Remove all rows and set up columns / Удаление всех строк и настройка колонок
+
+        Args:
+            columns: Column names, empty if unknown / Имена колонок, пустой список если неизвестны
+        """
+        self.beginResetModel()
+        if columns:
+            self.column_names = columns
+        self._columns = [[] for _ in self.column_names]
+        self._total = 0
+        self._visible = 0
+        self._id_index = {}
+        self.endResetModel()
+
+    def _append_rows(self, rows: list) -> None:
+        """
+        Append rows to storage and expose the first screenful / Добавление строк в хранилище и показ первого экрана
+
+        Args:
+            rows: Rows as tuples in column order / Строки в виде кортежей в порядке колонок
+        """
+        if not rows:
+            return
+
+        intern = sys.intern
+        for col_idx, values in enumerate(zip(*rows)):
+            column = self._columns[col_idx]
+            # Integer ID column goes to a compact int64 array / Целочисленная колонка ID идёт в компактный массив int64
+            if col_idx == 0 and not column and all(type(v) is int for v in values):
+                column = self._columns[0] = array("q")
+            if isinstance(column, array):
+                column.extend(values)
+            else:
+                column.extend(intern(v) if type(v) is str else v for v in values)
+
+        if self._id_index is not None:
+            for offset, row in enumerate(rows):
+                self._id_index[row[0]] = self._total + offset
+        self._total += len(rows)
+
+        # Expose rows up to one batch right away, the rest on fetchMore /
+        # Строки до одной порции показываются сразу, остальные по fetchMore
+        page_size = self.appcfg.perf_settings["page_size"]
+        if self._visible < page_size:
+            count = min(page_size, self._total) - self._visible
+            self.beginInsertRows(
+                QModelIndex(), self._visible, self._visible + count - 1
+            )
+            self._visible += count
+            self.endInsertRows()
+
+    def _store_cell(self, index: QModelIndex, value: Any) -> bool:
+        """
+        Store a cell value without touching the database / Сохранение значения ячейки без обращения к БД
+
+        Args:
+            index: Model index of the cell / Индекс модели ячейки
+            value: New value / Новое значение
+
+        Returns:
+            bool: True if stored / True если сохранено
+        """
+        if not index.isValid():
+            return False
+        return self._store_value(index.row(), index.column(), value)
+
+    def _store_value(self, row: int, column: int, value: Any) -> bool:
+        """
+        Store a value by position, shown or not / Сохранение значения по позиции, показанного или нет
+
+        Args:
+            row: Row number / Номер строки
+            column: Column number / Номер колонки
+            value: New value / Новое значение
+
+        Returns:
+            bool: True if stored / True если сохранено
+        """
+        if not 0 < column < len(self._columns) or not 0 <= row < self._total:
+            return False
+        self._columns[column][row] = sys.intern(value) if type(value) is str else value
+        # Rows not yet exposed have no index, the view reads them on fetchMore /
+        # У ещё не показанных строк нет индекса, представление прочитает их при fetchMore
+        if row < self._visible:
+            index = self.index(row, column)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+        return True
+
+    def loaded_rows(self) -> int:
+        """Rows stored, including those not yet exposed to the view / Хранимые строки, включая ещё не показанные представлению"""
+        return self._total
+
+    def record_id(self, row: int) -> str | None:
+        """
+        ID of the record shown in a row / ID записи, показанной в строке
+
+        Args:
+            row: Row number / Номер строки
+
+        Returns:
+            str | None: Record ID, None if the row does not exist / ID записи, None если строки нет
+        """
+        if not self._columns or not 0 <= row < self._total:
+            return None
+        return str(self._columns[0][row])
+
+    def cell_text(self, row: int, column: int) -> str:
+        """
+        Text of a cell as shown in the view / Текст ячейки, как он показан в представлении
+
+        Args:
+            row: Row number / Номер строки
+            column: Column number / Номер колонки
+
+        Returns:
+            str: Cell text, empty string for NULL / Текст ячейки, пустая строка для NULL
+        """
+        if not 0 <= column < len(self._columns) or not 0 <= row < self._total:
+            return ""
+        value = self._columns[column][row]
+        if value is None:
+            return ""
+        return value if type(value) is str else str(value)
+
+    def row_of(self, record_id: Any) -> int | None:
+        """
+        Row that holds a record / Строка, в которой находится запись
+
+        Args:
+            record_id: Record ID as int or text / ID записи числом или текстом
+
+        Returns:
+            int | None: Row number, None if the record is not loaded / Номер строки, None если запись не загружена
+        """
+        if self._id_index is None:
+            ids = self._columns[0] if self._columns else []
+            self._id_index = {value: row for row, value in enumerate(ids)}
+        row = self._id_index.get(record_id)
+        if row is None and isinstance(record_id, str) and record_id.lstrip("-").isdigit():
+            row = self._id_index.get(int(record_id))
+        return row
+
+    def _remove_row(self, row: int) -> None:
+        """
+        Remove one row from storage / Удаление одной строки из хранилища
+
+        Args:
+            row: Row number / Номер строки
+        """
+        self._remove_rows([row])
+
+    def _remove_rows(self, rows: list) -> None:
+        """
+        Remove rows from storage, one removal per contiguous range / Удаление строк из хранилища, одно удаление на непрерывный диапазон
+
+        Args:
+            rows: Row numbers in any order / Номера строк в любом порядке
+        """
+        rows = sorted({row for row in rows if 0 <= row < self._total}, reverse=True)
+        if not rows:
+            return
+
+        # Bottom-up so earlier ranges stay valid / Снизу вверх, чтобы ранние диапазоны оставались верными
+        first = last = rows[0]
+        for row in rows[1:]:
+            if row == first - 1:
+                first = row
+                continue
+            self._remove_range(first, last)
+            first = last = row
+        self._remove_range(first, last)
+
+        # Rows below have shifted up, the index is rebuilt once on demand /
+        # Строки ниже сдвинулись вверх, индекс перестраивается один раз по запросу
+        self._id_index = None
+
+    def _remove_range(self, first: int, last: int) -> None:
+        """Remove rows first..last from storage / Удаление строк first..last из хранилища"""
+        # Only the shown part is announced to the view / Представлению сообщается только показанная часть
+        shown_last = min(last, self._visible - 1)
+        if first <= shown_last:
+            self.beginRemoveRows(QModelIndex(), first, shown_last)
+        for column in self._columns:
+            del column[first : last + 1]
+        self._total -= last - first + 1
+        if first <= shown_last:
+            self._visible -= shown_last - first + 1
+            self.endRemoveRows()
@@ -0,0 +1,1451 @@
+# ===== DATABASE MODEL MIXIN / ПРИМЕСЬ МОДЕЛИ БАЗЫ ДАННЫХ =====
+# Database logic shared by all table models, independent of row storage
+# Логика работы с БД, общая для всех моделей таблиц, независимая от хранения строк
+
+# ===== IMPORTS / ИМПОРТЫ =====
+import time
+from abc import abstractmethod
+from typing import Any
+import psycopg2
+from PyQt6.QtCore import (
+    pyqtSlot,
+    Qt,
+    QAbstractItemModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QTimer,
+)
+from PyQt6.QtWidgets import QMessageBox
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+from src.core.Tracer import traced
+from src.database.ChangeListener import ChangeListener
+from src.database.Connection import Connection
+from src.database.Exporter import Exporter
+from src.database.Importer import Importer
+from src.database.QueryExecutor import QueryExecutor, QueryHandle
+from src.database.Schema import Schema
+from src.database.queries.QueryBuilder import (
+    QueryBuilder,
+    AdvancedQueryBuilder,
+    QueryCriteria,
+)
+
+
+# ===== DATABASE MODEL MIXIN CLASS / КЛАСС ПРИМЕСИ МОДЕЛИ БАЗЫ ДАННЫХ =====
+class DatabaseModelMixin:
+    """
+    Database operations of a table model / Операции с БД для модели таблицы
+
+    Loads, inserts, deletes and updates records in the background and validates input.
+    Row storage is left to the Qt model class it is mixed into, which implements the storage primitives
+    and defines the data_changed and write_failed signals. A Qt model class that misses a primitive
+    raises TypeError when it is defined.
+
+    Загружает, вставляет, удаляет и обновляет записи в фоне и проверяет ввод.
+    Хранение строк оставлено классу модели Qt, с которым смешивается примесь: он реализует примитивы хранения
+    и объявляет сигналы data_changed и write_failed. Класс модели Qt без какого-либо примитива
+    вызывает TypeError при своём определении.
+    """
+
+    # ===== STREAMING SETTINGS / НАСТРОЙКИ ПОТОКОВОЙ ЗАГРУЗКИ =====
+    # Subclasses of big tables switch streaming on / Наследники больших таблиц включают потоковую загрузку
+    STREAMING = False  # Load through a server-side cursor in chunks / Загрузка через серверный курсор порциями
+    # Rows per round trip and first screenful are fetch_chunk_size and fetch_first_rows in perf_settings.json /
+    # Строк за обмен и первый экран - fetch_chunk_size и fetch_first_rows в perf_settings.json
+    STREAM_FIRST_CHUNK_BUDGET_MS = 200  # Latency budget of the first screenful / Бюджет задержки первого экрана
+
+    # ===== PAGING SETTINGS / НАСТРОЙКИ ПОСТРАНИЧНОЙ ЗАГРУЗКИ =====
+    # Load page_size rows with keyset pagination, the next page when the view scrolls near the end /
+    # Загрузка page_size строк keyset пагинацией, следующей страницы при прокрутке представления к концу
+    PAGED = False
+
+    # ===== SERVER-SIDE SORTING / СОРТИРОВКА НА СЕРВЕРЕ =====
+    # Order before the user sorts by a column / Порядок до сортировки пользователем по колонке
+    DEFAULT_ORDER = [("id", True)]
+
+    # ===== SEARCH SETTINGS / НАСТРОЙКИ ПОИСКА =====
+    # Columns of the search bar, all writable columns if None / Колонки строки поиска, все записываемые колонки если None
+    SEARCH_COLUMNS: list | None = None
+    # Shorter words have no trigrams and cannot use the index / У более коротких слов нет триграмм, и они не могут использовать индекс
+    SEARCH_MIN_CHARS = 3
+
+    # ===== STORAGE INTERFACE CHECK / ПРОВЕРКА ИНТЕРФЕЙСА ХРАНЕНИЯ =====
+    def __init_subclass__(cls, **kwargs):
+        """
+        Check that a Qt model class implements every storage primitive / Проверка, что класс модели Qt реализует все примитивы хранения
+
+        Qt classes have their own metaclass, so ABCMeta cannot enforce abstractmethod here.
+        У классов Qt свой метакласс, поэтому ABCMeta не может обеспечить abstractmethod здесь.
+
+        Raises:
+            TypeError: A primitive is not implemented / Примитив не реализован
+        """
+        super().__init_subclass__(**kwargs)
+        if not issubclass(cls, QAbstractItemModel):
+            return
+        missing = [
+            name
+            for name, attr in vars(DatabaseModelMixin).items()
+            if getattr(attr, "__isabstractmethod__", False)
+            and getattr(getattr(cls, name), "__isabstractmethod__", False)
+        ]
+        if missing:
+            raise TypeError(
+                f"{cls.__name__} does not implement storage primitives: {', '.join(missing)}"
+            )
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def _setup_model(self, table_name: str, columns: list) -> None:
+        """
+        Set up database configuration and start the first load / Настройка конфигурации БД и запуск первой загрузки
+
+        Called by the concrete model constructor after the Qt base class is initialized.
+        Generates SQL queries automatically and establishes database connection.
+
+        Вызывается конструктором конкретной модели после инициализации базового класса Qt.
+        Генерирует SQL запросы автоматически и устанавливает подключение к базе данных.
+
+        Args:
+            table_name (str): Name of the database table / Имя таблицы в БД
+            columns (list): List of column names (excluding ID) / Список колонок (без ID)
+        """
+        # ===== LOGGER INITIALIZATION / ИНИЦИАЛИЗАЦИЯ ЛОГЕРА =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        # ===== CONFIGURATION STORAGE / СОХРАНЕНИЕ КОНФИГУРАЦИИ =====
+        # Store table configuration for later use / Сохранение конфигурации таблицы для последующего использования
+        self.table_name = table_name
+        self.edit_columns = list(columns)  # Writable columns (excluding ID) / Записываемые колонки (без ID)
+        self.column_names = (
+            []
+        )  # Will be populated when loading data / Будет заполнено при загрузке данных
+
+        # ===== SQL QUERY GENERATION / ГЕНЕРАЦИЯ SQL ЗАПРОСОВ =====
+        # Generate all necessary CRUD queries using QueryBuilder / Генерация всех необходимых CRUD запросов с использованием QueryBuilder
+        # Writes return the affected row to patch the model in place / Записи возвращают затронутую строку для точечного обновления модели
+        self.queries = {
+            "select": QueryBuilder.select_all(table_name),
+            "insert": QueryBuilder.insert(table_name, columns, returning=True),
+            "update": QueryBuilder.update(table_name, columns, returning=True),
+            "delete": QueryBuilder.delete(table_name, returning=True),
+            "delete_many": QueryBuilder.delete_many(table_name, returning=True),
+        }
+        # Filters and order of loads, built by _select_query / Фильтры и порядок загрузок, собираются _select_query
+        self.criteria = QueryCriteria(order_by=self.DEFAULT_ORDER)
+
+        self.lg.debug("Generated queries for %s.", table_name)
+
+        # ===== DATABASE CONNECTION SETUP / НАСТРОЙКА ПОДКЛЮЧЕНИЯ К БД =====
+        # Performance settings are read on every load, so file changes apply to the next refresh /
+        # Настройки производительности читаются при каждой загрузке, поэтому изменения файла применяются к следующему обновлению
+        self.appcfg = AppConfig()
+        self.condb = Connection()
+        # Queries run on the background executor, never on the GUI thread /
+        # Запросы выполняются в фоновом исполнителе, никогда в GUI потоке
+        self.executor = QueryExecutor()
+
+        # ===== BACKGROUND QUERY STATE / СОСТОЯНИЕ ФОНОВЫХ ЗАПРОСОВ =====
+        # Current refresh, superseded refreshes are cancelled / Текущее обновление, устаревшие отменяются
+        self._refresh_handle: QueryHandle | None = None
+        # A load has been started, the deferred first load is then skipped / Загрузка уже запущена, отложенная первая загрузка тогда пропускается
+        self._load_requested = False
+        # In-flight cell updates: handle -> (index, old value) / Выполняющиеся обновления ячеек: дескриптор -> (индекс, старое значение)
+        self._pending_updates: dict[QueryHandle, tuple[QPersistentModelIndex, Any]] = {}
+        # In-flight inserts and deletes / Выполняющиеся вставки и удаления
+        self._pending_writes: set[QueryHandle] = set()
+        # Streaming refresh has already received its first chunk / Потоковое обновление уже получило первую порцию
+        self._stream_started = False
+        # Paged mode: page in flight, last loaded row and whether the table end was reached /
+        # Постраничный режим: загружаемая страница, последняя загруженная строка и достигнут ли конец таблицы
+        self._page_handle: QueryHandle | None = None
+        self._last_row: dict | None = None
+        self._pages_exhausted = True
+        self._page_size = 0
+        self._page_started = 0.0
+        # Re-reads of rows changed by other clients: handle -> ids / Перечитывания строк, изменённых другими клиентами: дескриптор -> id
+        self._pending_patches: dict[QueryHandle, list] = {}
+
+        # ===== METRICS / МЕТРИКИ =====
+        self.metrics = Metrics()
+        self._refresh_started = 0.0  # perf_counter() of the current refresh / perf_counter() текущего обновления
+        self._rebuild_ms = 0.0  # GUI time spent filling the model / Время GUI на заполнение модели
+
+        # ===== SEARCH INDEX / ИНДЕКС ПОИСКА =====
+        # Idempotent, built in the background once per table / Идемпотентно, строится в фоне один раз на таблицу
+        self.search_columns = list(self.SEARCH_COLUMNS or self.edit_columns)
+        if not Schema.is_checked(table_name):
+            self.executor.submit(
+                Schema(self.condb).ensure_search_index, table_name, self.search_columns
+            )
+
+        # ===== LIVE REFRESH / ОБНОВЛЕНИЕ НА ЛЕТУ =====
+        # Edits of other clients arrive through LISTEN/NOTIFY, see ChangeListener /
+        # Правки других клиентов приходят через LISTEN/NOTIFY, см. ChangeListener
+        if self.appcfg.perf_settings["live_refresh"]:
+            if not Schema.is_checked(table_name, "change_triggers"):
+                self.executor.submit(Schema(self.condb).ensure_change_triggers, table_name)
+            listener = ChangeListener()
+            listener.changed.connect(self._on_remote_change)
+            listener.resync.connect(self.refresh_data)
+            listener.start()
+
+        # ===== INITIAL DATA LOAD / НАЧАЛЬНАЯ ЗАГРУЗКА ДАННЫХ =====
+        # Deferred by one event loop turn: a view that sets its sort indicator meanwhile starts the load
+        # with its own order, so creating a view costs one query /
+        # Отложена на один проход цикла событий: представление, задавшее тем временем индикатор сортировки,
+        # запускает загрузку в своём порядке, поэтому создание представления стоит одного запроса
+        QTimer.singleShot(0, self._initial_load)
+
+    def _initial_load(self) -> None:
+        """First load, unless a sort or filter has already started one / Первая загрузка, если сортировка или фильтр её ещё не запустили"""
+        if not self._load_requested:
+            self.refresh_data()
+
+
+    # ===== PUBLIC METHODS - DATA OPERATIONS / ПУБЛИЧНЫЕ МЕТОДЫ - ОПЕРАЦИИ С ДАННЫМИ =====
+
+    @traced()
+    def refresh_data(self) -> None:
+        """
+        Load data from database into model / Загрузка данных из БД в модель
+
+        Starts a background SELECT of the records matching the criteria; the model is repopulated when rows arrive.
+        A refresh that is still running is cancelled, since its result is already stale.
+
+        Запускает фоновый SELECT записей, подходящих под критерии; модель заполняется, когда приходят строки.
+        Ещё выполняющееся обновление отменяется, так как его результат уже устарел.
+        """
+        try:
+            self.cancel_pending()
+            self._load_requested = True
+            self._refresh_started = time.perf_counter()
+            self._rebuild_ms = 0.0
+
+            if self.STREAMING:
+                # Rows arrive in chunks from a server-side cursor / Строки приходят порциями из серверного курсора
+                self._stream_started = False
+                perf = self.appcfg.perf_settings
+                query, params = self._select_query()
+                handle = self.executor.submit(
+                    self._stream_rows,
+                    query,
+                    params,
+                    perf["fetch_chunk_size"],
+                    perf["fetch_first_rows"],
+                )
+                handle.chunk.connect(self._on_refresh_chunk)
+                handle.finished.connect(self._on_stream_finished)
+            elif self.PAGED:
+                # First page only, the rest as the view scrolls / Только первая страница, остальные по мере прокрутки
+                self._last_row = None
+                self._pages_exhausted = False
+                self._page_size = self.appcfg.perf_settings["page_size"]
+                handle = self.executor.execute(
+                    self.condb, *self._select_query(limit=self._page_size)
+                )
+                handle.finished.connect(self._on_refresh_finished)
+            else:
+                handle = self.executor.execute(self.condb, *self._select_query())
+                handle.finished.connect(self._on_refresh_finished)
+            handle.failed.connect(self._on_refresh_failed)
+            self._refresh_handle = handle
+        except Exception as e:
+            # Handle general exceptions / Обработка общих исключений
+            self.lg.critical("Internal error: %s.", e)
+
+    def cancel_pending(self) -> None:
+        """
+        Cancel a refresh and re-reads of remote changes that are still running /
+        Отмена ещё выполняющегося обновления и перечитываний удалённых изменений
+
+        Writes are never cancelled, they always reach the database.
+        Записи никогда не отменяются, они всегда доходят до базы данных.
+        """
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._page_handle is not None:
+            self._page_handle.cancel()
+            self._page_handle = None
+        for handle in self._pending_patches:
+            handle.cancel()
+        self._pending_patches.clear()
+
+    # ===== PUBLIC METHODS - SORTING AND FILTERING / ПУБЛИЧНЫЕ МЕТОДЫ - СОРТИРОВКА И ФИЛЬТРАЦИЯ =====
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """
+        Sort on the server / Сортировка на сервере
+
+        Called by the view on header clicks. Instead of reordering loaded rows, the data is reloaded
+        with ORDER BY, so numbers and dates sort by value, an index can serve the order and
+        streaming or paged loads show the first rows of the new order right away.
+
+        Вызывается представлением при клике по заголовку. Вместо перестановки загруженных строк данные
+        перезагружаются с ORDER BY, поэтому числа и даты сортируются по значению, порядок может обслужить индекс,
+        а потоковая или постраничная загрузка сразу показывает первые строки нового порядка.
+
+        Args:
+            column: Column to sort by / Колонка для сортировки
+            order: Sort order / Порядок сортировки
+        """
+        # Before the first load the columns are known from the constructor / До первой загрузки колонки известны из конструктора
+        names = self.column_names or ["id", *self.edit_columns]
+        if not 0 <= column < len(names):
+            return
+        order_by = [(names[column], order == Qt.SortOrder.AscendingOrder)]
+        if order_by == self.criteria.order_by:
+            return
+        self.criteria.order_by = order_by
+        self.lg.debug("%s: sort by %s.", self.table_name, order_by)
+        self.refresh_data()
+
+    def set_filters(self, filters: list) -> None:
+        """
+        Replace filters and reload from the server / Замена фильтров и перезагрузка с сервера
+
+        Args:
+            filters: (column, operator, value) conditions, see QueryCriteria.OPERATORS; empty clears /
+                     Условия (колонка, оператор, значение), см. QueryCriteria.OPERATORS; пусто - сброс
+
+        Raises:
+            ValueError: Unknown operator / Неизвестный оператор
+        """
+        criteria = self.criteria.copy()
+        criteria.filters = []
+        for condition in filters:
+            criteria.where(*condition)
+        if criteria.filters == self.criteria.filters:
+            return
+        self.criteria = criteria
+        self.lg.debug("%s: filters %s.", self.table_name, criteria.filters)
+        self.refresh_data()
+
+    def search(self, text: str) -> None:
+        """
+        Show the best matches of words in the search columns / Показ лучших совпадений слов в колонках поиска
+
+        Every word must occur in one of the columns; rows are ranked by pg_trgm word similarity and
+        the first search_limit rows of perf_settings.json are loaded. The trigram index serves the match,
+        so the query does not scan the table. A search still running is cancelled on the server.
+        Text shorter than SEARCH_MIN_CHARS clears the search.
+
+        Каждое слово должно встречаться в одной из колонок; строки ранжируются по сходству слов pg_trgm, и
+        загружаются первые search_limit строк из perf_settings.json. Совпадение обслуживает триграммный индекс,
+        поэтому запрос не просматривает таблицу. Ещё выполняющийся поиск отменяется на сервере.
+        Текст короче SEARCH_MIN_CHARS сбрасывает поиск.
+
+        Args:
+            text: Words to search for / Искомые слова
+        """
+        text = " ".join(text.split())
+        if len(text) < self.SEARCH_MIN_CHARS:
+            text = ""
+        if text == self.criteria.search_text:
+            return
+        self.criteria.search(text, self.search_columns)
+        self.lg.debug("%s: search %r.", self.table_name, text)
+        self.refresh_data()
+
+    def set_filter(self, column: str | None, operator: str = "CONTAINS", value: Any = None) -> None:
+        """
+        Filter by one condition, None column or empty value clears /
+        Фильтр по одному условию, колонка None или пустое значение - сброс
+
+        Example / Пример:
+            model.set_filter("f_fio", "CONTAINS", "ivan")
+        """
+        if column is None or (
+            value in (None, "") and operator not in ("IS NULL", "IS NOT NULL")
+        ):
+            self.set_filters([])
+        else:
+            self.set_filters([(column, operator, value)])
+
+    # ===== PUBLIC METHODS - PAGING / ПУБЛИЧНЫЕ МЕТОДЫ - ПОСТРАНИЧНАЯ ЗАГРУЗКА =====
+
+    def can_fetch_page(self) -> bool:
+        """
+        Check if paged mode has more rows to load / Проверка, есть ли в постраничном режиме ещё строки для загрузки
+
+        Returns:
+            bool: True if the next page can be requested / True если можно запросить следующую страницу
+        """
+        return self.PAGED and not self._pages_exhausted and self._refresh_handle is None
+
+    @traced()
+    def fetch_next_page(self) -> None:
+        """
+        Load the page after the last loaded row in the background / Фоновая загрузка страницы после последней загруженной строки
+
+        The query seeks by the sort key instead of skipping rows, so each page costs the same at any depth.
+        Only one page is loaded at a time.
+
+        Запрос ищет по id вместо пропуска строк, поэтому каждая страница стоит одинаково на любой глубине.
+        Одновременно загружается только одна страница.
+        """
+        if not self.can_fetch_page() or self._page_handle is not None:
+            return
+        try:
+            self._page_started = time.perf_counter()
+            handle = self.executor.execute(
+                self.condb, *self._select_query(after=self._last_row, limit=self._page_size)
+            )
+            handle.finished.connect(self._on_page_finished)
+            handle.failed.connect(self._on_page_failed)
+            self._page_handle = handle
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    def _select_query(self, after: dict | None = None, limit: int | None = None) -> tuple:
+        """
+        SELECT of the current criteria / SELECT по текущим критериям
+
+        Args:
+            after: Last row of the previous page / Последняя строка предыдущей страницы
+            limit: Maximum number of rows / Максимальное число строк
+
+        Returns:
+            tuple: (composed query, parameters) / (собранный запрос, параметры)
+        """
+        if self.criteria.search_text:
+            # Ranked results are capped and not paged / Ранжированные результаты ограничены и не разбиваются на страницы
+            limit = self.appcfg.perf_settings["search_limit"]
+        return AdvancedQueryBuilder.select(
+            self.table_name,
+            self.criteria,
+            after=after,
+            limit=limit,
+            trigram=Schema.trigram_available(),
+        )
+
+    @traced()
+    def _apply_rows(self, rows: list | None) -> None:
+        """
+        Populate the model with fetched rows / Заполнение модели полученными строками
+
+        Clears existing data first to ensure consistency.
+        Сначала очищает существующие данные для обеспечения согласованности.
+
+        Args:
+            rows: Rows as dictionaries / Строки в виде словарей
+        """
+        columns = list(rows[0].keys()) if rows else []
+        self._reset_rows(columns)
+        if rows:
+            self._append_rows([tuple(row.values()) for row in rows])
+
+    # ===== STORAGE PRIMITIVES / ПРИМИТИВЫ ХРАНЕНИЯ =====
+    # Abstract interface of the concrete model class, checked by __init_subclass__ /
+    # Абстрактный интерфейс конкретного класса модели, проверяется в __init_subclass__
+
+    @abstractmethod
+    def _reset_rows(self, columns: list) -> None:
+        """Remove all rows and set up columns / Удаление всех строк и настройка колонок"""
+
+    @abstractmethod
+    def _append_rows(self, rows: list) -> None:
+        """Append row tuples to the end of the model / Добавление кортежей строк в конец модели"""
+
+    @abstractmethod
+    def _store_cell(self, index: QModelIndex, value: Any) -> bool:
+        """Store a cell value without touching the database / Сохранение значения ячейки без обращения к БД"""
+
+    @abstractmethod
+    def _store_value(self, row: int, column: int, value: Any) -> bool:
+        """Store a value by position, also in rows not shown yet / Сохранение значения по позиции, в том числе в ещё не показанных строках"""
+
+    @abstractmethod
+    def record_id(self, row: int) -> str | None:
+        """ID of the record shown in a row / ID записи, показанной в строке"""
+
+    def loaded_rows(self) -> int:
+        """Rows held in memory, shown or not / Строки в памяти, показанные или нет"""
+        return self.rowCount()
+
+    @abstractmethod
+    def cell_text(self, row: int, column: int) -> str:
+        """Text of a cell as shown in the view / Текст ячейки, как он показан в представлении"""
+
+    @abstractmethod
+    def row_of(self, record_id: Any) -> int | None:
+        """Row that holds a record, None if not loaded / Строка, в которой находится запись, None если не загружена"""
+
+    @abstractmethod
+    def _remove_row(self, row: int) -> None:
+        """Remove one row from the model / Удаление одной строки из модели"""
+
+    def _remove_rows(self, rows: list) -> None:
+        """Remove several rows from the model / Удаление нескольких строк из модели"""
+        # Bottom-up so earlier positions stay valid / Снизу вверх, чтобы ранние позиции оставались верными
+        for row in sorted(rows, reverse=True):
+            self._remove_row(row)
+
+    @traced()
+    def _stream_rows(
+        self,
+        handle: QueryHandle,
+        query,
+        params: list,
+        itersize: int,
+        first_rows: int,
+    ) -> int:
+        """
+        Worker side of a streaming refresh / Рабочая часть потокового обновления
+
+        ! Runs in a worker thread and must not touch the model itself. /
+        ! Выполняется в рабочем потоке и не должна трогать саму модель.
+
+        Args:
+            handle: Handle to report chunks to / Дескриптор для отправки порций
+            query: SQL SELECT query / SQL SELECT запрос
+            params: Query parameters / Параметры запроса
+            itersize: Rows per round trip / Строк за один обмен с сервером
+            first_rows: Size of the first chunk / Размер первой порции
+
+        Returns:
+            int: Total number of streamed rows / Общее количество полученных строк
+        """
+        started = time.perf_counter()
+        total = 0
+        for columns, rows in self.condb.stream_query(
+            query, params, itersize=itersize, first_rows=first_rows
+        ):
+            if handle.is_cancelled():
+                break
+            if total == 0:
+                first_ms = (time.perf_counter() - started) * 1000
+                if first_ms > self.STREAM_FIRST_CHUNK_BUDGET_MS:
+                    self.lg.warning(
+                        "%s: first screenful took %.0f ms, budget %s ms.",
+                        self.table_name,
+                        first_ms,
+                        self.STREAM_FIRST_CHUNK_BUDGET_MS,
+                    )
+            total += len(rows)
+            handle.report_chunk((columns, rows))
+            handle.report_progress(total)
+        return total
+
+    @pyqtSlot(object)
+    @traced()
+    def _on_refresh_chunk(self, data: tuple) -> None:
+        """
+        Append one chunk of a streaming refresh / Добавление одной порции потокового обновления
+
+        Args:
+            data: (column names, row tuples) / (имена колонок, кортежи строк)
+        """
+        if self.sender() is not self._refresh_handle:
+            return
+
+        started = time.perf_counter()
+        try:
+            columns, rows = data
+            first_chunk = not self._stream_started
+            if first_chunk:
+                # Old rows stay visible until the first chunk is here / Старые строки видны до прихода первой порции
+                self._reset_rows(columns)
+                self._stream_started = True
+            self._append_rows(rows)
+            if first_chunk:
+                self.data_changed.emit()
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+        self._rebuild_ms += (time.perf_counter() - started) * 1000
+
+    @pyqtSlot(object)
+    @traced()
+    def _on_stream_finished(self, total: int) -> None:
+        """
+        Complete a streaming refresh / Завершение потокового обновления
+
+        Args:
+            total: Number of streamed rows / Количество полученных строк
+        """
+        if self.sender() is not self._refresh_handle:
+            return
+        self._refresh_handle = None
+
+        if not self._stream_started:
+            # Empty table / Пустая таблица
+            self._reset_rows([])
+        self.data_changed.emit()
+        self._record_refresh()
+        self.lg.debug("Streamed %s rows successfully.", total)
+
+    @pyqtSlot(object)
+    def _on_refresh_finished(self, rows: list | None) -> None:
+        """
+        Apply rows of the current refresh / Применение строк текущего обновления
+
+        Args:
+            rows: Rows returned by the SELECT / Строки, возвращённые SELECT
+        """
+        # Ignore results of superseded refreshes / Игнорирование результатов устаревших обновлений
+        if self.sender() is not self._refresh_handle:
+            return
+        self._refresh_handle = None
+
+        try:
+            started = time.perf_counter()
+            self._apply_rows(rows)
+            self._rebuild_ms = (time.perf_counter() - started) * 1000
+            if self.PAGED:
+                self._track_page(rows)
+            self.data_changed.emit()
+            self._record_refresh()
+            self.lg.debug("Refresh data successfully.")
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    @pyqtSlot(object)
+    @traced()
+    def _on_page_finished(self, rows: list | None) -> None:
+        """
+        Append the next page to the model / Добавление следующей страницы в модель
+
+        Args:
+            rows: Rows of the page / Строки страницы
+        """
+        if self.sender() is not self._page_handle:
+            return
+        self._page_handle = None
+
+        try:
+            if rows and list(rows[0].keys()) != self.column_names:
+                # Table changed under the model / Таблица изменилась под моделью
+                self.refresh_data()
+                return
+            self._track_page(rows)
+            if rows:
+                self._append_rows([tuple(row.values()) for row in rows])
+                self.data_changed.emit()
+            self.metrics.observe(
+                f"model.page_ms.{self.table_name}",
+                (time.perf_counter() - self._page_started) * 1000,
+            )
+            self.lg.debug("%s: loaded page of %s row(s).", self.table_name, len(rows or ()))
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    @pyqtSlot(str)
+    def _on_page_failed(self, message: str) -> None:
+        """
+        Log a failed page load, the next scroll retries it / Логирование неудачной загрузки страницы, следующая прокрутка повторит её
+
+        Args:
+            message: Error message / Сообщение об ошибке
+        """
+        if self.sender() is not self._page_handle:
+            return
+        self._page_handle = None
+        self.lg.error("Psycopg2 internal error: %s.", message)
+
+    def _track_page(self, rows: list | None) -> None:
+        """
+        Remember where the next page starts / Запоминание, где начинается следующая страница
+
+        Args:
+            rows: Rows of the loaded page / Строки загруженной страницы
+        """
+        if rows:
+            self._last_row = rows[-1]
+        # A short page is the last one, search results are one page / Неполная страница - последняя, результаты поиска - одна страница
+        self._pages_exhausted = (
+            not rows or len(rows) < self._page_size or bool(self.criteria.search_text)
+        )
+
+    def _record_refresh(self) -> None:
+        """
+        Record refresh latency and model rebuild time / Запись задержки обновления и времени перестроения модели
+        """
+        self.metrics.observe(
+            f"model.refresh_ms.{self.table_name}",
+            (time.perf_counter() - self._refresh_started) * 1000,
+        )
+        self.metrics.observe(f"model.rebuild_ms.{self.table_name}", self._rebuild_ms)
+        if self.criteria.search_text:
+            self.metrics.observe(
+                f"model.search_ms.{self.table_name}",
+                (time.perf_counter() - self._refresh_started) * 1000,
+            )
+
+    @pyqtSlot(str)
+    def _on_refresh_failed(self, message: str) -> None:
+        """
+        Log a failed refresh / Логирование неудачного обновления
+
+        Args:
+            message: Error message / Сообщение об ошибке
+        """
+        if self.sender() is not self._refresh_handle:
+            return
+        self._refresh_handle = None
+        self.lg.error("Psycopg2 internal error: %s.", message)
+
+    @traced()
+    def add(self, *args: Any | None) -> bool:
+        """
+        Add new record to database / Добавление новой записи в БД
+
+        Inserts a new record with the provided data into the database table in the background.
+        The inserted row returned by the database is appended to the model after commit.
+
+        Вставляет новую запись с предоставленными данными в таблицу базы данных в фоне.
+        Вставленная строка, возвращённая базой данных, добавляется в модель после фиксации.
+
+        ! May throw error if no data entered! / ! Может выдавать ошибку если не ввести данные!!!
+
+        Args:
+            *args: Variable number of arguments matching table columns / Переменное количество аргументов, соответствующих столбцам таблицы
+
+        Returns:
+            bool: True if the insert was queued, False otherwise / True если вставка поставлена в очередь, False в противном случае
+        """
+        try:
+            self.lg.debug("Add method received args: %s", args)
+            self.lg.debug("Table columns: %s", self.column_names)
+            self.lg.debug("Insert query: %s", self.queries['insert'])
+
+            # Execute INSERT query on a pooled connection / Выполнение INSERT запроса на соединении из пула
+            self._submit_write(self.queries["insert"], args, self._on_insert_finished)
+
+            self.lg.debug("Add data queued.")
+            return True
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+            return False
+
+    @traced()
+    def delete_record(self, record_id: int | str) -> QueryHandle | None:
+        """
+        Delete record from database / Удаление записи из БД
+
+        Removes a record with the specified ID from the database table in the background.
+        The deleted row is removed from the model after commit.
+
+        Удаляет запись с указанным ID из таблицы базы данных в фоне.
+        Удалённая строка убирается из модели после фиксации.
+
+        Args:
+            record_id: ID of the record to delete / ID записи для удаления
+
+        Returns:
+            QueryHandle | None: Handle of the queued delete, None if it could not be queued /
+                                Дескриптор поставленного удаления, None если поставить не удалось
+        """
+        try:
+            # Execute DELETE query on a pooled connection / Выполнение DELETE запроса на соединении из пула
+            handle = self._submit_write(
+                self.queries["delete"], (record_id,), self._on_delete_finished
+            )
+
+            self.lg.debug("Delete data queued.")
+            return handle
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+            return None
+
+    @traced()
+    def delete_records(self, record_ids: list) -> QueryHandle | None:
+        """
+        Delete several records in one transaction / Удаление нескольких записей в одной транзакции
+
+        Runs one set-based DELETE for all IDs. If it fails (e.g. a record is still referenced),
+        the IDs are retried one by one inside the same transaction to find which ones cannot be deleted.
+        The model is patched once when the transaction commits.
+
+        Выполняет один DELETE по множеству для всех ID. Если он не удался (например, на запись ещё ссылаются),
+        ID повторяются по одному в той же транзакции, чтобы найти те, что удалить нельзя.
+        Модель обновляется один раз после фиксации транзакции.
+
+        A failed transaction is reported only through the handle's failed signal, not write_failed.
+        Неудавшаяся транзакция сообщается только сигналом failed дескриптора, не write_failed.
+
+        Args:
+            record_ids: IDs of the records to delete / ID записей для удаления
+
+        Returns:
+            QueryHandle | None: Handle whose finished signal carries
+                                {"deleted": rows, "failed": {id: error}, "missing": [ids already gone]},
+                                None if it could not be queued /
+                                Дескриптор, сигнал finished которого несёт
+                                {"deleted": строки, "failed": {id: ошибка}, "missing": [уже удалённые ID]},
+                                None если поставить не удалось
+        """
+        try:
+            # IDs come from the view as text / ID приходят из представления текстом
+            ids = [
+                int(record_id) if str(record_id).lstrip("-").isdigit() else record_id
+                for record_id in record_ids
+            ]
+            handle = self.executor.submit(self._delete_many, ids)
+            handle.finished.connect(self._on_bulk_delete_finished)
+            handle.failed.connect(self._on_bulk_delete_failed)
+            self._pending_writes.add(handle)
+
+            self.lg.debug("Bulk delete of %s records queued.", len(ids))
+            return handle
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+            return None
+
+    @traced()
+    def _delete_many(self, handle: QueryHandle, record_ids: list) -> dict:
+        """
+        Worker side of a bulk delete / Рабочая часть массового удаления
+
+        ! Runs in a worker thread and must not touch the model itself. /
+        ! Выполняется в рабочем потоке и не должна трогать саму модель.
+
+        Args:
+            handle: Handle to report progress to / Дескриптор для отчёта о прогрессе
+            record_ids: IDs of the records to delete / ID записей для удаления
+
+        Returns:
+            dict: {"deleted": deleted rows, "failed": {id: error message}, "missing": [ids]} /
+                  {"deleted": удалённые строки, "failed": {id: сообщение об ошибке}, "missing": [ID]}
+        """
+        deleted: list = []
+        failed: dict = {}
+
+        with self.condb.transaction(self.table_name) as cursor:
+            cursor.execute("SAVEPOINT bulk_delete")
+            try:
+                cursor.execute(self.queries["delete_many"], (record_ids,))
+                deleted = cursor.fetchall()
+            except psycopg2.Error:
+                # One bad ID aborts the whole statement, find it row by row /
+                # Один плохой ID прерывает весь запрос, ищем его построчно
+                cursor.execute("ROLLBACK TO SAVEPOINT bulk_delete")
+                for done, record_id in enumerate(record_ids, 1):
+                    cursor.execute("SAVEPOINT delete_one")
+                    try:
+                        cursor.execute(self.queries["delete"], (record_id,))
+                        deleted.extend(cursor.fetchall())
+                        cursor.execute("RELEASE SAVEPOINT delete_one")
+                    except psycopg2.Error as e:
+                        cursor.execute("ROLLBACK TO SAVEPOINT delete_one")
+                        failed[record_id] = str(e).strip()
+                    handle.report_progress(done)
+
+        # IDs already gone from the table / ID, которых уже нет в таблице
+        found = {row["id"] for row in deleted}
+        missing = [
+            record_id
+            for record_id in record_ids
+            if record_id not in found and record_id not in failed
+        ]
+        return {"deleted": deleted, "failed": failed, "missing": missing}
+
+    def import_file(self, path: str) -> QueryHandle | None:
+        """
+        Bulk import a CSV/XLSX file in the background / Массовый импорт CSV/XLSX файла в фоне
+
+        Rows are loaded through COPY into a staging table and merged in one transaction,
+        then the model is reloaded once. Progress reports the number of rows read.
+
+        Строки загружаются через COPY во временную таблицу и сливаются в одной транзакции,
+        затем модель перезагружается один раз. Прогресс сообщает количество прочитанных строк.
+
+        Args:
+            path: File to import / Файл для импорта
+
+        Returns:
+            QueryHandle | None: Handle whose finished signal carries import statistics, None if it could not be queued /
+                                Дескриптор, сигнал finished которого несёт статистику импорта, None если поставить не удалось
+        """
+        try:
+            importer = Importer(self.table_name, self.edit_columns, self.condb)
+            handle = self.executor.submit(importer.run, path)
+            handle.finished.connect(self._on_import_finished)
+
+            self.lg.debug("Import of %s queued.", path)
+            return handle
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+            return None
+
+    @pyqtSlot(object)
+    def _on_import_finished(self, _stats: dict) -> None:
+        """Reload model after a bulk import / Перезагрузка модели после массового импорта"""
+        self.refresh_data()
+
+    def export_file(self, path: str) -> QueryHandle | None:
+        """
+        Stream the rows of the current view to a file in the background / Потоковая выгрузка строк текущего представления в файл в фоне
+
+        The export follows the current filters, search and sort, without paging or the search limit.
+        Rows go from PostgreSQL straight to disk and are never loaded into the model.
+        Format and gzip compression follow the file name (.csv, .jsonl, .gz).
+
+        Выгрузка следует текущим фильтрам, поиску и сортировке, без страниц и ограничения поиска.
+        Строки идут из PostgreSQL прямо на диск и никогда не загружаются в модель.
+        Формат и сжатие gzip определяются по имени файла (.csv, .jsonl, .gz).
+
+        Args:
+            path: Target file / Целевой файл
+
+        Returns:
+            QueryHandle | None: Handle whose finished signal carries export statistics, None if it could not be queued /
+                                Дескриптор, сигнал finished которого несёт статистику экспорта, None если поставить не удалось
+        """
+        try:
+            fmt, compress = Exporter.format_for(path)
+            criteria = self.criteria.copy()
+            criteria.limit = None
+            query, params = AdvancedQueryBuilder.select(
+                self.table_name, criteria, trigram=Schema.trigram_available()
+            )
+            exporter = Exporter(self.condb)
+            handle = self.executor.submit(
+                exporter.run, query, path, fmt, compress, params
+            )
+
+            self.lg.debug("Export to %s queued.", path)
+            return handle
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+            return None
+
+    def _submit_write(self, query: str, params: tuple, on_finished) -> QueryHandle:
+        """
+        Queue an INSERT/DELETE and patch the model when it commits / Постановка INSERT/DELETE в очередь и обновление модели после фиксации
+
+        Args:
+            query: SQL query string with RETURNING / SQL запрос с RETURNING
+            params: Query parameters / Параметры запроса
+            on_finished: Slot receiving the returned rows / Слот, получающий возвращённые строки
+
+        Returns:
+            QueryHandle: Handle of the queued write / Дескриптор поставленной записи
+        """
+        handle = self.executor.execute(self.condb, query, params)
+        handle.finished.connect(on_finished)
+        handle.failed.connect(self._on_write_failed)
+        self._pending_writes.add(handle)
+        return handle
+
+    def _can_patch(self, rows: list | None) -> bool:
+        """
+        Check that returned rows can be applied to the loaded data / Проверка, что возвращённые строки можно применить к загруженным данным
+
+        The model has drifted from the table when a refresh is still running, nothing is loaded yet,
+        the columns differ or the database affected no row. A full reload is needed then.
+
+        Модель разошлась с таблицей, если ещё выполняется обновление, ничего не загружено,
+        колонки отличаются или база данных не затронула ни одной строки. Тогда нужна полная перезагрузка.
+
+        Args:
+            rows: Rows returned by the write / Строки, возвращённые записью
+
+        Returns:
+            bool: True if the model can be patched / True если модель можно обновить точечно
+        """
+        if self._refresh_handle is not None or not rows or not self.column_names:
+            return False
+        return all(list(row.keys()) == self.column_names for row in rows)
+
+    @pyqtSlot(object)
+    @traced()
+    def _on_insert_finished(self, rows: list | None) -> None:
+        """
+        Append committed rows to the model / Добавление зафиксированных строк в модель
+
+        Args:
+            rows: Inserted rows returned by the database / Вставленные строки, возвращённые базой данных
+        """
+        self._pending_writes.discard(self.sender())
+        try:
+            if not self._can_patch(rows):
+                self.lg.debug("%s: model drifted, reloading.", self.table_name)
+                self.refresh_data()
+                return
+
+            if self.criteria.filters or self.criteria.search_text:
+                # Only the server knows if new rows match the filters / Только сервер знает, подходят ли новые строки под фильтры
+                self.refresh_data()
+                return
+
+            if self.PAGED and not self._pages_exhausted:
+                # Rows past the loaded pages arrive with a later page / Строки за загруженными страницами придут с более поздней страницей
+                self._place_new_rows([row["id"] for row in rows])
+                return
+
+            # Rows already loaded by a refresh are skipped / Строки, уже загруженные обновлением, пропускаются
+            new_rows = [
+                tuple(row.values()) for row in rows if self.row_of(row["id"]) is None
+            ]
+            self._append_rows(new_rows)
+            self.data_changed.emit()
+            self.lg.debug("%s: inserted %s row(s).", self.table_name, len(new_rows))
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    @pyqtSlot(object)
+    @traced()
+    def _on_delete_finished(self, rows: list | None) -> None:
+        """
+        Remove committed deletes from the model / Удаление зафиксированных удалений из модели
+
+        Args:
+            rows: Deleted rows returned by the database / Удалённые строки, возвращённые базой данных
+        """
+        self._pending_writes.discard(self.sender())
+        try:
+            self._remove_deleted(rows)
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    @pyqtSlot(object)
+    @traced()
+    def _on_bulk_delete_finished(self, result: dict) -> None:
+        """
+        Remove committed bulk deletes from the model / Удаление зафиксированного массового удаления из модели
+
+        Args:
+            result: Result of _delete_many / Результат _delete_many
+        """
+        self._pending_writes.discard(self.sender())
+        try:
+            for record_id, message in result["failed"].items():
+                self.lg.warning(
+                    "%s: record %s not deleted: %s", self.table_name, record_id, message
+                )
+            if result["missing"]:
+                # Rows deleted elsewhere are still shown / Строки, удалённые в другом месте, ещё показаны
+                self.lg.debug("%s: model drifted, reloading.", self.table_name)
+                self.refresh_data()
+            elif result["deleted"]:
+                self._remove_deleted(result["deleted"])
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    def _remove_deleted(self, rows: list | None) -> None:
+        """
+        Remove deleted rows from the model in one pass / Удаление удалённых строк из модели за один проход
+
+        Falls back to a full reload when the model has drifted from the table.
+        Переходит к полной перезагрузке, если модель разошлась с таблицей.
+
+        Args:
+            rows: Deleted rows returned by the database / Удалённые строки, возвращённые базой данных
+        """
+        positions = [self.row_of(row["id"]) for row in rows or []]
+        if not self._can_patch(rows) or None in positions:
+            self.lg.debug("%s: model drifted, reloading.", self.table_name)
+            self.refresh_data()
+            return
+
+        self._remove_rows(positions)
+        self.data_changed.emit()
+        self.lg.debug("%s: deleted %s row(s).", self.table_name, len(positions))
+
+    @pyqtSlot(str)
+    def _on_bulk_delete_failed(self, message: str) -> None:
+        """
+        Forget a bulk delete whose transaction failed, the caller reports it / Забыть массовое удаление с неудавшейся транзакцией, о нём сообщает вызывающий
+
+        Args:
+            message: Error message / Сообщение об ошибке
+        """
+        self._pending_writes.discard(self.sender())
+        self.lg.critical("Internal error: %s.", message)
+
+    @pyqtSlot(str)
+    def _on_write_failed(self, message: str) -> None:
+        """
+        Report a failed insert or delete / Сообщение о неудачной вставке или удалении
+
+        Args:
+            message: Error message / Сообщение об ошибке
+        """
+        self._pending_writes.discard(self.sender())
+        self.lg.critical("Internal error: %s.", message)
+        self.write_failed.emit(message)
+
+    # ===== PRIVATE METHODS - REMOTE CHANGES / ПРИВАТНЫЕ МЕТОДЫ - УДАЛЁННЫЕ ИЗМЕНЕНИЯ =====
+
+    @pyqtSlot(str, object)
+    @traced()
+    def _on_remote_change(self, table: str, changes: dict | None) -> None:
+        """
+        Apply rows changed by another client / Применение строк, изменённых другим клиентом
+
+        Deleted rows are removed at once; inserted and updated rows are re-read with the current filters
+        in one query, so the cost follows the number of changed rows, not the table size.
+        Big batches, TRUNCATE and changes during a reload fall back to a full reload.
+
+        Удалённые строки убираются сразу; вставленные и изменённые строки перечитываются с текущими фильтрами
+        одним запросом, поэтому стоимость зависит от числа изменённых строк, а не от размера таблицы.
+        Большие пакеты, TRUNCATE и изменения во время перезагрузки приводят к полной перезагрузке.
+
+        Args:
+            table: Changed table / Изменённая таблица
+            changes: {id: operation} from ChangeListener, None if the whole table changed /
+                     {id: операция} от ChangeListener, None если изменилась вся таблица
+        """
+        if table != self.table_name:
+            return
+        try:
+            if (
+                changes is None
+                or len(changes) > self.appcfg.perf_settings["live_refresh_max_rows"]
+                or self._refresh_handle is not None
+                or not self.column_names
+            ):
+                self.refresh_data()
+                return
+
+            positions = [
+                self.row_of(record_id)
+                for record_id, operation in changes.items()
+                if operation == "DELETE"
+            ]
+            positions = [row for row in positions if row is not None]
+            self._remove_rows(positions)
+            if positions:
+                self.data_changed.emit()
+
+            record_ids = [
+                record_id for record_id, operation in changes.items() if operation != "DELETE"
+            ]
+            if record_ids:
+                # Only the server knows if changed rows still match the filters /
+                # Только сервер знает, подходят ли изменённые строки под фильтры
+                criteria = self.criteria.copy().where("id", "IN", record_ids)
+                query, params = AdvancedQueryBuilder.select(
+                    self.table_name, criteria, trigram=Schema.trigram_available()
+                )
+                handle = self.executor.execute(self.condb, query, params)
+                handle.finished.connect(self._on_remote_rows)
+                handle.failed.connect(self._on_remote_failed)
+                self._pending_patches[handle] = record_ids
+            self.lg.debug("%s: %s remote change(s).", self.table_name, len(changes))
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    @pyqtSlot(object)
+    @traced()
+    def _on_remote_rows(self, rows: list | None) -> None:
+        """
+        Patch the model with re-read rows / Точечное обновление модели перечитанными строками
+
+        Args:
+            rows: Changed rows that match the filters / Изменённые строки, подходящие под фильтры
+        """
+        record_ids = self._pending_patches.pop(self.sender(), None)
+        if record_ids is None:
+            return
+        try:
+            rows = rows or []
+            if rows and not self._can_patch(rows):
+                self.lg.debug("%s: model drifted, reloading.", self.table_name)
+                self.refresh_data()
+                return
+
+            changed = False
+            new_rows = []
+            for record in rows:
+                row = self.row_of(record["id"])
+                if row is None:
+                    new_rows.append(tuple(record.values()))
+                # Local edits of the row win until they commit / Локальные правки строки главнее до их фиксации
+                elif not any(index.row() == row for index, _ in self._pending_updates.values()):
+                    changed = self._sync_row(row, record) or changed
+
+            # Rows that no longer match the filters / Строки, больше не подходящие под фильтры
+            found = {record["id"] for record in rows}
+            positions = [
+                self.row_of(record_id) for record_id in record_ids if record_id not in found
+            ]
+            positions = [row for row in positions if row is not None]
+            if positions:
+                self._remove_rows(positions)
+                changed = True
+
+            if new_rows and self.PAGED and not self._pages_exhausted:
+                self._place_new_rows([row[0] for row in new_rows])
+                new_rows = []
+            if new_rows:
+                self._append_rows(new_rows)
+                changed = True
+
+            if changed:
+                self.data_changed.emit()
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    def _place_new_rows(self, record_ids: list) -> None:
+        """
+        Paged mode: check on the server whether new rows sort after the last loaded row /
+        Постраничный режим: проверка на сервере, идут ли новые строки после последней загруженной строки
+
+        Such rows are left to a later page. A row that sorts among the loaded ones cannot be placed
+        locally (the server collation decides the order), so the model is reloaded then.
+        Такие строки оставляются более поздней странице. Строку, попадающую среди загруженных, нельзя
+        разместить локально (порядок определяет сортировка сервера), поэтому тогда модель перезагружается.
+
+        Args:
+            record_ids: Ids of rows that are not loaded / Id незагруженных строк
+        """
+        criteria = self.criteria.copy().where("id", "IN", record_ids)
+        query, params = AdvancedQueryBuilder.select(
+            self.table_name, criteria, after=self._last_row, trigram=Schema.trigram_available()
+        )
+        handle = self.executor.execute(self.condb, query, params)
+        handle.finished.connect(self._on_new_rows_placed)
+        handle.failed.connect(self._on_remote_failed)
+        self._pending_patches[handle] = record_ids
+
+    @pyqtSlot(object)
+    def _on_new_rows_placed(self, rows: list | None) -> None:
+        """
+        Reload if some new rows sort among the loaded ones / Перезагрузка, если часть новых строк попадает среди загруженных
+
+        Args:
+            rows: New rows that sort after the last loaded row / Новые строки, идущие после последней загруженной строки
+        """
+        record_ids = self._pending_patches.pop(self.sender(), None)
+        if record_ids is None:
+            return
+        if len(rows or ()) < len(record_ids):
+            self.lg.debug("%s: new row(s) inside loaded pages, reloading.", self.table_name)
+            self.refresh_data()
+        else:
+            self.lg.debug("%s: new row(s) will load with a later page.", self.table_name)
+
+    @pyqtSlot(str)
+    def _on_remote_failed(self, message: str) -> None:
+        """
+        Reload when changed rows could not be re-read / Перезагрузка, если изменённые строки не удалось перечитать
+
+        Args:
+            message: Error message / Сообщение об ошибке
+        """
+        if self._pending_patches.pop(self.sender(), None) is None:
+            return
+        self.lg.error("Psycopg2 internal error: %s.", message)
+        self.refresh_data()
+
+    # ===== OVERRIDE METHODS - EDITING OPERATIONS / ПЕРЕОПРЕДЕЛЕННЫЕ МЕТОДЫ - ОПЕРАЦИИ РЕДАКТИРОВАНИЯ =====
+
+    def flags(self, index: QModelIndex):
+        """
+        Determine which cells can be edited / Определяет какие ячейки можно редактировать
+
+        Controls the editing behavior of individual cells in the table view.
+        ID column (first column) is read-only, other columns are editable.
+
+        Управляет поведением редактирования отдельных ячеек в представлении таблицы.
+        Столбец ID (первый столбец) только для чтения, остальные столбцы редактируемы.
+
+        Args:
+            index: Model index of the cell / Индекс модели ячейки
+
+        Returns:
+            Qt.ItemFlag: Flags determining cell behavior / Флаги, определяющие поведение ячейки
+        """
+        try:
+            if not index.isValid():
+                return Qt.ItemFlag.NoItemFlags
+
+            # ID column cannot be edited (assuming it's the first column) / ID колонку нельзя редактировать (предполагаем что это первая колонка)
+            if index.column() == 0:
+                return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+            # Other columns can be edited / Остальные колонки можно редактировать
+            return (
+                Qt.ItemFlag.ItemIsEnabled
+                | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsEditable
+            )
+        except Exception as e:
+            self.lg.error("Internal error: %s.", e)
+            return Qt.ItemFlag.NoItemFlags
+
+    @traced()
+    def setData(
+        self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        """
+        Handle cell data changes / Обработка изменения данных в ячейке
+
+        Processes user edits in table cells and updates the corresponding database record.
+        Validates the index and value before executing the update query.
+        Emits data_changed signal on successful update.
+
+        Обрабатывает пользовательские правки в ячейках таблицы и обновляет соответствующую запись базы данных.
+        Проверяет индекс и значение перед выполнением запроса обновления.
+        Испускает сигнал data_changed при успешном обновлении.
+
+        Args:
+            index: Model index of the edited cell / Индекс модели редактируемой ячейки
+            value: New value for the cell / Новое значение для ячейки
+            role: Data role (usually EditRole) / Роль данных (обычно EditRole)
+
+        Returns:
+            bool: True if update successful, False otherwise / True если обновление успешно, False в противном случае
+        """
+        # Only process edit role changes on valid indices / Обрабатывать только изменения роли редактирования для действительных индексов
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+
+        try:
+            # Clean and validate new value / Очистка и валидация нового значения
+            new_value = str(value).strip()
+            column_name = self.column_names[index.column()]
+
+            if not self._validate_data(column_name, new_value):
+                return False
+
+            # Get record ID from first column / Получаем ID записи (первая колонка)
+            record_id = self.record_id(index.row())
+            if record_id is None:
+                self.lg.error("%s Model: no id item in setData.", self.table_name)
+                return False
+
+            # Collect all row data for update query / Сбор всех данных строки для запроса обновления
+            row_data = []
+            for col_idx in range(
+                1, self.columnCount()
+            ):  # Skip ID column (column 0) / Пропускаем ID (колонка 0)
+                if col_idx == index.column():
+                    row_data.append(
+                        new_value
+                    )  # Use new value / Используем новое значение
+                else:
+                    row_data.append(self.cell_text(index.row(), col_idx))
+
+            # Update model right away, the database update runs in the background /
+            # Модель обновляется сразу, обновление базы данных выполняется в фоне
+            old_value = self.data(index, Qt.ItemDataRole.EditRole)
+            if not self._store_cell(index, value):
+                return False
+
+            # Execute database update / Выполнение обновления базы данных
+            handle = self.executor.execute(
+                self.condb, self.queries["update"], (*row_data, record_id)
+            )
+            handle.finished.connect(self._on_update_finished)
+            handle.failed.connect(self._on_update_failed)
+            self._pending_updates[handle] = (QPersistentModelIndex(index), old_value)
+
+            self.data_changed.emit()
+            self.lg.debug(
+                "%s Model: updating %s for record %s.",
+                self.table_name,
+                column_name,
+                record_id,
+            )
+
+            return True
+
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+            # Show user-friendly error message / Показать удобное для пользователя сообщение об ошибке
+            QMessageBox.warning(
+                None, "Update error", f"Record could not be updated: {str(e)}"
+            )
+            return False
+
+    @pyqtSlot(object)
+    @traced()
+    def _on_update_finished(self, rows: list | None) -> None:
+        """
+        Sync the row with its committed state / Синхронизация строки с её зафиксированным состоянием
+
+        Args:
+            rows: Updated row returned by the database / Обновлённая строка, возвращённая базой данных
+        """
+        pending = self._pending_updates.pop(self.sender(), None)
+        try:
+            if not self._can_patch(rows):
+                # Record was deleted elsewhere or model is reloading / Запись удалена в другом месте или модель перезагружается
+                self.lg.debug("%s: model drifted, reloading.", self.table_name)
+                self.refresh_data()
+                return
+
+            row = self.row_of(rows[0]["id"])
+            if pending is None or row is None:
+                return
+            # Newer edits of the same row win until they commit / Более новые правки той же строки главнее до их фиксации
+            if any(index.row() == row for index, _ in self._pending_updates.values()):
+                return
+
+            if self._sync_row(row, rows[0]):
+                self.data_changed.emit()
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+
+    def _sync_row(self, row: int, record: dict) -> bool:
+        """
+        Store the committed values of a record in its row / Запись зафиксированных значений записи в её строку
+
+        Args:
+            row: Model row of the record / Строка модели с записью
+            record: Row returned by the database / Строка, возвращённая базой данных
+
+        Returns:
+            bool: True if a cell changed / True если ячейка изменилась
+        """
+        changed = False
+        for col_idx, value in enumerate(record.values()):
+            text = "" if value is None else str(value)
+            if col_idx and self.cell_text(row, col_idx) != text:
+                changed = self._store_value(row, col_idx, text) or changed
+        return changed
+
+    @pyqtSlot(str)
+    def _on_update_failed(self, message: str) -> None:
+        """
+        Revert a cell whose database update failed / Откат ячейки, обновление которой в БД не удалось
+
+        Args:
+            message: Error message / Сообщение об ошибке
+        """
+        pending = self._pending_updates.pop(self.sender(), None)
+        self.lg.critical("Internal error: %s.", message)
+        if pending is not None:
+            index, old_value = pending
+            if index.isValid():
+                self._store_cell(QModelIndex(index), old_value)
+                self.data_changed.emit()
+        # Show user-friendly error message / Показать удобное для пользователя сообщение об ошибке
+        QMessageBox.warning(None, "Update error", f"Record could not be updated: {message}")
+
+    def _validate_data(self, column_name: str, value: str) -> bool:
+        """
+        Базовая валидация данных
+        Переопределяется в наследниках для специфичной валидации
+
+        Args:
+            column_name: Имя колонки
+            value: Значение для валидации
+
+        Returns:
+            bool: True если валидация прошла успешно
+        """
+        try:
+            # Проверка на пустоту нового значения колонки, для обязательно заполненных полей
+            if not value and column_name in ["f_fio", "f_title"]:
+                self.lg.debug(
+                    "Input FIO or Title in field %s, this is necessary!", column_name
+                )
+                QMessageBox.warning(
+                    None,
+                    "Input necessary fields!!!",
+                    f"Field {column_name} necessary to input!!!",
+                )
+                return False
+
+            self.lg.debug("Validation success.")
+            return True
+        except Exception as e:
+            self.lg.critical("Internal error: %s.", e)
+            return False
@@ -1,12 +1,20 @@
 # ===== MAIN APPLICATION CLASS / ГЛАВНЫЙ КЛАСС ПРИЛОЖЕНИЯ =====
 
 # ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import threading
+
 # PyQt6 core imports for application framework /
 # Импорты PyQt6 для фреймворка приложения
 from PyQt6.QtWidgets import QApplication  # type: ignore
 
 # Local logging system import / Импорт локальной системы логирования
+from src.config.AppConfig import AppConfig
 from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+from src.core.StartupProfiler import StartupProfiler
+from src.core.Tracer import Tracer
+from src.core.Watchdog import Watchdog
 
 
 # ===== APPLICATION CLASS / КЛАСС ПРИЛОЖЕНИЯ =====
@@ -19,6 +27,7 @@ class Application(QApplication):
     - Centralized logging initialization / Централизованная инициализация логирования
     - Application-wide resource management / Управление ресурсами в масштабе приложения
     - Event loop management / Управление циклом событий
+    - Database warm-up after the window is shown / Прогрев БД после показа окна
     """
 
     # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
@@ -42,3 +51,74 @@ class Application(QApplication):
         # Логирование событий запуска приложения для отладки
         self.lg.debug("Constructor launched.")
         self.lg.debug("Logger created.")
+
+        # ===== SETTINGS WATCHER / НАБЛЮДЕНИЕ ЗА НАСТРОЙКАМИ =====
+        # Edits of the settings files apply without a restart / Правки файлов настроек применяются без перезапуска
+        AppConfig().start_watching()
+        self.aboutToQuit.connect(AppConfig().stop_watching)
+
+        # ===== TRACING / ТРАССИРОВКА =====
+        # --trace or --trace=path.json records timing spans until exit, "tracing" in perf_settings.json too /
+        # --trace или --trace=путь.json записывает временные интервалы до выхода, "tracing" в perf_settings.json тоже
+        tracer = Tracer()
+        stall_threshold_ms = None
+        for arg in argv[1:]:
+            if arg == "--trace" or arg.startswith("--trace="):
+                tracer.enable(arg.partition("=")[2] or None)
+            elif arg.startswith("--stall-threshold-ms="):
+                try:
+                    stall_threshold_ms = int(arg.partition("=")[2])
+                except ValueError:
+                    self.lg.warning("Ignoring invalid option %s.", arg)
+
+        # ===== METRICS / МЕТРИКИ =====
+        # Periodic snapshots to logs/metrics-YYYY-MM-DD.jsonl / Периодические снимки в logs/metrics-YYYY-MM-DD.jsonl
+        Metrics().start_dumping()
+
+        # ===== GUI STALL WATCHDOG / СТОРОЖ ЗАВИСАНИЙ GUI =====
+        # Logs the GUI thread stack when the event loop is blocked, threshold is stall_threshold_ms
+        # in perf_settings.json or --stall-threshold-ms=N /
+        # Записывает стек GUI потока, когда цикл событий заблокирован, порог - stall_threshold_ms
+        # в perf_settings.json или --stall-threshold-ms=N
+        self.watchdog = Watchdog(stall_threshold_ms, parent=self)
+        self.watchdog.start()
+        self.aboutToQuit.connect(self.watchdog.stop)
+
+    # ===== DATABASE WARM-UP / ПРОГРЕВ БАЗЫ ДАННЫХ =====
+    def warm_up_database(self) -> threading.Thread:
+        """
+        Import the database driver and open the pool's connections in the background /
+        Импорт драйвера БД и открытие соединений пула в фоне
+
+        Nothing on the way to the first window imports psycopg2, so the first mode switch would pay
+        for the driver import and the connection handshake. Called once the window is shown,
+        this moves both onto a daemon thread; a mode opened meanwhile simply waits for the pool.
+        The thread ends the startup profile (--profile-startup).
+
+        Ничто на пути к первому окну не импортирует psycopg2, поэтому первое переключение режима платило бы
+        за импорт драйвера и установку соединения. Вызванный после показа окна, этот метод переносит
+        и то, и другое в поток-демон; открытый в это время режим просто ждёт пул.
+        Поток завершает профиль запуска (--profile-startup).
+
+        Returns:
+            threading.Thread: Started warm-up thread / Запущенный поток прогрева
+        """
+        thread = threading.Thread(
+            target=self._warm_up_database, name="db-warm-up", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _warm_up_database(self) -> None:
+        """Warm-up thread body / Тело потока прогрева"""
+        profiler = StartupProfiler()
+        started = profiler.start()
+        try:
+            # First import of the driver happens here / Первый импорт драйвера происходит здесь
+            from src.database.ConnectionPool import ConnectionPool
+
+            ConnectionPool().warm_up()
+        except Exception as e:
+            self.lg.error("Internal error: %s.", e)
+        profiler.finish("db warm-up", started)
+        profiler.report()
@@ -0,0 +1,297 @@
+# ===== BACKGROUND LOG WRITER / ФОНОВАЯ ЗАПИСЬ ЛОГОВ =====
+# Moves console output and JSONL file writes of the Logger to a background thread
+# Переносит вывод в консоль и запись JSONL файла логгера в фоновый поток
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import atexit
+import datetime
+import json
+import queue
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+
+# ===== LOG WRITER CLASS / КЛАСС ЗАПИСИ ЛОГОВ =====
+class LogWriter:
+    """
+    Asynchronous JSONL log writer / Асинхронная запись логов JSONL
+
+    Log records are put into a bounded queue and written by one daemon thread that keeps
+    the log file open, so a log call never waits for the disk.
+    - Records are written in batches and flushed after every batch or on a timer / Записи пишутся пачками и сбрасываются после каждой пачки или по таймеру
+    - The file is rotated by size and when the date changes / Файл ротируется по размеру и при смене даты
+    - A full queue drops DEBUG/INFO records at once, WARN and above wait briefly first /
+      Полная очередь сразу отбрасывает записи DEBUG/INFO, WARN и выше сначала недолго ждут
+    - Dropped records are counted and reported in the log itself / Отброшенные записи считаются и сообщаются в самом логе
+
+    Записи логов кладутся в ограниченную очередь и пишутся одним фоновым потоком, который держит
+    файл логов открытым, поэтому вызов логгера никогда не ждёт диск.
+
+    ! Internal errors of the writer are printed to the console only. /
+    ! Внутренние ошибки записи выводятся только в консоль.
+    """
+
+    # ===== DEFAULT WRITER SETTINGS / НАСТРОЙКИ ЗАПИСИ ПО УМОЛЧАНИЮ =====
+    QUEUE_SIZE = 10000  # Records waiting for the writer / Записей в ожидании записи
+    BATCH_SIZE = 500  # Records written per flush / Записей за один сброс
+    FLUSH_INTERVAL = 0.5  # Seconds between timer flushes / Секунд между сбросами по таймеру
+    MAX_BYTES = 10 * 1024 * 1024  # File size that triggers rotation / Размер файла, вызывающий ротацию
+    BLOCK_TIMEOUT = 0.05  # Wait for WARN and above on a full queue / Ожидание для WARN и выше при полной очереди
+    # Levels worth waiting for on a full queue / Уровни, ради которых стоит подождать при полной очереди
+    _IMPORTANT = frozenset(("WARN", "ERROR", "CRIT"))
+
+    _STOP = object()  # Queue sentinel / Маркер остановки очереди
+
+    # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
+    def __init__(self, log_dir: Path, echo: bool = True, queue_size: int | None = None):
+        """
+        Start the writer thread / Запуск потока записи
+
+        The first file is opened by the thread with the first batch, so creating the writer does no file I/O.
+        Первый файл открывает поток вместе с первой пачкой, поэтому создание записи не выполняет файловый ввод-вывод.
+
+        Args:
+            log_dir (Path): Directory for log files / Папка для файлов логов
+            echo (bool): Also print records to stderr / Также выводить записи в stderr
+            queue_size (int, optional): Records waiting for the writer, QUEUE_SIZE if None /
+                                        Записей в ожидании записи, QUEUE_SIZE если None
+        """
+        self.log_dir = Path(log_dir)
+        self.echo = echo
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size or self.QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # ===== CURRENT FILE / ТЕКУЩИЙ ФАЙЛ =====
+        self._file = None
+        self._date = ""
+        self._sequence = 0
+        self._size = 0
+        self.path: Path | None = None
+
+        # ===== STATISTICS / СТАТИСТИКА =====
+        self._stats = {
+            "written": 0,
+            "dropped": 0,
+            "waited": 0,
+            "rotations": 0,
+            "failed": 0,
+        }
+        self._reported_drops = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="LogWriter", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def write(self, record: dict) -> None:
+        """
+        Queue a record for writing / Постановка записи в очередь на запись
+
+        Args:
+            record (dict): Log record, must not be changed afterwards / Запись лога, не должна меняться после
+        """
+        if self._closed:
+            # Late records after shutdown are written directly / Поздние записи после остановки пишутся напрямую
+            self._write_batch([record])
+            return
+
+        try:
+            self._queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if record.get("level") in self._IMPORTANT:
+            self._count("waited")
+            try:
+                self._queue.put(record, timeout=self.BLOCK_TIMEOUT)
+                return
+            except queue.Full:
+                pass
+        self._count("dropped")
+
+    def set_queue_size(self, size: int) -> None:
+        """
+        Change the queue bound while running / Изменение границы очереди во время работы
+
+        Records already queued are kept even if there are more than the new bound.
+        Уже стоящие в очереди записи сохраняются, даже если их больше новой границы.
+
+        Args:
+            size (int): Records waiting for the writer / Записей в ожидании записи
+        """
+        with self._queue.mutex:
+            self._queue.maxsize = size
+            self._queue.not_full.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of writer statistics / Снимок статистики записи
+
+        Returns:
+            dict: Counters, queue length and current file / Счётчики, длина очереди и текущий файл
+        """
+        with self._lock:
+            snapshot: dict[str, Any] = dict(self._stats)
+        snapshot["queued"] = self._queue.qsize()
+        snapshot["file"] = str(self.path) if self.path else None
+        return snapshot
+
+    def close(self) -> None:
+        """
+        Write out queued records and close the file / Запись оставшихся записей и закрытие файла
+        """
+        if self._closed:
+            return
+        try:
+            self._queue.put(self._STOP, timeout=1.0)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=2.0)
+        self._closed = True
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    # ===== PRIVATE METHODS - THREAD / ПРИВАТНЫЕ МЕТОДЫ - ПОТОК =====
+
+    def _run(self) -> None:
+        """
+        Writer thread loop / Цикл потока записи
+        """
+        while True:
+            try:
+                first = self._queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                # Timer tick: report drops while idle / Тик таймера: сообщение об отброшенных записях в простое
+                self._report_drops()
+                continue
+
+            if first is self._STOP:
+                break
+            batch = [first]
+            stop = False
+            # Take what is already queued, up to one batch / Забираем уже накопившееся, до одной пачки
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+            self._report_drops()
+            if stop:
+                break
+
+    def _write_batch(self, batch: list) -> None:
+        """
+        Write records to the console and the file, then flush / Запись в консоль и файл, затем сброс
+
+        Args:
+            batch: Log records / Записи лога
+        """
+        lines = []
+        for record in batch:
+            if self.echo:
+                print(record, file=sys.stderr)
+            lines.append(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        data = "".join(lines)
+
+        with self._lock:
+            try:
+                self._rotate_if_needed(len(data.encode("utf-8")))
+                self._file.write(data)  # type: ignore
+                self._file.flush()  # type: ignore
+                self._size += len(data.encode("utf-8"))
+                self._stats["written"] += len(batch)
+            except Exception as e:
+                self._stats["failed"] += len(batch)
+                print(f"LogWriter internal error: {e}", file=sys.stderr)
+
+    def _report_drops(self) -> None:
+        """
+        Log how many records were dropped since the last report / Запись в лог числа отброшенных с прошлого отчёта записей
+        """
+        with self._lock:
+            dropped = self._stats["dropped"] - self._reported_drops
+            self._reported_drops = self._stats["dropped"]
+            waited = self._stats["waited"]
+        if dropped <= 0:
+            return
+        self._write_batch(
+            [
+                {
+                    "timestamp": datetime.datetime.now().strftime("%H:%M:%S.%f"),
+                    "level": "WARN",
+                    "filename": Path(__file__).name,
+                    "module": __name__,
+                    "class": self.__class__.__name__,
+                    "def": "_report_drops",
+                    "message": f"Log queue full: dropped {dropped} records "
+                    f"(total dropped {self._reported_drops}, waited {waited}).",
+                }
+            ]
+        )
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    # ===== PRIVATE METHODS - FILES / ПРИВАТНЫЕ МЕТОДЫ - ФАЙЛЫ =====
+
+    def _rotate_if_needed(self, incoming: int) -> None:
+        """
+        Open a file for the first batch, switch to the next one on a new date or when the size limit is reached /
+        Открытие файла для первой пачки, переход к следующему при новой дате или при достижении лимита размера
+
+        ! Called with the lock held. / ! Вызывается под блокировкой.
+        """
+        today = datetime.date.today().isoformat()
+        if self._file is None:
+            self._open_next()
+        elif today != self._date or (self._size and self._size + incoming > self.MAX_BYTES):
+            self._stats["rotations"] += 1
+            self._open_next()
+
+    def _open_next(self) -> None:
+        """
+        Open the next free log file YYYY-MM-DD-XX.jsonl / Открытие следующего свободного файла логов YYYY-MM-DD-XX.jsonl
+
+        The file is created exclusively, so the number is taken from the first name that does not exist yet
+        without listing the directory, and two running programs never share a file.
+        Файл создаётся эксклюзивно, поэтому номер берётся из первого ещё не существующего имени
+        без просмотра папки, и две запущенные программы никогда не делят один файл.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        today = datetime.date.today().isoformat()
+        if today != self._date:
+            self._date = today
+            self._sequence = 0
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            self._sequence += 1
+            path = self.log_dir / f"{self._date}-{self._sequence:02d}.jsonl"
+            try:
+                self._file = open(path, "x", encoding="utf-8")
+                break
+            except FileExistsError:
+                continue
+
+        self.path = path
+        self._size = 0
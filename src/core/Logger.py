@@ -5,10 +5,9 @@
 # ===== IMPORTS / ИМПОРТЫ =====
 import datetime
 from pathlib import Path
-import os
 import sys
-import inspect
 from src.config.AppConfig import AppConfig
+from src.core.LogWriter import LogWriter
 
 
 # ===== LOGGER CLASS / КЛАСС ЛОГГЕРА =====
@@ -32,6 +31,13 @@ class Logger:
         False  # Single initialization flag / Флаг на единственную инициализацию
     )
 
+    # ===== CALLER METADATA CACHE / КЭШ МЕТАДАННЫХ ВЫЗЫВАЮЩЕГО КОДА =====
+    # code object -> (file name, module, function, takes self) / объект кода -> (имя файла, модуль, функция, принимает self)
+    _CALLERS: dict = {}
+    # Frames between the caller and _univ_log: caller -> debug/info/... -> _univ_log /
+    # Кадры между вызывающим кодом и _univ_log: вызывающий -> debug/info/... -> _univ_log
+    _CALLER_DEPTH = 2
+
     # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
     def __new__(cls):
         """
@@ -78,93 +84,160 @@ class Logger:
             # Load application configuration for logging settings / Загрузка конфигурации приложения для настроек логирования
             self._appcfg = AppConfig()
 
-            # ===== DATE AND FILE SETUP / НАСТРОЙКА ДАТЫ И ФАЙЛОВ =====
-            # Current date for log file naming / Текущая дата для именования файлов логов
-            self._DATE = f"{datetime.datetime.now().strftime('%Y-%m-%d')}"
-            # Log file name for program runtime, to avoid creating new ones / Имя файла логов на время выполнения программы, чтобы новые не создавать
-            self._DEF_STRUCTURE = {}
-            self._NAME_OF_LOG = self._name_of_logs()
+            # ===== LEVEL SETUP / НАСТРОЙКА УРОВНЕЙ =====
+            # Enabled levels are resolved once, log calls read plain attributes /
+            # Включённые уровни определяются один раз, вызовы логгера читают простые атрибуты
+            self._enabled: dict[str, bool] = {}
+            self.refresh_levels()
+            # Level changes in lg_settings.json apply live / Изменения уровня в lg_settings.json применяются на лету
+            self._appcfg.subscribe(
+                self._appcfg.save_set_lg_file, lambda lg_all_set: self.refresh_levels()  # type: ignore
+            )
+
+            # ===== FILE SETUP / НАСТРОЙКА ФАЙЛОВ =====
+            # Background writer owns the log file for program runtime / Фоновая запись владеет файлом логов на время выполнения программы
+            self._writer = self._start_writer()
+            self._report_perf_errors()
+            # Queue size changes in perf_settings.json apply live / Изменения размера очереди в perf_settings.json применяются на лету
+            self._appcfg.subscribe(self._appcfg.save_set_perf_file, self._apply_perf)
             # Temporary buffer for log data / Временный буфер для данных логов
             self._lg_var = {}
 
     # ===== PRIVATE METHODS - FILE MANAGEMENT / ПРИВАТНЫЕ МЕТОДЫ - УПРАВЛЕНИЕ ФАЙЛАМИ =====
 
-    def _name_of_logs(self) -> Path | None:
+    def _start_writer(self) -> LogWriter | None:
         """
-        Create unique log file name based on date and sequence / Создание уникального имени файла логов на основе даты и последовательности
+        Start the background log writer / Запуск фоновой записи логов
 
-        Generates log file names with format: YYYY-MM-DD-XX.json where XX is a sequence number.
-        This prevents overwriting existing log files and maintains chronological order.
+        The writer opens the next free file YYYY-MM-DD-XX.jsonl in the log directory and rotates it
+        by size and date. See LogWriter for details.
 
-        Генерирует имена файлов логов в формате: YYYY-MM-DD-XX.json, где XX - порядковый номер.
-        Это предотвращает перезапись существующих файлов логов и поддерживает хронологический порядок.
+        Запись открывает следующий свободный файл YYYY-MM-DD-XX.jsonl в папке логов и ротирует его
+        по размеру и дате. Подробнее см. LogWriter.
 
         Returns:
-            Path: Complete path to the new log file
+            LogWriter: Started writer, None on failure / Запущенная запись, None при ошибке
         """
         try:
-            # Get list of existing log files / Получение списка существующих файлов логов
-            logs_list = os.listdir(self._appcfg.save_lg_dir)
-
-            # If no files in directory, set name with 01 / Если файлов в директории нет, задаём имя с 01
-            if len(logs_list) < 1:
-                save_file_name = Path(
-                    f"{self._appcfg.save_lg_dir}/{self._DATE}-{"01"}.jsonl"
-                )
-            else:
-                # Otherwise give name + 1 from existing maximum in directory / Иначе выдаём имя + 1 от существующего максимального в директории
-                # Create list with sequential values 01, 02, etc. / Создание списка с последовательными значениями 01, 02 и т.д.
-                name_logs_list = []
-                for i in logs_list:
-                    name_logs_list.append(i[11:13])
-
-                # Format sequence number with leading zero if needed / Форматирование порядкового номера с ведущим нулем при необходимости
-                next_sequence = int(max(name_logs_list)) + 1
-                if next_sequence < 10:
-                    save_file_name = Path(
-                        f"{self._appcfg.save_lg_dir}/{self._DATE}-0{next_sequence}.jsonl"
-                    )
-                else:
-                    save_file_name = Path(
-                        f"{self._appcfg.save_lg_dir}/{self._DATE}-{next_sequence}.jsonl"
-                    )
-
-            return save_file_name
+            return LogWriter(
+                self._appcfg.save_lg_dir,
+                queue_size=self._appcfg.perf_settings["log_queue_size"],
+            )
         except Exception as e:
             # Set error flag and log to console as fallback / Установка флага ошибки и логирование в консоль как резервный вариант
             self._internal_error_occurred = True
-            self.critical(f"Internal error: {e}")
+            self.critical("Internal error: %s", e)
+            return None
+
+    def _apply_perf(self, perf: dict) -> None:
+        """
+        Apply log_queue_size from perf_settings.json / Применение log_queue_size из perf_settings.json
+        """
+        if self._writer is not None:
+            self._writer.set_queue_size(perf["log_queue_size"])
+        self._report_perf_errors()
+
+    def _report_perf_errors(self) -> None:
+        """
+        Log problems of perf_settings.json, AppConfig itself has no logger /
+        Запись в лог проблем perf_settings.json, у самого AppConfig нет логгера
+        """
+        for error in self._appcfg.perf_errors:
+            self.warning("Invalid performance setting: %s.", error)
 
     # ===== PRIVATE METHODS - CORE LOGGING / ПРИВАТНЫЕ МЕТОДЫ - ОСНОВНОЕ ЛОГИРОВАНИЕ =====
 
-    def _univ_log(self, message: str, tag: str) -> None:
+    @staticmethod
+    def _format(message, args: tuple) -> str:
+        """
+        Build the message text / Построение текста сообщения
+
+        Args:
+            message: Text with %-style placeholders or a function returning the text /
+                     Текст с заполнителями %-стиля или функция, возвращающая текст
+            args (tuple): Placeholder values / Значения заполнителей
+
+        Returns:
+            str: Final message / Итоговое сообщение
+        """
+        if callable(message):
+            message = message()
+        if not args:
+            return message if type(message) is str else str(message)
+        try:
+            return str(message) % args
+        except (TypeError, ValueError):
+            # Broken format string must not lose the record / Неверная строка формата не должна терять запись
+            return f"{message} {args!r}"
+
+    def _caller(self, depth: int) -> tuple:
+        """
+        Describe the code that called the logger / Описание кода, вызвавшего логгер
+
+        Only the one needed frame is read with sys._getframe. File, module and function names
+        do not change for a code object, so they are resolved once and cached. Only the class
+        is looked up per call, because one method can run on instances of different subclasses.
+
+        Читается только один нужный кадр через sys._getframe. Имена файла, модуля и функции
+        не меняются для объекта кода, поэтому определяются один раз и кэшируются. Для каждого вызова
+        определяется только класс, потому что один метод может выполняться на экземплярах разных подклассов.
+
+        Args:
+            depth (int): Frames to skip above the method calling _caller /
+                         Количество кадров, пропускаемых над методом, вызвавшим _caller
+
+        Returns:
+            tuple: (file name, module, class name or None, function) / (имя файла, модуль, имя класса или None, функция)
+        """
+        try:
+            frame = sys._getframe(depth + 1)
+        except ValueError:
+            # Called from the bottom of the stack / Вызов со дна стека
+            return None, None, None, None
+
+        code = frame.f_code
+        meta = self._CALLERS.get(code)
+        if meta is None:
+            meta = (
+                Path(code.co_filename).name,
+                frame.f_globals.get("__name__"),
+                code.co_name,
+                # Only methods that take self can have a class / Класс может быть только у методов, принимающих self
+                code.co_argcount > 0 and code.co_varnames[0] == "self",
+            )
+            self._CALLERS[code] = meta
+
+        file_name, module, deff, takes_self = meta
+        cls_name = None
+        if takes_self:
+            cls_obj = frame.f_locals.get("self", None)
+            cls_name = cls_obj.__class__.__name__ if cls_obj is not None else None
+        return file_name, module, cls_name, deff
+
+    def _univ_log(self, message, args: tuple, tag: str) -> None:
         """
         Universal logging template to avoid code repetition / Универсальный шаблон логирования, чтобы не повторять код
 
-        Core logging method that handles timestamp generation, console output, and file writing.
+        Core logging method that handles timestamp generation and hands the record to the background writer.
         Provides protection against internal errors and recursion.
 
-        Основной метод логирования, который обрабатывает генерацию временных меток, вывод в консоль и запись в файл.
+        Основной метод логирования, который обрабатывает генерацию временных меток и передаёт запись фоновой записи.
         Обеспечивает защиту от внутренних ошибок и рекурсии.
 
         Args:
-            message (str): Message to log / Сообщение для логирования
+            message (str | Callable): Message or function returning it / Сообщение или функция, возвращающая его
+            args (tuple): Values for %-style placeholders / Значения для заполнителей %-стиля
             tag (str): Log level tag (DEBUG, INFO, etc.) / Тег уровня логирования (DEBUG, INFO и т.д.)
         """
-        stack = inspect.stack()
-        caller_frame = stack[2].frame
+        file_name, module, cls_name, deff = self._caller(self._CALLER_DEPTH)
 
         # Generate timestamp with millisecond precision / Генерация временной метки с точностью до миллисекунд
         current_time = datetime.datetime.now().strftime("%H:%M:%S.%f")
-        file_name = Path(inspect.getfile(caller_frame)).name
-        module = inspect.getmodule(
-            caller_frame
-        ).__name__  # pyright: ignore[reportOptionalMemberAccess]
-        deff = caller_frame.f_code.co_name
-        cls_obj = caller_frame.f_locals.get("self", None)
-        cls_name = cls_obj.__class__.__name__ if cls_obj else None
-
-        self._DEF_STRUCTURE = {
+
+        # Message text is built only for records that are written / Текст сообщения строится только для записываемых записей
+        message = self._format(message, args)
+
+        record = {
             "timestamp": current_time,
             "level": tag,
             "filename": file_name,
@@ -175,24 +248,78 @@ class Logger:
         }
 
         # Protection from internal class errors and recursion / Защита от внутренних ошибок класса и рекурсии
-        if self._internal_error_occurred:
-            print(self._DEF_STRUCTURE, file=sys.stderr)
+        if self._internal_error_occurred or self._writer is None:
+            print(record, file=sys.stderr)
             return
 
         try:
-            # Output to console for immediate feedback / Вывод в консоль для немедленной обратной связи
-            print(self._DEF_STRUCTURE, file=sys.stderr)
-            self._appcfg.save_to_file(
-                self._NAME_OF_LOG, self._DEF_STRUCTURE, jsonl=True  # type: ignore
-            )  # pyright: ignore[reportArgumentType]
+            # Console and file output happen on the writer thread / Вывод в консоль и файл выполняется в потоке записи
+            self._writer.write(record)
         except Exception as e:
             # Set error flag and attempt fallback logging / Установка флага ошибки и попытка резервного логирования
             self._internal_error_occurred = True
-            self.critical(f"Internal error: {e}")
+            self.critical("Internal error: %s", e)
+
+    # ===== PUBLIC METHODS - WRITER STATE / ПУБЛИЧНЫЕ МЕТОДЫ - СОСТОЯНИЕ ЗАПИСИ =====
+
+    def writer_stats(self) -> dict:
+        """
+        Statistics of the background writer / Статистика фоновой записи
+
+        Returns:
+            dict: Queue depth, written and dropped records / Глубина очереди, записанные и отброшенные записи
+        """
+        return self._writer.stats() if self._writer is not None else {}
+
+    # ===== PUBLIC METHODS - LEVEL CHECKS / ПУБЛИЧНЫЕ МЕТОДЫ - ПРОВЕРКА УРОВНЕЙ =====
+
+    def refresh_levels(self) -> None:
+        """
+        Re-read enabled levels from AppConfig / Повторное чтение включённых уровней из AppConfig
+
+        Called at init and whenever the log level setting changes.
+        Вызывается при инициализации и при каждом изменении настройки уровня логирования.
+        """
+        try:
+            current = self._appcfg.lg_lvl or 0
+            levels = self._appcfg.lg_all_set
+            enabled = {
+                name: current >= levels[name]
+                for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+            }
+        except Exception as e:
+            # Broken settings keep every level on and report to console / Сломанные настройки оставляют все уровни включёнными и сообщают в консоль
+            print(f"Logger internal error: {e}", file=sys.stderr)
+            enabled = dict.fromkeys(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"), True)
+
+        self._enabled = enabled
+        self._debug_on = enabled["DEBUG"]
+        self._info_on = enabled["INFO"]
+        self._warning_on = enabled["WARNING"]
+        self._error_on = enabled["ERROR"]
+        self._critical_on = enabled["CRITICAL"]
+
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check if a level is written / Проверка, записывается ли уровень
+
+        Use it to skip preparing expensive log data / Используется, чтобы не готовить дорогие данные для лога
+
+        Args:
+            level (str): DEBUG, INFO, WARNING, ERROR or CRITICAL / DEBUG, INFO, WARNING, ERROR или CRITICAL
+
+        Returns:
+            bool: True if the level is enabled / True если уровень включён
+        """
+        return self._enabled.get(level, False)
 
     # ===== PUBLIC METHODS - LOG LEVELS / ПУБЛИЧНЫЕ МЕТОДЫ - УРОВНИ ЛОГИРОВАНИЯ =====
+    # Messages take %-style args or a callable, so disabled levels cost one attribute check:
+    # Сообщения принимают аргументы %-стиля или функцию, поэтому выключенные уровни стоят одну проверку атрибута:
+    #     self.lg.debug("Add method received args: %s", args)
+    #     self.lg.debug(lambda: f"Rows: {expensive()}")
 
-    def debug(self, message="TEST, INPUT VALUE!!!", tag="DEBUG") -> None:
+    def debug(self, message="TEST, INPUT VALUE!!!", *args, tag="DEBUG") -> None:
         """
         Debug level logging / Логирование уровня отладки
 
@@ -204,12 +331,13 @@ class Logger:
 
         Args:
             message (str): Debug message to log / Отладочное сообщение для логирования
+            *args: Values for %-style placeholders in message / Значения для заполнителей %-стиля в message
             tag (str): Custom tag for the message / Пользовательский тег для сообщения
         """
-        if self._appcfg.lg_lvl >= self._appcfg.lg_all_set["DEBUG"]:
-            self._univ_log(message=message, tag=tag)
+        if self._debug_on:
+            self._univ_log(message, args, tag)
 
-    def info(self, message="TEST, INPUT VALUE!!!", tag="INFO") -> None:
+    def info(self, message="TEST, INPUT VALUE!!!", *args, tag="INFO") -> None:
         """
         Info level logging / Логирование информационного уровня
 
@@ -221,12 +349,13 @@ class Logger:
 
         Args:
             message (str): Information message to log / Информационное сообщение для логирования
+            *args: Values for %-style placeholders in message / Значения для заполнителей %-стиля в message
             tag (str): Custom tag for the message / Пользовательский тег для сообщения
         """
-        if self._appcfg.lg_lvl >= self._appcfg.lg_all_set["INFO"]:
-            self._univ_log(message=message, tag=tag)
+        if self._info_on:
+            self._univ_log(message, args, tag)
 
-    def warning(self, message="TEST, INPUT VALUE!!!", tag="WARN") -> None:
+    def warning(self, message="TEST, INPUT VALUE!!!", *args, tag="WARN") -> None:
         """
         Warning level logging / Логирование уровня предупреждений
 
@@ -238,12 +367,13 @@ class Logger:
 
         Args:
             message (str): Warning message to log / Предупреждающее сообщение для логирования
+            *args: Values for %-style placeholders in message / Значения для заполнителей %-стиля в message
             tag (str): Custom tag for the message / Пользовательский тег для сообщения
         """
-        if self._appcfg.lg_lvl >= self._appcfg.lg_all_set["WARNING"]:
-            self._univ_log(message=message, tag=tag)
+        if self._warning_on:
+            self._univ_log(message, args, tag)
 
-    def error(self, message="TEST, INPUT VALUE!!!", tag="ERROR") -> None:
+    def error(self, message="TEST, INPUT VALUE!!!", *args, tag="ERROR") -> None:
         """
         Error level logging / Логирование уровня ошибок
 
@@ -255,12 +385,13 @@ class Logger:
 
         Args:
             message (str): Error message to log / Сообщение об ошибке для логирования
+            *args: Values for %-style placeholders in message / Значения для заполнителей %-стиля в message
             tag (str): Custom tag for the message / Пользовательский тег для сообщения
         """
-        if self._appcfg.lg_lvl >= self._appcfg.lg_all_set["ERROR"]:
-            self._univ_log(message=message, tag=tag)
+        if self._error_on:
+            self._univ_log(message, args, tag)
 
-    def critical(self, message="TEST, INPUT VALUE!!!", tag="CRIT") -> None:
+    def critical(self, message="TEST, INPUT VALUE!!!", *args, tag="CRIT") -> None:
         """
         Critical level logging / Логирование критического уровня
 
@@ -272,10 +403,11 @@ class Logger:
 
         Args:
             message (str): Critical error message to log / Критическое сообщение об ошибке для логирования
+            *args: Values for %-style placeholders in message / Значения для заполнителей %-стиля в message
             tag (str): Custom tag for the message / Пользовательский тег для сообщения
         """
-        if self._appcfg.lg_lvl >= self._appcfg.lg_all_set["CRITICAL"]:
-            self._univ_log(message=message, tag=tag)
+        if self._critical_on:
+            self._univ_log(message, args, tag)
 
 
 # ===== MAIN EXECUTION BLOCK - FUNCTIONALITY TESTING / БЛОК ГЛАВНОГО ВЫПОЛНЕНИЯ - ПРОВЕРКА РАБОТОСПОСОБНОСТИ =====
@@ -0,0 +1,294 @@
+# ===== IN-PROCESS METRICS REGISTRY / РЕЕСТР МЕТРИК ВНУТРИ ПРОЦЕССА =====
+# Counters, latency histograms and gauges of the whole application
+# Счётчики, гистограммы задержек и показатели всего приложения
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import atexit
+import datetime
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable
+
+# Local application imports / Импорты локального приложения
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+
+
+# ===== HISTOGRAM CLASS / КЛАСС ГИСТОГРАММЫ =====
+class _Histogram:
+    """
+    Latency histogram over the most recent samples / Гистограмма задержек по последним замерам
+
+    Count, sum and max cover the whole run, percentiles cover the last SAMPLES values,
+    so a regression shows up quickly instead of being averaged away.
+    Количество, сумма и максимум охватывают весь запуск, процентили - последние SAMPLES значений,
+    поэтому регрессия видна быстро, а не растворяется в среднем.
+    """
+
+    __slots__ = ("count", "total", "max", "_samples")
+
+    SAMPLES = 2048  # Recent values kept for percentiles / Последних значений для процентилей
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._samples: deque = deque(maxlen=self.SAMPLES)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self._samples.append(value)
+
+    def summary(self) -> dict[str, Any]:
+        """Count, mean, p50/p90/p99 and max / Количество, среднее, p50/p90/p99 и максимум"""
+        ordered = sorted(self._samples)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50": percentile(0.50),
+            "p90": percentile(0.90),
+            "p99": percentile(0.99),
+            "max": round(self.max, 3),
+        }
+
+
+# ===== METRICS CLASS / КЛАСС МЕТРИК =====
+class Metrics:
+    """
+    Metrics registry / Реестр метрик
+    Singleton pattern implementation shared by all modules / Реализация паттерна Singleton, общая для всех модулей
+
+    - Counters: events and rows, e.g. query.count.Teacher / Счётчики: события и строки, например query.count.Teacher
+    - Histograms: latencies in ms, e.g. query.ms.Teacher / Гистограммы: задержки в мс, например query.ms.Teacher
+    - Gauges: callables returning current state, e.g. pool statistics / Показатели: функции, возвращающие текущее состояние, например статистика пула
+
+    Snapshots are appended to logs/metrics-YYYY-MM-DD.jsonl periodically and on exit,
+    so performance on user machines can be compared between versions.
+    Снимки периодически и при выходе добавляются в logs/metrics-YYYY-MM-DD.jsonl,
+    поэтому производительность на машинах пользователей можно сравнивать между версиями.
+    """
+
+    # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
+    _instanse_Metrics = None  # Stores single instance / Хранит единственный экземпляр
+    _initialized_Metrics = (
+        False  # Single initialization flag / Флаг на единственную инициализацию
+    )
+
+    # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
+    def __new__(cls):
+        """
+        Create single class instance / Создание единого объекта класса
+
+        Returns:
+            Metrics: Single instance of the metrics class
+        """
+        if cls._instanse_Metrics is None:
+            # If no class instance exists, create one / Если экземпляра класса нет создаём
+            cls._instanse_Metrics = super().__new__(cls)
+        return cls._instanse_Metrics
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self):
+        """
+        Initialize registry only once / Инициализация реестра только один раз
+        """
+        if Metrics._initialized_Metrics:
+            return
+        Metrics._initialized_Metrics = True
+
+        # ===== LOGGING SETUP / НАСТРОЙКА ЛОГИРОВАНИЯ =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        # ===== REGISTRY STATE / СОСТОЯНИЕ РЕЕСТРА =====
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._histograms: dict[str, _Histogram] = {}
+        self._gauges: dict[str, Callable[[], Any]] = {}
+        self._started = time.time()
+
+        # Log queue depth and drops / Глубина очереди логов и отброшенные записи
+        self.register_gauge("log_writer", self.lg.writer_stats)
+
+        # ===== SNAPSHOT DUMPS / ЗАПИСЬ СНИМКОВ =====
+        # Seconds between dumps, metrics_dump_interval_s in perf_settings.json /
+        # Секунд между записями, metrics_dump_interval_s в perf_settings.json
+        appcfg = AppConfig()
+        self.dump_interval = appcfg.perf_settings["metrics_dump_interval_s"]
+        appcfg.subscribe(appcfg.save_set_perf_file, self._apply_perf)
+        self._dump_thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    # ===== PUBLIC METHODS - RECORDING / ПУБЛИЧНЫЕ МЕТОДЫ - ЗАПИСЬ =====
+
+    def inc(self, name: str, value: int = 1) -> None:
+        """
+        Increase a counter / Увеличение счётчика
+
+        Args:
+            name (str): Counter name / Имя счётчика
+            value (int): Increment / Приращение
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value_ms: float) -> None:
+        """
+        Add a latency sample / Добавление замера задержки
+
+        Args:
+            name (str): Histogram name / Имя гистограммы
+            value_ms (float): Latency in milliseconds / Задержка в миллисекундах
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram()
+            histogram.add(value_ms)
+
+    def timer(self, name: str) -> "_Timer":
+        """
+        Context manager observing the duration of a block / Контекстный менеджер, замеряющий длительность блока
+
+        Example / Пример:
+            with Metrics().timer("model.rebuild_ms.Teacher"):
+                self._apply_rows(rows)
+        """
+        return _Timer(self, name)
+
+    def register_gauge(self, name: str, fn: Callable[[], Any]) -> None:
+        """
+        Register a function read on every snapshot / Регистрация функции, читаемой при каждом снимке
+
+        Args:
+            name (str): Gauge name / Имя показателя
+            fn: Function returning a number or a dict / Функция, возвращающая число или словарь
+        """
+        with self._lock:
+            self._gauges[name] = fn
+
+    # ===== PUBLIC METHODS - READING / ПУБЛИЧНЫЕ МЕТОДЫ - ЧТЕНИЕ =====
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Current values of all metrics / Текущие значения всех метрик
+
+        Returns:
+            dict: counters, histograms (with percentiles) and gauges / counters, histograms (с процентилями) и gauges
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {
+                name: histogram.summary() for name, histogram in self._histograms.items()
+            }
+            gauges = dict(self._gauges)
+
+        gauge_values = {}
+        for name, fn in gauges.items():
+            try:
+                gauge_values[name] = fn()
+            except Exception as e:
+                gauge_values[name] = f"error: {e}"
+
+        return {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "uptime_s": round(time.time() - self._started, 1),
+            "counters": dict(sorted(counters.items())),
+            "histograms": dict(sorted(histograms.items())),
+            "gauges": gauge_values,
+        }
+
+    def dump(self, path: str | Path | None = None) -> Path | None:
+        """
+        Append a snapshot as one JSON line / Добавление снимка одной строкой JSON
+
+        Args:
+            path: Target file, logs/metrics-YYYY-MM-DD.jsonl if None / Целевой файл, logs/metrics-YYYY-MM-DD.jsonl если None
+
+        Returns:
+            Path | None: Written file, None on error / Записанный файл, None при ошибке
+        """
+        if path is None:
+            path = AppConfig().save_lg_dir / f"metrics-{datetime.date.today().isoformat()}.jsonl"
+        path = Path(path)
+        try:
+            line = json.dumps(self.snapshot(), ensure_ascii=False, default=str)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            return path
+        except Exception as e:
+            self.lg.error("Internal error: %s.", e)
+            return None
+
+    def start_dumping(self, interval: float | None = None) -> None:
+        """
+        Dump snapshots periodically and on exit / Периодическая запись снимков и запись при выходе
+
+        Args:
+            interval (float, optional): Seconds between dumps / Секунд между записями
+        """
+        if interval is not None:
+            self.dump_interval = interval
+        if self._dump_thread is not None:
+            return
+        self._dump_thread = threading.Thread(
+            target=self._dump_loop, name="metrics-dump", daemon=True
+        )
+        self._dump_thread.start()
+        atexit.register(self.stop_dumping)
+
+    def stop_dumping(self) -> None:
+        """Stop periodic dumps and write the final snapshot / Остановка периодической записи и запись последнего снимка"""
+        if self._dump_thread is None:
+            return
+        self._stop_event.set()
+        self._dump_thread = None
+        self.dump()
+
+    # ===== PRIVATE METHODS / ПРИВАТНЫЕ МЕТОДЫ =====
+
+    def _apply_perf(self, perf: dict) -> None:
+        """
+        Apply metrics_dump_interval_s from perf_settings.json, used from the next dump /
+        Применение metrics_dump_interval_s из perf_settings.json, используется со следующей записи
+        """
+        self.dump_interval = perf["metrics_dump_interval_s"]
+
+    def _dump_loop(self) -> None:
+        """Dump thread loop / Цикл потока записи снимков"""
+        while not self._stop_event.wait(self.dump_interval):
+            self.dump()
+
+
+# ===== TIMER CLASS / КЛАСС ТАЙМЕРА =====
+class _Timer:
+    """Observes the duration of a with-block in ms / Замеряет длительность блока with в мс"""
+
+    __slots__ = ("_metrics", "_name", "_start")
+
+    def __init__(self, metrics: Metrics, name: str):
+        self._metrics = metrics
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._metrics.observe(self._name, (time.perf_counter() - self._start) * 1000)
+        return False
@@ -0,0 +1,158 @@
+# ===== STARTUP PROFILER / ПРОФИЛИРОВЩИК ЗАПУСКА =====
+# Time of each startup phase, printed with --profile-startup
+# Время каждой фазы запуска, выводится с --profile-startup
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library only, the profiler is imported before anything it measures /
+# Только стандартная библиотека, профилировщик импортируется раньше всего, что он измеряет
+import sys
+import threading
+import time
+
+
+# ===== STARTUP PROFILER CLASS / КЛАСС ПРОФИЛИРОВЩИКА ЗАПУСКА =====
+class StartupProfiler:
+    """
+    Phase timer of the startup pipeline / Таймер фаз конвейера запуска
+    Singleton pattern implementation shared by the entry point and Application / Реализация паттерна Singleton, общая для точки входа и Application
+
+    Foreground phases follow each other on the GUI thread, each mark() closes the phase since the previous one.
+    Background phases (e.g. the database warm-up) run alongside and are timed on their own.
+    Phases are always recorded, the breakdown is printed to stderr only when enabled.
+
+    Фазы переднего плана идут друг за другом в GUI потоке, каждый mark() закрывает фазу с предыдущей отметки.
+    Фоновые фазы (например, прогрев БД) идут параллельно и измеряются отдельно.
+    Фазы записываются всегда, разбивка выводится в stderr только если профилировщик включён.
+    """
+
+    # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
+    _instanse_StartupProfiler = None  # Stores single instance / Хранит единственный экземпляр
+    _initialized_StartupProfiler = (
+        False  # Single initialization flag / Флаг на единственную инициализацию
+    )
+
+    # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
+    def __new__(cls):
+        """
+        Create single class instance / Создание единого объекта класса
+
+        Returns:
+            StartupProfiler: Single instance of the profiler class
+        """
+        if cls._instanse_StartupProfiler is None:
+            # If no class instance exists, create one / Если экземпляра класса нет создаём
+            cls._instanse_StartupProfiler = super().__new__(cls)
+        return cls._instanse_StartupProfiler
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self):
+        """
+        Initialize profiler only once, the first call is the time origin /
+        Инициализация профилировщика только один раз, первый вызов - начало отсчёта
+        """
+        if StartupProfiler._initialized_StartupProfiler:
+            return
+        StartupProfiler._initialized_StartupProfiler = True
+
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._last = self._origin
+        # (phase, start ms, duration ms, background) in completion order /
+        # (фаза, начало мс, длительность мс, фоновая) в порядке завершения
+        self._phases: list[tuple[str, float, float, bool]] = []
+        self._reported = False
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def enable(self) -> None:
+        """Print the breakdown on report() / Вывод разбивки при report()"""
+        self.enabled = True
+
+    def mark(self, phase: str) -> float:
+        """
+        Close a foreground phase / Закрытие фазы переднего плана
+
+        Args:
+            phase (str): Name of the phase that just ended / Имя только что завершённой фазы
+
+        Returns:
+            float: Phase duration in ms / Длительность фазы в мс
+        """
+        now = time.perf_counter()
+        with self._lock:
+            start, self._last = self._last, now
+            duration = (now - start) * 1000
+            self._phases.append((phase, (start - self._origin) * 1000, duration, False))
+        return duration
+
+    def start(self) -> float:
+        """
+        Start time of a background phase, pass it to finish() / Время начала фоновой фазы, передаётся в finish()
+        """
+        return time.perf_counter()
+
+    def finish(self, phase: str, started: float) -> float:
+        """
+        Close a background phase / Закрытие фоновой фазы
+
+        Args:
+            phase (str): Phase name / Имя фазы
+            started (float): Value of start() / Значение start()
+
+        Returns:
+            float: Phase duration in ms / Длительность фазы в мс
+        """
+        now = time.perf_counter()
+        duration = (now - started) * 1000
+        with self._lock:
+            self._phases.append((phase, (started - self._origin) * 1000, duration, True))
+        return duration
+
+    def phases(self) -> list[tuple[str, float, float, bool]]:
+        """
+        Recorded phases / Записанные фазы
+
+        Returns:
+            list: (phase, start ms, duration ms, background) / (фаза, начало мс, длительность мс, фоновая)
+        """
+        with self._lock:
+            return list(self._phases)
+
+    def breakdown(self) -> str:
+        """
+        Breakdown table of the recorded phases / Таблица разбивки записанных фаз
+
+        Returns:
+            str: One line per phase, foreground total at the end / Строка на фазу, итог переднего плана в конце
+        """
+        phases = self.phases()
+        width = max([len(phase[0]) for phase in phases] + [len("total")]) + 13
+        lines = ["Startup profile (ms):"]
+        total = 0.0
+        for phase, start, duration, background in phases:
+            if background:
+                name = f"{phase} (background)"
+                lines.append(f"  {name:<{width}}{duration:9.1f}  from {start:.1f}")
+            else:
+                total = start + duration
+                lines.append(f"  {phase:<{width}}{duration:9.1f}")
+        lines.append(f"  {'total':<{width}}{total:9.1f}")
+        return "\n".join(lines)
+
+    def report(self) -> None:
+        """
+        Print and log the breakdown once, if enabled / Однократный вывод и запись разбивки в лог, если включено
+        """
+        with self._lock:
+            if not self.enabled or self._reported:
+                return
+            self._reported = True
+        text = self.breakdown()
+        print(text, file=sys.stderr)
+
+        # Logger is loaded by now, importing it here keeps this module free of dependencies /
+        # Logger к этому моменту загружен, импорт здесь оставляет модуль без зависимостей
+        from src.core.Logger import Logger
+
+        Logger().info(text)
@@ -0,0 +1,358 @@
+# ===== TIMING SPANS AND TRACE EXPORT / ВРЕМЕННЫЕ ИНТЕРВАЛЫ И ЭКСПОРТ ТРАССИРОВКИ =====
+# Records nested timing spans of the whole application as Chrome trace events
+# Записывает вложенные временные интервалы всего приложения как события трассировки Chrome
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import atexit
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Local application imports / Импорты локального приложения
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+
+
+# ===== SPAN CLASSES / КЛАССЫ ИНТЕРВАЛОВ =====
+class _NullSpan:
+    """Shared do-nothing span used while tracing is off / Общий пустой интервал, используемый при выключенной трассировке"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """
+    One timed span, written as a complete ("X") trace event on exit /
+    Один измеряемый интервал, записывается как полное ("X") событие трассировки при выходе
+    """
+
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start")
+
+    # Long argument values (SQL text) are cut / Длинные значения аргументов (текст SQL) обрезаются
+    MAX_ARG_LEN = 200
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: dict):
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end = time.perf_counter_ns()
+        args = {
+            key: value if isinstance(value, (int, float, bool)) or value is None
+            else str(value)[: self.MAX_ARG_LEN]
+            for key, value in self._args.items()
+        }
+        if exc_type is not None:
+            args["error"] = exc_type.__name__
+        self._tracer._complete(self._name, self._cat, self._start, end, args)
+        return False
+
+    def set(self, **args) -> None:
+        """Add arguments known only inside the span / Добавление аргументов, известных только внутри интервала"""
+        self._args.update(args)
+
+
+# ===== TRACER CLASS / КЛАСС ТРАССИРОВЩИКА =====
+class Tracer:
+    """
+    Application tracer / Трассировщик приложения
+    Singleton pattern implementation shared by all modules / Реализация паттерна Singleton, общая для всех модулей
+
+    Spans opened inside other spans on the same thread nest in the trace viewer, so one mode switch
+    shows the view setup, the model refresh and the SQL round trip on the worker thread as a tree.
+    The output is Chrome trace-event JSON for chrome://tracing, Perfetto or speedscope.
+    - Off by default, a disabled span is one attribute check / По умолчанию выключен, выключенный интервал - одна проверка атрибута
+    - Enabled with the --trace[=path] command line option / Включается параметром командной строки --trace[=путь]
+    - Written on exit to logs/trace-YYYY-MM-DD-HHMMSS.json / Записывается при выходе в logs/trace-YYYY-MM-DD-HHMMSS.json
+
+    Интервалы, открытые внутри других интервалов того же потока, вкладываются в просмотрщике, поэтому одно
+    переключение режима показывает настройку представления, обновление модели и обмен с SQL в рабочем потоке деревом.
+    Результат - JSON событий трассировки Chrome для chrome://tracing, Perfetto или speedscope.
+    """
+
+    # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
+    _instanse_Tracer = None  # Stores single instance / Хранит единственный экземпляр
+    _initialized_Tracer = (
+        False  # Single initialization flag / Флаг на единственную инициализацию
+    )
+
+    # ===== TRACER SETTINGS / НАСТРОЙКИ ТРАССИРОВЩИКА =====
+    # Class attribute, so traced() checks it without creating the instance /
+    # Атрибут класса, поэтому traced() проверяет его без создания экземпляра
+    enabled = False
+    MAX_EVENTS = 500000  # Events kept in memory, later ones are counted only / Событий в памяти, последующие только считаются
+
+    # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
+    def __new__(cls):
+        """
+        Create single class instance / Создание единого объекта класса
+
+        Returns:
+            Tracer: Single instance of the tracer class
+        """
+        if cls._instanse_Tracer is None:
+            # If no class instance exists, create one / Если экземпляра класса нет создаём
+            cls._instanse_Tracer = super().__new__(cls)
+        return cls._instanse_Tracer
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self):
+        """
+        Initialize tracer only once / Инициализация трассировщика только один раз
+        """
+        if Tracer._initialized_Tracer:
+            return
+        Tracer._initialized_Tracer = True
+
+        # ===== LOGGING SETUP / НАСТРОЙКА ЛОГИРОВАНИЯ =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        # ===== TRACE STATE / СОСТОЯНИЕ ТРАССИРОВКИ =====
+        self._lock = threading.Lock()
+        self._events: list[dict] = []
+        self._dropped = 0
+        self._named_threads: set[int] = set()
+        self._pid = os.getpid()
+        self._epoch = time.perf_counter_ns()
+        self.path: Path | None = None
+        self._exit_registered = False
+
+        # ===== LIVE SETTINGS / НАСТРОЙКИ НА ЛЕТУ =====
+        # "tracing" in perf_settings.json switches recording on and off /
+        # "tracing" в perf_settings.json включает и выключает запись
+        self._tracing_setting: bool | None = None
+        appcfg = AppConfig()
+        self._apply_perf(appcfg.perf_settings)
+        appcfg.subscribe(appcfg.save_set_perf_file, self._apply_perf)
+
+    # ===== PUBLIC METHODS - CONTROL / ПУБЛИЧНЫЕ МЕТОДЫ - УПРАВЛЕНИЕ =====
+
+    def enable(self, path: str | Path | None = None) -> Path:
+        """
+        Start recording spans / Начало записи интервалов
+
+        Args:
+            path: Output file, logs/trace-<date-time>.json if None / Файл вывода, logs/trace-<дата-время>.json если None
+
+        Returns:
+            Path: File the trace will be written to on exit / Файл, в который трассировка запишется при выходе
+        """
+        if path is None:
+            stamp = datetime.datetime.now().strftime("%Y-%m-%d-%H%M%S")
+            path = AppConfig().save_lg_dir / f"trace-{stamp}.json"
+        self.path = Path(path)
+        Tracer.enabled = True
+        if not self._exit_registered:
+            atexit.register(self.save)
+            self._exit_registered = True
+        self.lg.info("Tracing enabled, trace file: %s", self.path)
+        return self.path
+
+    def disable(self) -> None:
+        """Stop recording spans, recorded events are kept / Остановка записи интервалов, записанные события сохраняются"""
+        Tracer.enabled = False
+
+    # ===== PUBLIC METHODS - RECORDING / ПУБЛИЧНЫЕ МЕТОДЫ - ЗАПИСЬ =====
+
+    def span(self, name: str, cat: str = "app", **args):
+        """
+        Context manager timing a block / Контекстный менеджер, измеряющий блок
+
+        Example / Пример:
+            with Tracer().span("sql.execute", "db", sql=query):
+                cursor.execute(query)
+
+        Args:
+            name (str): Span name / Имя интервала
+            cat (str): Category for filtering in the viewer / Категория для фильтрации в просмотрщике
+            **args: Values shown with the span / Значения, показываемые с интервалом
+
+        Returns:
+            Context manager, a shared no-op one while tracing is off /
+            Контекстный менеджер, общий пустой при выключенной трассировке
+        """
+        if not Tracer.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def instant(self, name: str, cat: str = "app", **args) -> None:
+        """
+        Record a point-in-time event / Запись мгновенного события
+
+        Args:
+            name (str): Event name / Имя события
+            cat (str): Category / Категория
+            **args: Values shown with the event / Значения, показываемые с событием
+        """
+        if not Tracer.enabled:
+            return
+        self._add(
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "i",
+                "s": "t",
+                "ts": (time.perf_counter_ns() - self._epoch) / 1000,
+                "pid": self._pid,
+                "tid": threading.get_native_id(),
+                "args": {key: str(value) for key, value in args.items()},
+            }
+        )
+
+    def save(self, path: str | Path | None = None) -> Path | None:
+        """
+        Write recorded events as Chrome trace JSON / Запись событий как JSON трассировки Chrome
+
+        Args:
+            path: Output file, the enable() path if None / Файл вывода, путь из enable() если None
+
+        Returns:
+            Path | None: Written file, None if nothing was recorded / Записанный файл, None если ничего не записано
+        """
+        path = Path(path) if path is not None else self.path
+        with self._lock:
+            events = list(self._events)
+            dropped = self._dropped
+        if path is None or not events:
+            return None
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "traceEvents": events,
+                        "displayTimeUnit": "ms",
+                        "otherData": {"dropped_events": dropped},
+                    },
+                    f,
+                    ensure_ascii=False,
+                )
+            self.lg.info("Trace written: %s (%s events, %s dropped).", path, len(events), dropped)
+            return path
+        except Exception as e:
+            self.lg.error("Internal error: %s.", e)
+            return None
+
+    # ===== PRIVATE METHODS / ПРИВАТНЫЕ МЕТОДЫ =====
+
+    def _apply_perf(self, perf: dict) -> None:
+        """
+        Follow changes of the "tracing" setting / Следование изменениям настройки "tracing"
+
+        Only a change of the value acts, so --trace is not switched off by an unrelated settings edit.
+        Действует только изменение значения, поэтому --trace не выключается правкой других настроек.
+        """
+        tracing = perf["tracing"]
+        if tracing == self._tracing_setting:
+            return
+        first = self._tracing_setting is None
+        self._tracing_setting = tracing
+        if tracing:
+            if not Tracer.enabled:
+                self.enable(self.path)
+        elif not first:
+            self.disable()
+            self.save()
+            self.lg.info("Tracing disabled.")
+
+    def _complete(self, name: str, cat: str, start_ns: int, end_ns: int, args: dict) -> None:
+        """Store a finished span / Сохранение завершённого интервала"""
+        self._add(
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start_ns - self._epoch) / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": self._pid,
+                "tid": threading.get_native_id(),
+                "args": args,
+            }
+        )
+
+    def _add(self, event: dict) -> None:
+        """
+        Append an event, naming its thread on first use / Добавление события, с именованием его потока при первом использовании
+        """
+        tid = event["tid"]
+        with self._lock:
+            if len(self._events) >= self.MAX_EVENTS:
+                self._dropped += 1
+                return
+            if tid not in self._named_threads:
+                self._named_threads.add(tid)
+                self._events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": self._pid,
+                        "tid": tid,
+                        "args": {"name": threading.current_thread().name},
+                    }
+                )
+            self._events.append(event)
+
+
+# ===== SPAN DECORATOR / ДЕКОРАТОР ИНТЕРВАЛА =====
+def traced(name: str | None = None, cat: str = "app") -> Callable:
+    """
+    Decorator timing every call of a function / Декоратор, измеряющий каждый вызов функции
+
+    For methods the span gets an "object" argument such as Teacher.Model, so shared base class
+    methods show which entity they ran for. While tracing is off the wrapper only checks a class attribute.
+
+    Для методов интервал получает аргумент "object", например Teacher.Model, поэтому методы общего
+    базового класса показывают, для какой сущности они выполнялись. При выключенной трассировке обёртка только проверяет атрибут класса.
+
+    Args:
+        name (str, optional): Span name, the function qualname if None / Имя интервала, qualname функции если None
+        cat (str): Category / Категория
+    """
+
+    def decorate(fn: Callable) -> Callable:
+        label = name or fn.__qualname__
+        code = fn.__code__
+        is_method = code.co_argcount > 0 and code.co_varnames[0] == "self"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not Tracer.enabled:
+                return fn(*args, **kwargs)
+            span_args: dict[str, Any] = {}
+            if is_method and args:
+                owner = type(args[0])
+                span_args["object"] = f"{owner.__module__.rsplit('.', 1)[-1]}.{owner.__name__}"
+            with _Span(Tracer(), label, cat, span_args):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,151 @@
+# ===== GUI STALL WATCHDOG / СТОРОЖ ЗАВИСАНИЙ GUI =====
+# Detects a blocked Qt event loop and logs what the GUI thread was doing
+# Обнаруживает заблокированный цикл событий Qt и записывает в лог, чем был занят GUI поток
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import sys
+import threading
+import time
+import traceback
+
+# PyQt6 core imports / Импорты ядра PyQt6
+from PyQt6.QtCore import QTimer
+
+# Local application imports / Импорты локального приложения
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+
+
+# ===== WATCHDOG CLASS / КЛАСС СТОРОЖА =====
+class Watchdog:
+    """
+    GUI thread stall watchdog / Сторож зависаний GUI потока
+
+    A QTimer on the GUI thread stamps a heartbeat every PING_MS. A daemon thread checks the heartbeat,
+    and when it is older than the threshold the event loop is blocked: the GUI thread's Python stack
+    is taken with sys._current_frames and logged. When the loop runs again the stall is logged once more
+    with its full duration, so slow synchronous DB calls and layout passes can be found in the JSONL log.
+
+    QTimer в GUI потоке ставит отметку каждые PING_MS. Фоновый поток проверяет отметку, и когда она старше
+    порога, цикл событий заблокирован: стек Python GUI потока берётся через sys._current_frames и
+    записывается в лог. Когда цикл снова работает, зависание записывается ещё раз с полной длительностью,
+    поэтому медленные синхронные вызовы БД и проходы компоновки можно найти в JSONL логе.
+    """
+
+    # ===== WATCHDOG SETTINGS / НАСТРОЙКИ СТОРОЖА =====
+    # Stall threshold is stall_threshold_ms in perf_settings.json / Порог зависания - stall_threshold_ms в perf_settings.json
+    PING_MS = 100  # Heartbeat period on the GUI thread / Период отметки в GUI потоке
+    STACK_LIMIT = 40  # Innermost frames kept / Сохраняемых внутренних кадров
+
+    # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
+    def __init__(self, threshold_ms: int | None = None, parent=None):
+        """
+        Prepare the watchdog, start() must be called on the GUI thread /
+        Подготовка сторожа, start() должен вызываться в GUI потоке
+
+        Args:
+            threshold_ms (int, optional): Stall threshold, overrides perf_settings.json /
+                                          Порог зависания, заменяет perf_settings.json
+            parent: QObject owning the heartbeat timer / QObject, владеющий таймером отметки
+        """
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        self.metrics = Metrics()
+        self._fixed_threshold = threshold_ms is not None
+        appcfg = AppConfig()
+        self.threshold_ms = threshold_ms or appcfg.perf_settings["stall_threshold_ms"]
+        appcfg.subscribe(appcfg.save_set_perf_file, self._apply_perf)
+
+        self._parent = parent
+        self._timer: QTimer | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._gui_ident: int | None = None
+        self._last_beat = time.monotonic()
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def start(self) -> None:
+        """
+        Start heartbeat and monitor thread / Запуск отметки и потока наблюдения
+
+        ! Must be called on the GUI thread. / ! Должен вызываться в GUI потоке.
+        """
+        if self._thread is not None:
+            return
+        self._gui_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+
+        self._timer = QTimer(self._parent)
+        self._timer.timeout.connect(self._beat)
+        self._timer.start(self.PING_MS)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="gui-watchdog", daemon=True)
+        self._thread.start()
+        self.lg.debug("Watchdog started, threshold %s ms.", self.threshold_ms)
+
+    def stop(self) -> None:
+        """Stop watching / Остановка наблюдения"""
+        self._stop_event.set()
+        if self._timer is not None:
+            self._timer.stop()
+        self._thread = None
+
+    # ===== PRIVATE METHODS / ПРИВАТНЫЕ МЕТОДЫ =====
+
+    def _apply_perf(self, perf: dict) -> None:
+        """Apply stall_threshold_ms unless set on the command line / Применение stall_threshold_ms, если не задан в командной строке"""
+        if not self._fixed_threshold:
+            self.threshold_ms = perf["stall_threshold_ms"]
+
+    def _beat(self) -> None:
+        """Heartbeat, runs on the GUI thread / Отметка, выполняется в GUI потоке"""
+        self._last_beat = time.monotonic()
+
+    def _gui_stack(self) -> str:
+        """
+        Current Python stack of the GUI thread / Текущий стек Python GUI потока
+
+        Returns:
+            str: Formatted stack, innermost call last / Отформатированный стек, внутренний вызов последним
+        """
+        frame = sys._current_frames().get(self._gui_ident)  # type: ignore
+        if frame is None:
+            return "<GUI thread not found>"
+        return "".join(traceback.format_stack(frame, limit=self.STACK_LIMIT))
+
+    def _run(self) -> None:
+        """
+        Monitor thread loop / Цикл потока наблюдения
+        """
+        stall_started: float | None = None
+        stack = ""
+
+        while not self._stop_event.wait(min(self.PING_MS, self.threshold_ms) / 1000 / 2):
+            now = time.monotonic()
+            last_beat = self._last_beat
+            # One heartbeat period is normal lateness / Один период отметки - нормальное опоздание
+            blocked_ms = (now - last_beat) * 1000 - self.PING_MS
+
+            if stall_started is None:
+                # Heartbeat is late by more than the threshold / Отметка опаздывает больше порога
+                if blocked_ms >= self.threshold_ms:
+                    stall_started = last_beat
+                    stack = self._gui_stack()
+                    self.lg.warning(
+                        "GUI thread blocked for %.0f ms, stack:\n%s", blocked_ms, stack
+                    )
+            elif last_beat > stall_started:
+                # Event loop is running again / Цикл событий снова работает
+                duration_ms = max((last_beat - stall_started) * 1000 - self.PING_MS, 0.0)
+                self.metrics.inc("gui.stalls")
+                self.metrics.observe("gui.stall_ms", duration_ms)
+                self.lg.warning(
+                    "GUI stall ended after %.0f ms, blocked in:\n%s", duration_ms, stack
+                )
+                stall_started = None
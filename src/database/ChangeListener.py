@@ -0,0 +1,291 @@
+# ===== CHANGE LISTENER / СЛУШАТЕЛЬ ИЗМЕНЕНИЙ =====
+# Turns NOTIFY messages of the change triggers into per-table change batches for the open models
+# Превращает NOTIFY сообщения триггеров изменений в пакеты изменений по таблицам для открытых моделей
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import atexit
+import json
+import select
+import threading
+import time
+from typing import Any
+
+# PostgreSQL database adapter imports / Импорты адаптера базы данных PostgreSQL
+from psycopg2 import extensions, sql
+
+# PyQt6 core imports / Импорты ядра PyQt6
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# Local application imports / Импорты локального приложения
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+from src.database.ConnectionPool import ConnectionPool
+from src.database.ResultCache import ResultCache
+from src.database.queries.QueryBuilder import AdvancedQueryBuilder
+
+
+# ===== CHANGE LISTENER CLASS / КЛАСС СЛУШАТЕЛЯ ИЗМЕНЕНИЙ =====
+class ChangeListener(QObject):
+    """
+    LISTEN session for row changes made by other clients / LISTEN сессия для изменений строк другими клиентами
+    Singleton pattern implementation shared by all models / Реализация паттерна Singleton, общая для всех моделей
+
+    A daemon thread keeps one dedicated connection (outside the pool) listening on
+    AdvancedQueryBuilder.CHANGE_CHANNEL, filled by the triggers of Schema.ensure_change_triggers.
+    - Messages are collected for live_refresh_batch_ms and sent as one batch per table /
+      Сообщения собираются live_refresh_batch_ms и отправляются одним пакетом на таблицу
+    - Messages from this process's own pool connections are skipped, the writing model already applied them /
+      Сообщения от собственных соединений пула процесса пропускаются, записавшая модель их уже применила
+    - Cached results of a changed table are dropped / Кэшированные результаты изменённой таблицы удаляются
+    - A lost connection is reopened with backoff, then resync asks the models to reload /
+      Потерянное соединение переоткрывается с нарастающей паузой, затем resync просит модели перезагрузиться
+
+    Поток-демон держит одно выделенное соединение (вне пула), слушающее AdvancedQueryBuilder.CHANGE_CHANNEL,
+    который заполняют триггеры из Schema.ensure_change_triggers.
+    """
+
+    # ===== SIGNALS / СИГНАЛЫ =====
+    # Table and {id: "INSERT" | "UPDATE" | "DELETE"}, None if the whole table changed /
+    # Таблица и {id: "INSERT" | "UPDATE" | "DELETE"}, None если изменилась вся таблица
+    changed = pyqtSignal(str, object)
+    # Messages may have been lost while disconnected / Сообщения могли потеряться во время отключения
+    resync = pyqtSignal()
+
+    # ===== LISTENER SETTINGS / НАСТРОЙКИ СЛУШАТЕЛЯ =====
+    POLL_S = 1.0  # Longest wait before the stop flag is checked / Наибольшее ожидание до проверки флага остановки
+    RECONNECT_MIN_S = 1.0  # First pause before reconnecting / Первая пауза перед переподключением
+    RECONNECT_MAX_S = 30.0  # Longest pause before reconnecting / Наибольшая пауза перед переподключением
+
+    # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
+    _instanse_ChangeListener = None  # Stores single instance / Хранит единственный экземпляр
+    _initialized_ChangeListener = (
+        False  # Single initialization flag / Флаг на единственную инициализацию
+    )
+
+    # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
+    def __new__(cls):
+        """
+        Create single class instance / Создание единого объекта класса
+
+        Returns:
+            ChangeListener: Single instance of the listener class
+        """
+        if cls._instanse_ChangeListener is None:
+            # If no class instance exists, create one / Если экземпляра класса нет создаём
+            cls._instanse_ChangeListener = super().__new__(cls)
+        return cls._instanse_ChangeListener
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self):
+        """
+        Initialize listener only once, start() opens the session / Инициализация слушателя только один раз, start() открывает сессию
+
+        ! First call must happen on the GUI thread. / ! Первый вызов должен происходить в GUI потоке.
+        """
+        if ChangeListener._initialized_ChangeListener:
+            return
+        ChangeListener._initialized_ChangeListener = True
+        super().__init__()
+
+        # ===== LOGGING SETUP / НАСТРОЙКА ЛОГИРОВАНИЯ =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        self.pool = ConnectionPool()
+        self.results = ResultCache()
+
+        # ===== LISTENER STATE / СОСТОЯНИЕ СЛУШАТЕЛЯ =====
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+        # ===== LIVE SETTINGS / НАСТРОЙКИ НА ЛЕТУ =====
+        appcfg = AppConfig()
+        self._apply_perf(appcfg.perf_settings)
+        appcfg.subscribe(appcfg.save_set_perf_file, self._apply_perf)
+
+        # ===== STATISTICS / СТАТИСТИКА =====
+        self._stats = {
+            "notifications": 0,
+            "own": 0,
+            "malformed": 0,
+            "batches": 0,
+            "reconnects": 0,
+        }
+        self.metrics = Metrics()
+        self.metrics.register_gauge("change_listener", self.stats)
+
+        atexit.register(self.stop)
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def start(self) -> None:
+        """
+        Start the listener thread if it is not running / Запуск потока слушателя, если он не работает
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            # A thread still stopping keeps its own, already set event / Ещё останавливающийся поток сохраняет своё, уже установленное событие
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop_event,), name="db-change-listener", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the listener thread and close its connection / Остановка потока слушателя и закрытие его соединения
+        """
+        with self._lock:
+            self._stop_event.set()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self.POLL_S * 2)
+
+    def is_running(self) -> bool:
+        """Check if the listener thread is alive / Проверка, жив ли поток слушателя"""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of listener statistics / Снимок статистики слушателя
+
+        Returns:
+            dict: Counters of messages and reconnects / Счётчики сообщений и переподключений
+        """
+        with self._lock:
+            snapshot: dict[str, Any] = dict(self._stats)
+        snapshot["running"] = self.is_running()
+        return snapshot
+
+    # ===== PRIVATE METHODS - LISTENER THREAD / ПРИВАТНЫЕ МЕТОДЫ - ПОТОК СЛУШАТЕЛЯ =====
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """
+        Keep a LISTEN session open until stopped / Поддержание LISTEN сессии открытой до остановки
+
+        Args:
+            stop_event: Set by stop() / Устанавливается stop()
+        """
+        delay = self.RECONNECT_MIN_S
+        connected_before = False
+        while not stop_event.is_set():
+            conn = None
+            try:
+                conn = self.pool.connect_dedicated()
+                # Messages are only delivered between transactions / Сообщения доставляются только между транзакциями
+                conn.set_isolation_level(extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        sql.SQL("LISTEN {}").format(
+                            sql.Identifier(AdvancedQueryBuilder.CHANGE_CHANNEL)
+                        )
+                    )
+                self.lg.info("Listening for changes on %s.", AdvancedQueryBuilder.CHANGE_CHANNEL)
+                if connected_before:
+                    # Changes made while disconnected were missed / Изменения за время отключения пропущены
+                    self.results.invalidate()
+                    self.resync.emit()
+                connected_before = True
+                delay = self.RECONNECT_MIN_S
+                self._listen(conn, stop_event)
+            except Exception as e:
+                if stop_event.is_set():
+                    break
+                with self._lock:
+                    self._stats["reconnects"] += 1
+                self.lg.warning("Change listener disconnected: %s. Retrying in %s s.", e, delay)
+                stop_event.wait(delay)
+                delay = min(delay * 2, self.RECONNECT_MAX_S)
+            finally:
+                if conn is not None and not conn.closed:
+                    try:
+                        conn.close()
+                    except Exception as e:
+                        self.lg.error("Internal error: %s.", e)
+
+    def _listen(self, conn, stop_event: threading.Event) -> None:
+        """
+        Wait for messages and flush them in batches / Ожидание сообщений и отправка их пакетами
+
+        Args:
+            conn: Connection with an active LISTEN / Соединение с активным LISTEN
+            stop_event: Set by stop() / Устанавливается stop()
+        """
+        # table -> {id: operation}, None for the whole table / таблица -> {id: операция}, None для всей таблицы
+        pending: dict[str, dict | None] = {}
+        deadline: float | None = None
+        while not stop_event.is_set():
+            timeout = self.POLL_S if deadline is None else max(0.0, deadline - time.monotonic())
+            if select.select([conn], [], [], timeout)[0]:
+                conn.poll()
+                own = self.pool.backend_pids()
+                while conn.notifies:
+                    self._collect(conn.notifies.pop(0), own, pending)
+                if pending and deadline is None:
+                    deadline = time.monotonic() + self.batch_s
+            if deadline is not None and time.monotonic() >= deadline:
+                self._flush(pending)
+                pending = {}
+                deadline = None
+
+    def _collect(self, notify, own: set[int], pending: dict) -> None:
+        """
+        Add one message to the pending batch / Добавление одного сообщения в ожидающий пакет
+
+        The last operation of an id wins; only DELETE differs for the models, anything else is re-read.
+        Побеждает последняя операция с id; для моделей отличается только DELETE, всё остальное перечитывается.
+
+        Args:
+            notify: psycopg2 Notify / psycopg2 Notify
+            own (set): Backend pids of this process / Id серверных процессов этого процесса
+            pending (dict): Batch being collected / Собираемый пакет
+        """
+        with self._lock:
+            self._stats["notifications"] += 1
+            if notify.pid in own:
+                self._stats["own"] += 1
+                return
+        try:
+            payload = json.loads(notify.payload)
+            table = payload["table"]
+            operation = payload["op"]
+        except (ValueError, KeyError, TypeError):
+            with self._lock:
+                self._stats["malformed"] += 1
+            self.lg.warning("Malformed change notification: %s.", notify.payload)
+            return
+
+        if operation == "TRUNCATE" or payload.get("id") is None:
+            pending[table] = None
+            return
+        changes = pending.setdefault(table, {})
+        if changes is not None:
+            changes[payload["id"]] = operation
+
+    def _flush(self, pending: dict) -> None:
+        """
+        Send collected batches to the models / Отправка собранных пакетов моделям
+
+        Args:
+            pending (dict): table -> {id: operation} or None / таблица -> {id: операция} или None
+        """
+        for table, changes in pending.items():
+            self.results.invalidate(table)
+            self.metrics.inc(f"live.changes.{table}", len(changes) if changes else 1)
+            with self._lock:
+                self._stats["batches"] += 1
+            self.changed.emit(table, changes)
+
+    def _apply_perf(self, perf: dict) -> None:
+        """
+        Apply live_refresh settings from perf_settings.json / Применение настроек live_refresh из perf_settings.json
+        """
+        self.batch_s = perf["live_refresh_batch_ms"] / 1000
+        if not perf["live_refresh"] and hasattr(self, "_thread"):
+            self.stop()
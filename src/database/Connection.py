@@ -2,15 +2,26 @@
 
 # ===== IMPORTS / ИМПОРТЫ =====
 
-from typing import Any
+import atexit
+import itertools
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Iterator
 
 # PostgreSQL database adapter imports / Импорты адаптера базы данных PostgreSQL
-import psycopg2
+from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
 
 # Local application imports / Импорты локального приложения
 from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+from src.core.Tracer import Tracer
 from src.config.AppConfig import AppConfig
+from src.database.ConnectionPool import ConnectionPool
+from src.database.ResultCache import ResultCache
+from src.database.StatementCache import StatementCache
 
 
 # ===== CONNECTION CLASS / КЛАСС ПОДКЛЮЧЕНИЯ =====
@@ -44,6 +55,27 @@ class Connection:
         # Загрузка конфигурации приложения для настроек базы данных
         self.appcfg = AppConfig()
 
+        # ===== CONNECTION POOL / ПУЛ СОЕДИНЕНИЙ =====
+        # Shared pool keeps physical connections open between queries /
+        # Общий пул держит физические соединения открытыми между запросами
+        self.pool = ConnectionPool()
+
+        # ===== PREPARED STATEMENTS / ПОДГОТОВЛЕННЫЕ ЗАПРОСЫ =====
+        # Repeated QueryBuilder statements are parsed and planned once per connection /
+        # Повторяющиеся запросы QueryBuilder разбираются и планируются один раз на соединение
+        self.statements = StatementCache()
+
+        # ===== RESULT CACHE / КЭШ РЕЗУЛЬТАТОВ =====
+        # SELECT results shared by all handlers, dropped per table on writes /
+        # Результаты SELECT, общие для всех обработчиков, удаляются по таблицам при записи
+        self.results = ResultCache()
+
+        # ===== TRACING / ТРАССИРОВКА =====
+        self.tracer = Tracer()
+
+        # ===== METRICS / МЕТРИКИ =====
+        self.metrics = Metrics()
+
         # ===== CONNECTION STATE / СОСТОЯНИЕ СОЕДИНЕНИЯ =====
         # Initialize connection object as None (lazy connection) /
         # Инициализация объекта соединения как None (ленивое соединение)
@@ -52,102 +84,369 @@ class Connection:
     # ===== CONNECTION MANAGEMENT / УПРАВЛЕНИЕ СОЕДИНЕНИЯМИ =====
     def connect_to_db(self):
         """
-        Establish connection to PostgreSQL database / Установление соединения с базой данных PostgreSQL
+        Check out a pooled connection to PostgreSQL / Получение соединения с PostgreSQL из пула
 
-        Uses lazy connection pattern - creates connection only when needed.
-        Использует паттерн ленивого соединения - создает соединение только при необходимости.
+        Uses lazy connection pattern - the pool opens a physical connection only when needed.
+        Использует паттерн ленивого соединения - пул открывает физическое соединение только при необходимости.
 
         Returns:
             psycopg2.connection: Active database connection object /
                                 Активный объект соединения с базой данных
         """
         try:
-            # Check if connection exists and is still active /
-            # Проверка существования соединения и его активности
+            # Check out only once per handler until close_connection /
+            # Получение соединения только один раз до вызова close_connection
             if not self.connection or self.connection.closed:
-                # Load database configuration from settings file /
-                # Загрузка конфигурации базы данных из файла настроек
-                db_config = self.appcfg.load_from_file(self.appcfg.save_set_db_file)
-
-                # Establish new connection with configuration parameters /
-                # Установление нового соединения с параметрами конфигурации
-                self.connection = psycopg2.connect(**db_config)  # type: ignore
-
-                self.lg.debug("Connected to DB.")
+                self.connection = self.pool.checkout()
 
             return self.connection
 
         except Exception as e:
             # Log critical error for connection failure /
             # Логирование критической ошибки при неудаче соединения
-            self.lg.critical(f"Internal error: {e}.")
+            self.lg.critical("Internal error: %s.", e)
             raise
 
     def close_connection(self) -> None:
         """
-        Safely close database connection / Безопасное закрытие соединения с базой данных
+        Return connection to the pool / Возврат соединения в пул
 
-        Ensures proper cleanup of database resources.
-        Обеспечивает правильную очистку ресурсов базы данных.
+        The physical connection stays open for the next query; the pool closes it when idle too long.
+        Физическое соединение остаётся открытым для следующего запроса; пул закроет его при долгом простое.
         """
         try:
-            # Check if connection exists before attempting to close /
-            # Проверка существования соединения перед попыткой закрытия
-            if self.connection and not self.connection.closed:
-                self.connection.close()
+            # Check if connection was checked out before returning it /
+            # Проверка, что соединение было получено, перед возвратом
+            if self.connection is not None:
                 self.connection = (
                     None  # Reset connection reference / Сброс ссылки на соединение
                 )
-                self.lg.debug("Connection CLOSED.")
+                self.pool.checkin()
+                self.lg.debug("Connection returned to pool.")
 
         except Exception as e:
             # Log error but don't raise to prevent cleanup issues /
             # Логирование ошибки без поднятия исключения для предотвращения проблем очистки
-            self.lg.error(f"Internal error: {e}.")
+            self.lg.error("Internal error: %s.", e)
+
+    # ===== QUERY METRICS / МЕТРИКИ ЗАПРОСОВ =====
+
+    # First table named after FROM, INTO or UPDATE / Первая таблица после FROM, INTO или UPDATE
+    _TABLE_RE = re.compile(r'\b(?:FROM|INTO|UPDATE)\s+"?(\w+)"?', re.IGNORECASE)
+    # query -> table, query texts come from QueryBuilder / запрос -> таблица, тексты запросов приходят из QueryBuilder
+    _table_names: dict[str, str] = {}
+
+    @classmethod
+    def table_of(cls, query: str) -> str:
+        """
+        Table a query works on, for per-table metrics / Таблица, с которой работает запрос, для метрик по таблицам
+
+        Args:
+            query (str): SQL query / SQL запрос
+
+        Returns:
+            str: Table name, "other" if not found / Имя таблицы, "other" если не найдена
+        """
+        table = cls._table_names.get(query)
+        if table is None:
+            match = cls._TABLE_RE.search(query)
+            table = cls._table_names[query] = match.group(1) if match else "other"
+        return table
+
+    def _record_query(self, query: str, started: float, rows: int | None, failed: bool) -> None:
+        """
+        Record latency and row count of one query / Запись задержки и количества строк одного запроса
+
+        Args:
+            query (str): SQL query / SQL запрос
+            started (float): perf_counter() at start / perf_counter() в начале
+            rows (int | None): Fetched rows / Полученные строки
+            failed (bool): Query raised / Запрос завершился ошибкой
+        """
+        table = self.table_of(query)
+        self.metrics.observe(f"query.ms.{table}", (time.perf_counter() - started) * 1000)
+        self.metrics.inc(f"query.count.{table}")
+        if rows:
+            self.metrics.inc(f"rows.fetched.{table}", rows)
+        if failed:
+            self.metrics.inc(f"query.errors.{table}")
 
     # ===== QUERY EXECUTION / ВЫПОЛНЕНИЕ ЗАПРОСОВ =====
+
+    # Connection used only for quoting outside workers / Соединение только для экранирования вне рабочих потоков
+    _render_conn = None
+    _render_lock = threading.Lock()
+
+    def render(self, query) -> str:
+        """
+        Query text of a psycopg2.sql composition / Текст запроса из композиции psycopg2.sql
+
+        Identifiers are quoted by the server's rules, so a connection is needed. The text is what
+        the statement cache, tracing and metrics work with. A worker renders with the connection it holds,
+        other threads with one dedicated connection outside the pool, so they never wait for busy workers.
+        Quoting runs in the client library, there is no round trip.
+
+        Идентификаторы экранируются по правилам сервера, поэтому нужно соединение. С этим текстом
+        работают кэш подготовленных запросов, трассировка и метрики. Рабочий поток использует своё соединение,
+        остальные потоки - одно выделенное соединение вне пула, поэтому они не ждут занятые рабочие потоки.
+        Экранирование выполняется в клиентской библиотеке, обмена с сервером нет.
+
+        Args:
+            query (str | sql.Composable): SQL query / SQL запрос
+
+        Returns:
+            str: SQL query string / Строка SQL запроса
+        """
+        if not isinstance(query, sql.Composable):
+            return query
+        conn = self.pool.current()
+        if conn is not None:
+            return query.as_string(conn)
+        with Connection._render_lock:
+            if Connection._render_conn is None or Connection._render_conn.closed:
+                Connection._render_conn = self.pool.connect_dedicated()
+                atexit.register(Connection._render_conn.close)
+            return query.as_string(Connection._render_conn)
+
+    # Statements that never change data, others invalidate cached results /
+    # Запросы, которые никогда не меняют данные, остальные инвалидируют кэшированные результаты
+    _READS = ("SELECT", "EXPLAIN", "SHOW")
+
+    @classmethod
+    def is_read(cls, query: str) -> bool:
+        """Check if a query only reads / Проверка, только ли читает запрос"""
+        words = query.split(None, 1)
+        return bool(words) and words[0].upper() in cls._READS
+
+    # Explicit transaction of the current thread: depth and written tables /
+    # Явная транзакция текущего потока: глубина и записанные таблицы
+    _tx = threading.local()
+
+    @classmethod
+    def in_transaction(cls) -> bool:
+        """Check if the current thread is inside transaction() / Проверка, находится ли текущий поток внутри transaction()"""
+        return getattr(cls._tx, "depth", 0) > 0
+
+    def _invalidate(self, table: str) -> None:
+        """Drop cached results of a written table, all if unknown / Удаление кэшированных результатов записанной таблицы, всех если неизвестна"""
+        self.results.invalidate(None if table == "other" else table)
+
     def execute_query(self, query, params: Any | None = None) -> list | None:
         """
         Execute SQL query with optional parameters / Выполнение SQL запроса с опциональными параметрами
 
         Handles both SELECT and DML operations with proper transaction management.
+        SELECT results are served from ResultCache when possible; other statements invalidate their table there.
         Обрабатывает как SELECT, так и DML операции с правильным управлением транзакциями.
+        Результаты SELECT по возможности берутся из ResultCache; остальные запросы инвалидируют там свою таблицу.
 
         Args:
-            query (str): SQL query string to execute / SQL запрос для выполнения
+            query (str | sql.Composable): SQL query to execute / SQL запрос для выполнения
             params (tuple, optional): Query parameters for safe binding / Параметры запроса для безопасной привязки
 
         Returns:
-            list: Query results for SELECT operations, None for DML operations /
-                  Результаты запроса для SELECT операций, None для DML операций
+            list: Query results for SELECT and RETURNING queries, None for other DML operations /
+                  Результаты запроса для SELECT и RETURNING запросов, None для остальных DML операций
         """
+        query = self.render(query)
+        table = self.table_of(query)
+        reading = self.is_read(query)
+        # Inside transaction() the connection is shared: its block commits, and cached rows miss its own writes /
+        # Внутри transaction() соединение общее: фиксирует его блок, а кэшированные строки не видят его записей
+        nested = self.in_transaction()
+
+        cache_key = None
+        if reading and not nested and query.lstrip()[:6].upper() == "SELECT":
+            cache_key = self.results.key("rows", query, params)
+            hit, cached = self.results.get(cache_key)
+            if hit:
+                self.metrics.inc(f"query.cache_hits.{table}")
+                return list(cached)
+            generation = self.results.generation(table)
+
+        started = time.perf_counter()
+        rows = None
+        failed = False
         try:
-            # Use context manager for automatic connection and cursor cleanup /
-            # Использование контекстного менеджера для автоматической очистки соединения и курсора
-            with self.connect_to_db() as conn:
+            # Pooled checkout is returned on exit, transaction is committed or rolled back /
+            # Соединение возвращается в пул при выходе, транзакция подтверждается или откатывается
+            with (
+                self.tracer.span("sql.execute", "db", sql=query) as span,
+                self.pool.connection() as conn,
+                nullcontext() if nested else conn,
+            ):
                 # RealDictCursor provides dict-like access to query results /
                 # RealDictCursor предоставляет словарный доступ к результатам запроса
                 with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                    # Execute query with parameter binding for SQL injection prevention /
-                    # Выполнение запроса с привязкой параметров для предотвращения SQL инъекций
-                    cursor.execute(query, params)
+                    # Execute prepared query with parameter binding for SQL injection prevention /
+                    # Выполнение подготовленного запроса с привязкой параметров для предотвращения SQL инъекций
+                    self.statements.execute(cursor, query, params)
 
                     # Commit transaction to ensure data persistence /
                     # Подтверждение транзакции для обеспечения сохранности данных
-                    conn.commit()
-
-                    # Return results only for SELECT queries (when params is None) /
-                    # Возврат результатов только для SELECT запросов (когда params равен None)
+                    if nested:
+                        if not reading:
+                            self._tx.tables.add(table)
+                    else:
+                        conn.commit()
+                        if not reading:
+                            self._invalidate(table)
+
+                    # Return results only when the query produced rows (SELECT or RETURNING) /
+                    # Возврат результатов только если запрос вернул строки (SELECT или RETURNING)
                     # Fix for internal error: "no results to fetch" /
                     # Исправление внутренней ошибки: "нет результатов для получения"
-                    if params is None:
-                        return cursor.fetchall()
+                    if cursor.description is not None:
+                        rows = cursor.fetchall()
+                        span.set(rows=len(rows))
+                        if cache_key is not None:
+                            self.results.put(cache_key, table, list(rows), len(rows), generation)
+                        return rows
+
+        except Exception as e:
+            # Log query execution errors for debugging /
+            # Логирование ошибок выполнения запросов для отладки
+            self.lg.error("Internal error: %s.", e)
+            failed = True
+            raise
+        finally:
+            self._record_query(query, started, len(rows) if rows else None, failed)
+
+    @contextmanager
+    def transaction(self, *tables: str) -> Iterator[RealDictCursor]:
+        """
+        Run several statements in one transaction / Выполнение нескольких запросов в одной транзакции
+
+        Commits when the block exits normally and rolls back on exception.
+        Подтверждается при нормальном выходе из блока и откатывается при исключении.
+
+        Args:
+            *tables: Tables written in the block, their cached results are dropped on commit /
+                     Таблицы, в которые пишет блок, их кэшированные результаты удаляются при фиксации
+
+        Yields:
+            RealDictCursor: Cursor on a pooled connection / Курсор на соединении из пула
+        """
+        tx = self._tx
+        outermost = not self.in_transaction()
+        if outermost:
+            tx.depth = 0
+            tx.tables = set(tables)
+        else:
+            tx.tables.update(tables)
+        tx.depth += 1
+        try:
+            with self.pool.connection() as conn, (conn if outermost else nullcontext()):
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    yield cursor
+            if outermost:
+                for table in tx.tables:
+                    self._invalidate(table)
 
+        except Exception as e:
+            # Log transaction errors for debugging /
+            # Логирование ошибок транзакции для отладки
+            self.lg.error("Internal error: %s.", e)
+            raise
+        finally:
+            tx.depth -= 1
+
+    # Unique names for server-side cursors / Уникальные имена для серверных курсоров
+    _stream_names = itertools.count(1)
+
+    def stream_query(
+        self,
+        query,
+        params: Any | None = None,
+        itersize: int = 2000,
+        first_rows: int | None = None,
+    ) -> Iterator[tuple[list, list]]:
+        """
+        Stream SELECT results through a named server-side cursor / Потоковое чтение результатов SELECT через именованный серверный курсор
+
+        Rows are fetched in batches of itersize, so memory use does not depend on table size.
+        The first batch can be smaller to show the first screenful quickly.
+
+        Строки получаются пачками по itersize, поэтому расход памяти не зависит от размера таблицы.
+        Первая пачка может быть меньше, чтобы быстро показать первый экран.
+
+        A completed stream of up to result_cache_max_rows rows is kept in ResultCache and replayed from memory.
+        Завершённый поток до result_cache_max_rows строк сохраняется в ResultCache и воспроизводится из памяти.
+
+        The generator may be closed on another thread, so it never takes the thread's re-entrant checkout:
+        it reuses the connection the thread already holds (a QueryTask, which can then cancel it) or acquires its own.
+        Генератор может быть закрыт в другом потоке, поэтому он не берёт повторно входимую выдачу потока:
+        он использует соединение, которое поток уже держит (QueryTask, который тогда может его отменить), или получает своё.
+
+        Args:
+            query (str | sql.Composable): SQL SELECT query / SQL SELECT запрос
+            params (tuple, optional): Query parameters / Параметры запроса
+            itersize (int): Rows per round trip / Строк за один обмен с сервером
+            first_rows (int, optional): Size of the first batch / Размер первой пачки
+
+        Yields:
+            tuple: (column names, list of row tuples) / (имена колонок, список кортежей строк)
+        """
+        query = self.render(query)
+        table = self.table_of(query)
+        nested = self.in_transaction()
+        cache_key = self.results.key("stream", query, params)
+        hit, cached = (False, None) if nested else self.results.get(cache_key)
+        if hit:
+            self.metrics.inc(f"query.cache_hits.{table}")
+            yield from cached
+            return
+        generation = self.results.generation(table)
+        # Chunks kept for the cache until the stream gets too big / Порции для кэша, пока поток не стал слишком большим
+        chunks: list | None = []
+
+        started = time.perf_counter()
+        total = 0
+        failed = False
+        conn = self.pool.current()
+        owned = conn is None
+        if owned:
+            conn = self.pool.acquire()
+        try:
+            with nullcontext() if nested else conn:
+                name = f"stream_{next(self._stream_names)}"
+                with conn.cursor(name=name) as cursor:
+                    cursor.itersize = itersize
+                    cursor.execute(query, params)
+
+                    columns = None
+                    size = first_rows or itersize
+                    while True:
+                        rows = cursor.fetchmany(size)
+                        if not rows:
+                            break
+                        if columns is None:
+                            # Description is known only after the first fetch /
+                            # Описание известно только после первого получения
+                            columns = [column.name for column in cursor.description]
+                        total += len(rows)
+                        if chunks is not None:
+                            chunks = chunks if total <= self.results.max_rows else None
+                            if chunks is not None:
+                                chunks.append((columns, rows))
+                        yield columns, rows
+                        size = itersize
+
+            if chunks is not None and not nested:
+                self.results.put(cache_key, table, chunks, total, generation)
+
+        except GeneratorExit:
+            raise
         except Exception as e:
             # Log query execution errors for debugging /
             # Логирование ошибок выполнения запросов для отладки
-            self.lg.error(f"Internal error: {e}.")
+            self.lg.error("Internal error: %s.", e)
+            failed = True
             raise
+        finally:
+            if owned:
+                self.pool.release(conn)
+            self._record_query(query, started, total, failed)
 
 
 # ===== FUNCTIONALITY TESTING / ПРОВЕРКА РАБОТОСПОСОБНОСТИ =====
@@ -161,6 +460,6 @@ if __name__ == "__main__":
     connection_to_db.connect_to_db()
     print("Connection established successfully.")
 
-    # Test connection closure / Тестирование закрытия соединения
+    # Test connection return to pool / Тестирование возврата соединения в пул
     connection_to_db.close_connection()
-    print("Connection closed successfully.")
+    print("Connection returned to pool successfully.")
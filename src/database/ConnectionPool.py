@@ -0,0 +1,644 @@
+# ===== DATABASE CONNECTION POOL CLASS / КЛАСС ПУЛА СОЕДИНЕНИЙ С БАЗОЙ ДАННЫХ =====
+# Shared, thread-safe pool of PostgreSQL connections for all models
+# Общий потокобезопасный пул соединений PostgreSQL для всех моделей
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any
+
+# PostgreSQL database adapter imports / Импорты адаптера базы данных PostgreSQL
+import psycopg2
+from psycopg2 import extensions
+
+# Local application imports / Импорты локального приложения
+from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+from src.config.AppConfig import AppConfig
+
+
+# ===== POOLED CONNECTION RECORD / ЗАПИСЬ СОЕДИНЕНИЯ ПУЛА =====
+class _PooledConnection:
+    """
+    Pool bookkeeping for one physical connection / Служебные данные пула для одного физического соединения
+
+    Stores the psycopg2 connection together with its creation and last use time.
+    Хранит соединение psycopg2 вместе со временем создания и последнего использования.
+    """
+
+    __slots__ = ("conn", "created_at", "last_used", "generation", "pid")
+
+    def __init__(self, conn, generation: int = 0):
+        self.conn = conn
+        # Server process id, tells own NOTIFY messages apart / Id серверного процесса, отличает собственные NOTIFY сообщения
+        self.pid = conn.get_backend_pid()
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        # Settings generation the connection was opened with / Поколение настроек, с которыми открыто соединение
+        self.generation = generation
+
+
+# ===== CONNECTION POOL CLASS / КЛАСС ПУЛА СОЕДИНЕНИЙ =====
+class ConnectionPool:
+    """
+    Thread-safe PostgreSQL connection pool / Потокобезопасный пул соединений PostgreSQL
+    Singleton pattern implementation shared by all models / Реализация паттерна Singleton, общая для всех моделей
+
+    Keeps physical connections open between queries so that an edit costs a single round trip
+    instead of a full TCP + auth handshake:
+    - Minimum and maximum pool size / Минимальный и максимальный размер пула
+    - Health check on checkout of long idle connections / Проверка живости долго простаивавших соединений при выдаче
+    - Idle reaping above the minimum size / Закрытие простаивающих соединений сверх минимума
+    - Re-entrant per-thread checkout context manager / Повторно входимая выдача соединения на поток
+    - Statistics (wait time, checkouts, connection age) written to the Logger /
+      Статистика (время ожидания, выдачи, возраст соединений) записывается в Logger
+    """
+
+    # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
+    _instanse_Pool = None  # Stores single instance / Хранит единственный экземпляр
+    _initialized_Pool = (
+        False  # Single initialization flag / Флаг на единственную инициализацию
+    )
+    # The first instance may be created by the startup warm-up thread while the GUI opens a mode /
+    # Первый экземпляр может создаваться потоком прогрева при запуске, пока GUI открывает режим
+    _lock_Pool = threading.RLock()
+
+    # ===== DEFAULT POOL SETTINGS / НАСТРОЙКИ ПУЛА ПО УМОЛЧАНИЮ =====
+    # Sizes and timeouts come from perf_settings.json / Размеры и таймауты берутся из perf_settings.json
+    _DEF_HEALTH_CHECK_AFTER = 30.0  # Idle seconds after which checkout pings / Секунд простоя, после которых выдача проверяет соединение
+    _DEF_REAP_INTERVAL = 60.0  # Seconds between reaper passes / Секунд между проходами очистки
+
+    # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
+    def __new__(cls):
+        """
+        Create single class instance / Создание единого объекта класса
+
+        Returns:
+            ConnectionPool: Single instance of the pool class
+        """
+        with cls._lock_Pool:
+            if cls._instanse_Pool is None:
+                # If no class instance exists, create one / Если экземпляра класса нет создаём
+                cls._instanse_Pool = super().__new__(cls)
+            return cls._instanse_Pool
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self):
+        """
+        Initialize pool only once / Инициализация пула только один раз
+
+        Reads database settings once, prepares bookkeeping and starts the reaper thread.
+        A second thread waits until the first one has finished.
+        Один раз читает настройки БД, готовит служебные структуры и запускает поток очистки.
+        Второй поток ждёт, пока первый закончит.
+        """
+        with ConnectionPool._lock_Pool:
+            if ConnectionPool._initialized_Pool:
+                return
+            ConnectionPool._initialized_Pool = True
+            self._setup()
+
+    def _setup(self) -> None:
+        """Body of the one-time initialization / Тело однократной инициализации"""
+        # ===== LOGGING SETUP / НАСТРОЙКА ЛОГИРОВАНИЯ =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        # ===== CONFIGURATION SETUP / НАСТРОЙКА КОНФИГУРАЦИИ =====
+        # Settings come from the AppConfig cache instead of a file read on every reconnect /
+        # Настройки берутся из кэша AppConfig, а не из чтения файла при каждом переподключении
+        self.appcfg = AppConfig()
+        self._db_config = self.appcfg.db_settings
+        # Bumped when db_settings.json changes, older connections are replaced /
+        # Увеличивается при изменении db_settings.json, старые соединения заменяются
+        self._generation = 0
+
+        self.health_check_after = self._DEF_HEALTH_CHECK_AFTER
+        # Set from perf_settings.json below / Задаются из perf_settings.json ниже
+        self.min_size = 0
+        self.max_size = 0
+        self.idle_timeout = 0.0
+        self.checkout_timeout = 0.0
+        self.statement_timeout_ms = 0
+
+        # ===== POOL STATE / СОСТОЯНИЕ ПУЛА =====
+        # Condition guards idle list and size counter / Условие защищает список простаивающих и счётчик размера
+        self._cond = threading.Condition()
+        self._idle: list[_PooledConnection] = []
+        self._size = 0
+        self._closed = False
+        # Per-thread checkout state / Состояние выдачи для каждого потока
+        self._local = threading.local()
+
+        # ===== STATISTICS / СТАТИСТИКА =====
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_total_ms": 0.0,
+            "wait_max_ms": 0.0,
+            "created": 0,
+            "closed": 0,
+            "health_check_failures": 0,
+            "timeouts": 0,
+        }
+        # Ages of connections currently checked out, for reporting / Записи выданных соединений для отчёта о возрасте
+        self._in_use: set[_PooledConnection] = set()
+
+        # ===== REAPER THREAD / ПОТОК ОЧИСТКИ =====
+        self._stop_event = threading.Event()
+        self._reaper = threading.Thread(
+            target=self._reap_loop, name="db-pool-reaper", daemon=True
+        )
+        self._reaper.start()
+
+        # Close physical connections when the interpreter exits /
+        # Закрытие физических соединений при завершении интерпретатора
+        atexit.register(self.close_all)
+
+        # ===== METRICS / МЕТРИКИ =====
+        self.metrics = Metrics()
+        self.metrics.register_gauge("pool", self.stats)
+
+        # ===== LIVE SETTINGS / НАСТРОЙКИ НА ЛЕТУ =====
+        self._apply_perf(self.appcfg.perf_settings)
+        self.appcfg.subscribe(self.appcfg.save_set_db_file, self._on_settings_changed)
+        self.appcfg.subscribe(self.appcfg.save_set_perf_file, self._apply_perf)
+
+    # ===== PRIVATE METHODS - CONNECTION LIFECYCLE / ПРИВАТНЫЕ МЕТОДЫ - ЖИЗНЕННЫЙ ЦИКЛ СОЕДИНЕНИЙ =====
+
+    def _connect_params(self) -> tuple[dict, int]:
+        """
+        Connection parameters and settings generation / Параметры подключения и поколение настроек
+        """
+        with self._cond:
+            params = dict(self._db_config)  # type: ignore
+            if self.statement_timeout_ms:
+                # Server cancels queries running longer / Сервер отменяет более долгие запросы
+                params["options"] = (
+                    f"{params.get('options', '')} -c statement_timeout={self.statement_timeout_ms}"
+                ).strip()
+            return params, self._generation
+
+    def _create(self) -> _PooledConnection:
+        """
+        Open a new physical connection / Открытие нового физического соединения
+
+        Returns:
+            _PooledConnection: New pool record / Новая запись пула
+        """
+        params, generation = self._connect_params()
+        conn = psycopg2.connect(**params)
+        with self._cond:
+            self._stats["created"] += 1
+        self.lg.debug("Connected to DB.")
+        return _PooledConnection(conn, generation)
+
+    def _discard(self, record: _PooledConnection) -> None:
+        """
+        Close a physical connection and forget it / Закрытие физического соединения и удаление его из пула
+
+        Args:
+            record: Pool record to drop / Запись пула для удаления
+        """
+        try:
+            if not record.conn.closed:
+                record.conn.close()
+        except Exception as e:
+            self.lg.error("Internal error: %s.", e)
+        with self._cond:
+            self._size -= 1
+            self._stats["closed"] += 1
+            self._cond.notify()
+
+    def _is_healthy(self, record: _PooledConnection) -> bool:
+        """
+        Check that a pooled connection can still be used / Проверка, что соединение из пула ещё пригодно
+
+        Cheap closed-flag check always, `SELECT 1` round trip only after a long idle period.
+        Дешёвая проверка флага closed всегда, запрос `SELECT 1` только после долгого простоя.
+
+        Args:
+            record: Pool record to check / Запись пула для проверки
+
+        Returns:
+            bool: True if the connection is usable / True если соединение пригодно
+        """
+        if record.conn.closed:
+            return False
+        if time.monotonic() - record.last_used < self.health_check_after:
+            return True
+        try:
+            with record.conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            record.conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    # ===== PUBLIC METHODS - CHECKOUT / ПУБЛИЧНЫЕ МЕТОДЫ - ВЫДАЧА СОЕДИНЕНИЙ =====
+
+    def checkout(self):
+        """
+        Take a connection for the current thread / Получение соединения для текущего потока
+
+        Re-entrant: nested checkouts in the same thread return the same connection.
+        Повторно входимо: вложенные выдачи в одном потоке возвращают одно и то же соединение.
+
+        Returns:
+            psycopg2.connection: Connection owned by this thread until checkin /
+                                 Соединение, принадлежащее потоку до возврата
+
+        Raises:
+            TimeoutError: If no connection freed up within checkout_timeout /
+                          Если соединение не освободилось за checkout_timeout
+        """
+        local = self._local
+        if getattr(local, "record", None) is not None:
+            local.depth += 1
+            return local.record.conn
+
+        record = self._take()
+        local.record = record
+        local.depth = 1
+        return record.conn
+
+    def checkin(self) -> None:
+        """
+        Return the current thread's connection to the pool / Возврат соединения текущего потока в пул
+
+        Only the outermost checkin really releases the connection. Open transactions are rolled back.
+        Только внешний возврат действительно освобождает соединение. Открытые транзакции откатываются.
+        """
+        local = self._local
+        record = getattr(local, "record", None)
+        if record is None:
+            return
+        local.depth -= 1
+        if local.depth > 0:
+            return
+        local.record = None
+        self._give_back(record)
+
+    def current(self):
+        """
+        Connection checked out by the current thread / Соединение, выданное текущему потоку
+
+        Returns:
+            psycopg2.connection | None: Connection, None if the thread holds none /
+                                        Соединение, None если у потока его нет
+        """
+        record = getattr(self._local, "record", None)
+        return record.conn if record is not None else None
+
+    def acquire(self):
+        """
+        Take a connection owned by the caller, not by the thread / Получение соединения, принадлежащего вызывающему, а не потоку
+
+        For holders that may be finished on another thread, such as generators. Return it with release().
+        Для владельцев, которые могут завершиться в другом потоке, например генераторов. Возвращается через release().
+
+        Returns:
+            psycopg2.connection: Connection / Соединение
+
+        Raises:
+            TimeoutError: If no connection freed up within checkout_timeout /
+                          Если соединение не освободилось за checkout_timeout
+        """
+        return self._take().conn
+
+    def release(self, conn) -> None:
+        """
+        Return a connection taken with acquire(), from any thread / Возврат соединения, полученного через acquire(), из любого потока
+
+        Args:
+            conn: Connection returned by acquire() / Соединение, полученное от acquire()
+        """
+        with self._cond:
+            record = next((record for record in self._in_use if record.conn is conn), None)
+        if record is not None:
+            self._give_back(record)
+
+    def _take(self) -> _PooledConnection:
+        """Take an idle or new connection, waiting up to checkout_timeout / Получение простаивающего или нового соединения с ожиданием до checkout_timeout"""
+        started = time.perf_counter()
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+
+        while True:
+            record = None
+            with self._cond:
+                while True:
+                    if self._idle:
+                        record = self._idle.pop()  # LIFO keeps hot connections hot / LIFO держит «горячие» соединения
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1  # Reserve slot, connect outside the lock / Резерв места, подключение вне блокировки
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise TimeoutError(
+                            f"No free database connection within {self.checkout_timeout} s."
+                        )
+                    waited = True
+                    self._cond.wait(remaining)
+
+            if record is None:
+                try:
+                    record = self._create()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                break
+
+            if self._is_healthy(record):
+                break
+
+            # Broken connection is replaced transparently / Сломанное соединение заменяется прозрачно
+            with self._cond:
+                self._stats["health_check_failures"] += 1
+            self.lg.warning("Pooled connection failed health check, reconnecting.")
+            self._discard(record)
+
+        wait_ms = (time.perf_counter() - started) * 1000
+        with self._cond:
+            self._stats["checkouts"] += 1
+            if waited:
+                self._stats["waits"] += 1
+            self._stats["wait_total_ms"] += wait_ms
+            self._stats["wait_max_ms"] = max(self._stats["wait_max_ms"], wait_ms)
+            self._in_use.add(record)
+        if waited:
+            self.metrics.observe("pool.wait_ms", wait_ms)
+        return record
+
+    def _give_back(self, record: _PooledConnection) -> None:
+        """Put a released connection back to the idle list or close it / Возврат освобождённого соединения в список простаивающих или его закрытие"""
+        with self._cond:
+            self._in_use.discard(record)
+
+        conn = record.conn
+        if (
+            self._closed
+            or conn.closed
+            or record.generation != self._generation
+            or self._size > self.max_size  # Pool was shrunk / Пул уменьшен
+        ):
+            self._discard(record)
+            return
+
+        try:
+            # Never hand out a connection in the middle of a transaction /
+            # Никогда не выдаём соединение посреди транзакции
+            if (
+                conn.get_transaction_status()
+                != extensions.TRANSACTION_STATUS_IDLE
+            ):
+                conn.rollback()
+        except psycopg2.Error:
+            self._discard(record)
+            return
+
+        record.last_used = time.monotonic()
+        with self._cond:
+            self._idle.append(record)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """
+        Per-thread checkout context manager / Контекстный менеджер выдачи соединения на поток
+
+        Example:
+            with ConnectionPool().connection() as conn:
+                ...
+        """
+        conn = self.checkout()
+        try:
+            yield conn
+        finally:
+            self.checkin()
+
+    def connect_dedicated(self):
+        """
+        Open a connection outside the pool with the same settings / Открытие соединения вне пула с теми же настройками
+
+        For long-lived sessions such as LISTEN that would otherwise hold a pool slot forever.
+        The caller closes it.
+        Для долгоживущих сессий, например LISTEN, которые иначе навсегда заняли бы место в пуле.
+        Закрывает его вызывающий.
+
+        Returns:
+            psycopg2.connection: New connection / Новое соединение
+        """
+        params, _generation = self._connect_params()
+        return psycopg2.connect(**params)
+
+    def backend_pids(self) -> set[int]:
+        """
+        Server process ids of the pooled connections / Id серверных процессов соединений пула
+        """
+        with self._cond:
+            return {record.pid for record in self._idle} | {record.pid for record in self._in_use}
+
+    def warm_up(self) -> None:
+        """
+        Open connections up to the minimum size / Открытие соединений до минимального размера
+        """
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                record = self._create()
+            except Exception as e:
+                with self._cond:
+                    self._size -= 1
+                self.lg.error("Internal error: %s.", e)
+                return
+            with self._cond:
+                self._idle.append(record)
+                self._cond.notify()
+
+    # ===== PUBLIC METHODS - MAINTENANCE / ПУБЛИЧНЫЕ МЕТОДЫ - ОБСЛУЖИВАНИЕ =====
+
+    def reap_idle(self) -> int:
+        """
+        Close connections idle longer than idle_timeout, keeping min_size /
+        Закрытие соединений, простаивающих дольше idle_timeout, с сохранением min_size
+
+        Returns:
+            int: Number of closed connections / Количество закрытых соединений
+        """
+        now = time.monotonic()
+        expired = []
+        with self._cond:
+            # Oldest idle connections are at the bottom of the stack / Самые старые простаивающие внизу стека
+            for record in list(self._idle):
+                if self._size - len(expired) <= self.min_size:
+                    break
+                if (
+                    now - record.last_used >= self.idle_timeout
+                    or self._size - len(expired) > self.max_size  # Pool was shrunk / Пул уменьшен
+                ):
+                    self._idle.remove(record)
+                    expired.append(record)
+        for record in expired:
+            self._discard(record)
+        return len(expired)
+
+    def close_all(self) -> None:
+        """
+        Close every idle connection and stop the reaper / Закрытие всех простаивающих соединений и остановка очистки
+
+        Connections still checked out are closed on their checkin.
+        Ещё выданные соединения закрываются при их возврате.
+        """
+        if self._closed:
+            return
+        self._stop_event.set()
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for record in idle:
+            self._discard(record)
+        self.log_stats()
+        self.lg.debug("Connection pool CLOSED.")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of pool statistics / Снимок статистики пула
+
+        Returns:
+            dict: Counters, wait times and connection ages / Счётчики, времена ожидания и возраст соединений
+        """
+        now = time.monotonic()
+        with self._cond:
+            records = list(self._idle) + list(self._in_use)
+            snapshot: dict[str, Any] = dict(self._stats)
+            snapshot["size"] = self._size
+            snapshot["idle"] = len(self._idle)
+            snapshot["in_use"] = len(self._in_use)
+        ages = [now - record.created_at for record in records]
+        checkouts = snapshot["checkouts"]
+        snapshot["wait_avg_ms"] = (
+            round(snapshot["wait_total_ms"] / checkouts, 3) if checkouts else 0.0
+        )
+        snapshot["wait_total_ms"] = round(snapshot["wait_total_ms"], 3)
+        snapshot["wait_max_ms"] = round(snapshot["wait_max_ms"], 3)
+        snapshot["conn_age_max_s"] = round(max(ages), 1) if ages else 0.0
+        snapshot["conn_age_avg_s"] = round(sum(ages) / len(ages), 1) if ages else 0.0
+        return snapshot
+
+    def log_stats(self) -> None:
+        """
+        Write pool statistics to the log / Запись статистики пула в лог
+        """
+        self.lg.info(lambda: f"Pool stats: {self.stats()}")
+
+    def _on_settings_changed(self, db_config: Any) -> None:
+        """
+        Switch to new connection settings / Переход на новые настройки подключения
+
+        Idle connections are closed at once, connections in use are closed on their checkin,
+        so the next checkout connects with the new parameters.
+        Простаивающие соединения закрываются сразу, используемые - при их возврате,
+        поэтому следующая выдача подключается с новыми параметрами.
+
+        Args:
+            db_config (dict): New psycopg2.connect parameters / Новые параметры psycopg2.connect
+        """
+        if not db_config:
+            return
+        with self._cond:
+            self._db_config = db_config
+        closed = self._retire_connections()
+        self.lg.info("Database settings changed, %s idle connection(s) closed.", closed)
+
+    def _apply_perf(self, perf: dict) -> None:
+        """
+        Apply pool sizes and timeouts from perf_settings.json / Применение размеров и таймаутов пула из perf_settings.json
+
+        A new statement timeout reconnects like new connection settings, extra connections of a
+        shrunk pool are closed on checkin and by the reaper.
+        Новый таймаут запроса переподключает как новые настройки подключения, лишние соединения
+        уменьшенного пула закрываются при возврате и очисткой.
+
+        Args:
+            perf (dict): Validated performance settings / Проверенные настройки производительности
+        """
+        with self._cond:
+            self.min_size = perf["pool_min_size"]
+            self.max_size = perf["pool_max_size"]
+            self.idle_timeout = perf["pool_idle_timeout_s"]
+            self.checkout_timeout = perf["pool_checkout_timeout_s"]
+            timeout_changed = self.statement_timeout_ms != perf["statement_timeout_ms"]
+            self.statement_timeout_ms = perf["statement_timeout_ms"]
+            # Waiters may fit into a bigger pool / Ожидающие могут поместиться в увеличенный пул
+            self._cond.notify_all()
+        if timeout_changed:
+            self._retire_connections()
+        self.lg.debug(
+            "Pool settings: size %s-%s, statement timeout %s ms.",
+            self.min_size,
+            self.max_size,
+            self.statement_timeout_ms,
+        )
+
+    def _retire_connections(self) -> int:
+        """
+        Replace all connections opened with old settings / Замена всех соединений, открытых со старыми настройками
+
+        Idle connections are closed at once, connections in use are closed on their checkin.
+        Простаивающие соединения закрываются сразу, используемые - при их возврате.
+
+        Returns:
+            int: Number of idle connections closed / Количество закрытых простаивающих соединений
+        """
+        with self._cond:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+        for record in idle:
+            self._discard(record)
+        return len(idle)
+
+    def _reap_loop(self) -> None:
+        """
+        Reaper thread body / Тело потока очистки
+
+        Periodically closes idle connections and reports statistics.
+        Периодически закрывает простаивающие соединения и сообщает статистику.
+        """
+        while not self._stop_event.wait(self._DEF_REAP_INTERVAL):
+            try:
+                reaped = self.reap_idle()
+                if reaped:
+                    self.lg.debug("Reaped %s idle connection(s).", reaped)
+                if self._stats["checkouts"]:
+                    self.log_stats()
+            except Exception as e:
+                self.lg.error("Internal error: %s.", e)
+
+
+# ===== FUNCTIONALITY TESTING / ПРОВЕРКА РАБОТОСПОСОБНОСТИ =====
+if __name__ == "__main__":
+    # Test pooled checkout and reuse / Тестирование выдачи и повторного использования соединений
+    print("Testing connection pool...")
+
+    pool = ConnectionPool()
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        print(f"Connection reused: {first is second}")
+
+    pool.log_stats()
+    pool.close_all()
+    print("Connection pool closed successfully.")
@@ -0,0 +1,211 @@
+# ===== STREAMING EXPORT / ПОТОКОВЫЙ ЭКСПОРТ =====
+# Writes query results straight to disk through COPY TO STDOUT
+# Записывает результаты запроса прямо на диск через COPY TO STDOUT
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import gzip
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+# PostgreSQL database adapter imports / Импорты адаптера базы данных PostgreSQL
+from psycopg2 import extensions, sql
+
+# Local application imports / Импорты локального приложения
+from src.core.Logger import Logger
+from src.database.Connection import Connection
+
+
+# ===== PROGRESS WRITER CLASS / КЛАСС ПИШУЩЕГО ОБЪЕКТА С ПРОГРЕССОМ =====
+class _ProgressWriter:
+    """
+    File wrapper counting bytes written by COPY / Обёртка файла, считающая байты, записанные COPY
+    """
+
+    REPORT_EVERY = 1024 * 1024  # Report progress every MiB / Отчёт о прогрессе каждый МиБ
+
+    def __init__(self, file, handle):
+        self._file = file
+        self._handle = handle
+        self.written = 0
+        self._reported = 0
+
+    def write(self, data) -> int:
+        self._file.write(data)
+        self.written += len(data)
+        if self.written - self._reported >= self.REPORT_EVERY:
+            self._reported = self.written
+            self._handle.report_progress(self.written)
+        return len(data)
+
+
+# ===== EXPORTER CLASS / КЛАСС ЭКСПОРТЁРА =====
+class Exporter:
+    """
+    Streaming exporter to CSV or JSONL / Потоковый экспортёр в CSV или JSONL
+
+    PostgreSQL formats the rows itself and psycopg2 passes them to the file in chunks,
+    so memory use does not depend on table size and no row goes through a Qt model.
+    The file is written under a temporary name and renamed when complete.
+
+    PostgreSQL сам форматирует строки, а psycopg2 передаёт их в файл порциями,
+    поэтому расход памяти не зависит от размера таблицы и ни одна строка не проходит через модель Qt.
+    Файл пишется под временным именем и переименовывается после завершения.
+    """
+
+    # ===== EXPORT FORMATS / ФОРМАТЫ ЭКСПОРТА =====
+    FORMATS = ("csv", "jsonl")
+
+    # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
+    def __init__(self, connection: Connection | None = None):
+        """
+        Initialize exporter / Инициализация экспортёра
+
+        Args:
+            connection: Connection handler, a new one if None / Обработчик соединения, новый если None
+        """
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        self.condb = connection or Connection()
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    @staticmethod
+    def format_for(path: str | Path) -> tuple[str, bool]:
+        """
+        Guess format and compression from a file name / Определение формата и сжатия по имени файла
+
+        Args:
+            path: Target file path / Путь целевого файла
+
+        Returns:
+            tuple: (format, gzip) e.g. students.jsonl.gz -> ("jsonl", True) /
+                   (формат, gzip), например students.jsonl.gz -> ("jsonl", True)
+        """
+        suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+        compress = bool(suffixes) and suffixes[-1] == ".gz"
+        if compress:
+            suffixes = suffixes[:-1]
+        fmt = "jsonl" if suffixes and suffixes[-1] in (".jsonl", ".json") else "csv"
+        return fmt, compress
+
+    def run(
+        self,
+        handle,
+        query,
+        path: str | Path,
+        fmt: str = "csv",
+        compress: bool = False,
+        params: Any | None = None,
+    ) -> dict:
+        """
+        Export query results to a file / Экспорт результатов запроса в файл
+
+        ! Runs in a worker thread through QueryExecutor.submit. /
+        ! Выполняется в рабочем потоке через QueryExecutor.submit.
+
+        Progress reports bytes written. Cancelling interrupts COPY and removes the partial file.
+        Прогресс сообщает записанные байты. Отмена прерывает COPY и удаляет неполный файл.
+
+        Args:
+            handle: Query handle for progress and cancel / Дескриптор запроса для прогресса и отмены
+            query (str | sql.Composable): SELECT query to export / SELECT запрос для экспорта
+            path: Target file / Целевой файл
+            fmt (str): "csv" or "jsonl" / "csv" или "jsonl"
+            compress (bool): Write gzip / Записывать gzip
+            params (list, optional): Query parameters, bound client-side since COPY takes none /
+                                     Параметры запроса, подставляются на клиенте, так как COPY их не принимает
+
+        Returns:
+            dict: Export statistics / Статистика экспорта
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+
+        started = time.perf_counter()
+        path = Path(path)
+        part_path = path.with_name(f"{path.name}.part")
+
+        try:
+            opener = gzip.open if compress else open
+            with opener(part_path, "wb") as f:
+                writer = _ProgressWriter(f, handle)
+                with self.condb.transaction() as cursor:
+                    cursor.copy_expert(self._copy_sql(self._bind(cursor, query, params), fmt), writer)
+                # COPY reports its row count, -1 if the server did not / COPY сообщает число строк, -1 если сервер не сообщил
+                rows = max(cursor.rowcount, 0)
+            # Complete file appears atomically / Полный файл появляется атомарно
+            os.replace(part_path, path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        seconds = time.perf_counter() - started
+        stats = {
+            "rows": rows,
+            "bytes": writer.written,
+            "file_bytes": path.stat().st_size,
+            "seconds": round(seconds, 3),
+            "rows_per_s": round(rows / seconds) if seconds > 0 else 0,
+            "path": str(path),
+        }
+        self.lg.info(
+            "Exported %s rows to %s (%s%s): %s bytes in %.2f s (%s rows/s).",
+            rows,
+            path.name,
+            fmt,
+            ", gzip" if compress else "",
+            stats["file_bytes"],
+            seconds,
+            stats["rows_per_s"],
+        )
+        return stats
+
+    # ===== PRIVATE METHODS / ПРИВАТНЫЕ МЕТОДЫ =====
+
+    @staticmethod
+    def _bind(cursor, query, params: Any | None) -> str:
+        """
+        Query text with its parameters as literals / Текст запроса с параметрами в виде литералов
+
+        Args:
+            cursor: Cursor of the export connection / Курсор соединения экспорта
+            query (str | sql.Composable): SELECT query / SELECT запрос
+            params (list, optional): Query parameters / Параметры запроса
+
+        Returns:
+            str: Query text / Текст запроса
+        """
+        if params is None and not isinstance(query, sql.Composable):
+            return query
+        text = cursor.mogrify(query, params)
+        return text.decode(extensions.encodings[cursor.connection.encoding])
+
+    @staticmethod
+    def _copy_sql(query: str, fmt: str) -> str:
+        """
+        Build COPY TO STDOUT for a query / Построение COPY TO STDOUT для запроса
+
+        JSONL rows come from row_to_json and are written with CSV format whose quote and delimiter
+        are control characters that JSON never contains unescaped, so every line is copied verbatim.
+
+        Строки JSONL получаются через row_to_json и пишутся в формате CSV, кавычка и разделитель которого -
+        управляющие символы, которых JSON никогда не содержит без экранирования, поэтому каждая строка копируется как есть.
+
+        Args:
+            query (str): SELECT query / SELECT запрос
+            fmt (str): "csv" or "jsonl" / "csv" или "jsonl"
+
+        Returns:
+            str: COPY statement / Запрос COPY
+        """
+        if fmt == "jsonl":
+            return (
+                f"COPY (SELECT row_to_json(t) FROM ({query}) t) TO STDOUT "
+                "WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')"
+            )
+        return f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)"
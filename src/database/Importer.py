@@ -0,0 +1,312 @@
+# ===== BULK IMPORT PIPELINE / КОНВЕЙЕР МАССОВОГО ИМПОРТА =====
+# Loads CSV/XLSX files into a table through COPY into a staging table
+# Загружает CSV/XLSX файлы в таблицу через COPY во временную таблицу
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import csv
+import io
+import time
+from pathlib import Path
+from typing import Iterator
+
+# Optional XLSX support / Необязательная поддержка XLSX
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+# Local application imports / Импорты локального приложения
+from src.core.Logger import Logger
+from src.database.Connection import Connection
+
+
+# ===== IMPORTER CLASS / КЛАСС ИМПОРТЁРА =====
+class Importer:
+    """
+    Bulk importer of one table / Массовый импортёр одной таблицы
+
+    The file is streamed row by row, rows are validated and normalised in batches,
+    each batch is sent with COPY FROM STDIN into a temporary staging table, and the staging table
+    is merged into the target table in the same transaction. Rows that fail validation are written
+    to a reject file next to the source file with the reason in the last column.
+
+    Файл читается построчно, строки проверяются и нормализуются пачками,
+    каждая пачка отправляется через COPY FROM STDIN во временную таблицу, а временная таблица
+    сливается с целевой в той же транзакции. Строки, не прошедшие проверку, записываются
+    в файл отказов рядом с исходным файлом с причиной в последней колонке.
+    """
+
+    # ===== IMPORT SETTINGS / НАСТРОЙКИ ИМПОРТА =====
+    BATCH_SIZE = 5000  # Rows per COPY / Строк за один COPY
+    REQUIRED = ("f_fio", "f_title")  # Columns that must not be empty / Колонки, которые не могут быть пустыми
+    STAGE_TABLE = "import_stage"  # Temporary staging table / Временная промежуточная таблица
+
+    # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
+    def __init__(self, table_name: str, columns: list, connection: Connection | None = None):
+        """
+        Initialize importer for a table / Инициализация импортёра для таблицы
+
+        Args:
+            table_name (str): Name of the database table / Имя таблицы в БД
+            columns (list): Columns to fill (excluding ID) / Заполняемые колонки (без ID)
+            connection: Connection handler, a new one if None / Обработчик соединения, новый если None
+        """
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        self.table_name = table_name
+        self.columns = list(columns)
+        self.condb = connection or Connection()
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    @staticmethod
+    def reject_path_for(path: str | Path) -> Path:
+        """
+        Reject file path for a source file / Путь файла отказов для исходного файла
+
+        Args:
+            path: Source file path / Путь исходного файла
+
+        Returns:
+            Path: students.csv -> students.rejects.csv
+        """
+        path = Path(path)
+        return path.with_name(f"{path.stem}.rejects.csv")
+
+    def run(self, handle, path: str | Path) -> dict:
+        """
+        Import a file / Импорт файла
+
+        ! Runs in a worker thread through QueryExecutor.submit. /
+        ! Выполняется в рабочем потоке через QueryExecutor.submit.
+
+        Progress reports the number of rows read. Cancelling rolls the whole import back.
+        Прогресс сообщает количество прочитанных строк. Отмена откатывает весь импорт.
+
+        Args:
+            handle: Query handle for progress and cancel / Дескриптор запроса для прогресса и отмены
+            path: CSV or XLSX file / CSV или XLSX файл
+
+        Returns:
+            dict: Import statistics / Статистика импорта
+        """
+        started = time.perf_counter()
+        path = Path(path)
+        reject_path = self.reject_path_for(path)
+        # Rejects of an earlier run are stale / Отказы прошлого запуска устарели
+        reject_path.unlink(missing_ok=True)
+        stats = {"read": 0, "loaded": 0, "inserted": 0, "rejected": 0}
+
+        columns_sql = ", ".join(self.columns)
+        reject_file = None
+        reject_writer = None
+
+        try:
+            with self.condb.transaction(self.table_name) as cursor:
+                # Staging table has the target columns and is dropped on commit /
+                # Промежуточная таблица имеет колонки целевой и удаляется при фиксации
+                cursor.execute(
+                    f"CREATE TEMP TABLE {self.STAGE_TABLE} ON COMMIT DROP AS "
+                    f'SELECT {columns_sql} FROM "{self.table_name}" WITH NO DATA'
+                )
+
+                batch: list = []
+                for source_row in self._read_rows(path):
+                    if handle.is_cancelled():
+                        raise InterruptedError("Import cancelled.")
+                    stats["read"] += 1
+
+                    row, error = self._normalise(source_row)
+                    if error is None:
+                        batch.append(row)
+                    else:
+                        # Reject file is created only when needed / Файл отказов создаётся только при необходимости
+                        if reject_writer is None:
+                            reject_file = open(reject_path, "w", encoding="utf-8", newline="")
+                            reject_writer = csv.writer(reject_file)
+                            reject_writer.writerow([*self.columns, "error"])
+                        reject_writer.writerow(
+                            [*(source_row.get(column, "") for column in self.columns), error]
+                        )
+                        stats["rejected"] += 1
+
+                    if len(batch) >= self.BATCH_SIZE:
+                        stats["loaded"] += self._copy_batch(cursor, batch)
+                        batch = []
+                        handle.report_progress(stats["read"])
+
+                if batch:
+                    stats["loaded"] += self._copy_batch(cursor, batch)
+                handle.report_progress(stats["read"])
+
+                stats["inserted"] = self._merge(cursor)
+        finally:
+            if reject_file is not None:
+                reject_file.close()
+
+        seconds = time.perf_counter() - started
+        stats["seconds"] = round(seconds, 3)
+        stats["rows_per_s"] = round(stats["read"] / seconds) if seconds > 0 else 0
+        stats["reject_path"] = str(reject_path) if stats["rejected"] else None
+
+        self.lg.info(
+            "Imported %s into %s: read %s, inserted %s, rejected %s in %.2f s (%s rows/s).",
+            path.name,
+            self.table_name,
+            stats["read"],
+            stats["inserted"],
+            stats["rejected"],
+            seconds,
+            stats["rows_per_s"],
+        )
+        return stats
+
+    # ===== PRIVATE METHODS - READING / ПРИВАТНЫЕ МЕТОДЫ - ЧТЕНИЕ =====
+
+    def _read_rows(self, path: Path) -> Iterator[dict]:
+        """
+        Stream file rows as {column: text} / Потоковое чтение строк файла как {колонка: текст}
+
+        Header names are matched to columns without case and the f_ prefix, so "FIO" fills f_fio.
+        Имена заголовков сопоставляются с колонками без учёта регистра и префикса f_, поэтому "FIO" заполняет f_fio.
+
+        Args:
+            path: CSV or XLSX file / CSV или XLSX файл
+
+        Yields:
+            dict: One row keyed by column name, "__extra__" holds surplus cells /
+                  Одна строка по именам колонок, "__extra__" хранит лишние ячейки
+        """
+        if path.suffix.lower() in (".xlsx", ".xlsm"):
+            rows = self._read_xlsx(path)
+        else:
+            rows = self._read_csv(path)
+
+        header = next(rows, None)
+        if header is None:
+            return
+
+        known = {column.lower().removeprefix("f_"): column for column in self.columns}
+        mapping = [
+            known.get(str(name or "").strip().lower().removeprefix("f_"))
+            for name in header
+        ]
+        if not any(mapping):
+            raise ValueError(
+                f"No known columns in the header, expected: {', '.join(self.columns)}"
+            )
+
+        for values in rows:
+            # Blank lines are skipped / Пустые строки пропускаются
+            if not any(value not in (None, "") for value in values):
+                continue
+            row = {}
+            for column, value in zip(mapping, values):
+                if column is not None:
+                    row[column] = "" if value is None else str(value)
+            if len(values) > len(mapping):
+                row["__extra__"] = values[len(mapping):]
+            yield row
+
+    def _read_csv(self, path: Path) -> Iterator[list]:
+        """Stream CSV rows, delimiter is taken from the header / Потоковое чтение строк CSV, разделитель берётся из заголовка"""
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            # Most frequent candidate in the header line wins / Побеждает самый частый кандидат в строке заголовка
+            header_line = f.readline()
+            f.seek(0)
+            delimiter = max(",;\t", key=header_line.count)
+            yield from csv.reader(f, delimiter=delimiter)
+
+    def _read_xlsx(self, path: Path) -> Iterator[list]:
+        """Stream rows of the first XLSX sheet / Потоковое чтение строк первого листа XLSX"""
+        if openpyxl is None:
+            raise RuntimeError("XLSX import needs the openpyxl package.")
+        # Read-only mode keeps memory flat for big sheets / Режим только чтения держит память ровной для больших листов
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            for values in workbook.active.iter_rows(values_only=True):
+                yield list(values)
+        finally:
+            workbook.close()
+
+    # ===== PRIVATE METHODS - VALIDATION / ПРИВАТНЫЕ МЕТОДЫ - ВАЛИДАЦИЯ =====
+
+    def _normalise(self, row: dict) -> tuple[tuple | None, str | None]:
+        """
+        Validate and normalise one row / Проверка и нормализация одной строки
+
+        Args:
+            row: Row keyed by column name / Строка по именам колонок
+
+        Returns:
+            tuple: (values in column order, None) or (None, error) / (значения в порядке колонок, None) или (None, ошибка)
+        """
+        if row.get("__extra__"):
+            return None, "Too many fields"
+
+        values = []
+        for column in self.columns:
+            value = row.get(column, "").strip()
+            if column != "f_comment":
+                # Collapse inner whitespace except in free text / Схлопывание внутренних пробелов, кроме свободного текста
+                value = " ".join(value.split())
+            if column == "f_email":
+                value = value.lower()
+                if value and "@" not in value:
+                    return None, f"Invalid email: {value}"
+            if not value and column in self.REQUIRED:
+                return None, f"Field {column} is required"
+            values.append(value or None)
+        return tuple(values), None
+
+    # ===== PRIVATE METHODS - LOADING / ПРИВАТНЫЕ МЕТОДЫ - ЗАГРУЗКА =====
+
+    def _copy_batch(self, cursor, batch: list) -> int:
+        """
+        Send a batch into the staging table with COPY / Отправка пачки во временную таблицу через COPY
+
+        Args:
+            cursor: Cursor of the import transaction / Курсор транзакции импорта
+            batch: Normalised rows / Нормализованные строки
+
+        Returns:
+            int: Number of copied rows / Количество скопированных строк
+        """
+        buffer = io.StringIO()
+        # Unquoted empty field is NULL in CSV COPY / Пустое поле без кавычек в CSV COPY означает NULL
+        csv.writer(buffer, lineterminator="\n").writerows(batch)
+        buffer.seek(0)
+        cursor.copy_expert(
+            f"COPY {self.STAGE_TABLE} ({', '.join(self.columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        return len(batch)
+
+    def _merge(self, cursor) -> int:
+        """
+        Merge staged rows into the target table / Слияние промежуточных строк с целевой таблицей
+
+        Rows identical to existing records or to each other are skipped, so importing
+        the same file twice does not duplicate records.
+        Строки, совпадающие с существующими записями или друг с другом, пропускаются, поэтому
+        повторный импорт того же файла не дублирует записи.
+
+        Args:
+            cursor: Cursor of the import transaction / Курсор транзакции импорта
+
+        Returns:
+            int: Number of inserted records / Количество вставленных записей
+        """
+        columns_sql = ", ".join(self.columns)
+        same_row = " AND ".join(
+            f"t.{column} IS NOT DISTINCT FROM s.{column}" for column in self.columns
+        )
+        cursor.execute(
+            f'INSERT INTO "{self.table_name}" ({columns_sql}) '
+            f"SELECT DISTINCT {columns_sql} FROM {self.STAGE_TABLE} s "
+            f'WHERE NOT EXISTS (SELECT 1 FROM "{self.table_name}" t WHERE {same_row})'
+        )
+        return cursor.rowcount
@@ -0,0 +1,340 @@
+# ===== BACKGROUND QUERY EXECUTOR / ФОНОВЫЙ ИСПОЛНИТЕЛЬ ЗАПРОСОВ =====
+# Runs database work on a QThreadPool so the GUI thread never blocks on PostgreSQL
+# Выполняет работу с БД в QThreadPool, чтобы GUI поток никогда не блокировался на PostgreSQL
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import threading
+from typing import Any, Callable
+
+# PyQt6 core imports / Импорты ядра PyQt6
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# PostgreSQL database adapter imports / Импорты адаптера базы данных PostgreSQL
+import psycopg2
+
+# Local application imports / Импорты локального приложения
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+from src.core.Tracer import Tracer
+from src.database.ConnectionPool import ConnectionPool
+
+
+# ===== QUERY HANDLE CLASS / КЛАСС ДЕСКРИПТОРА ЗАПРОСА =====
+class QueryHandle(QObject):
+    """
+    Future-like handle of one background query / Future-подобный дескриптор одного фонового запроса
+
+    Worker events are relayed through the thread the handle lives in, so the caller can connect
+    to the signals right after submit() without missing a query that finishes immediately.
+    События рабочего потока передаются через поток, в котором живёт дескриптор, поэтому вызывающий
+    может подключиться к сигналам сразу после submit(), не пропустив мгновенно завершённый запрос.
+    """
+
+    # ===== SIGNALS / СИГНАЛЫ =====
+    finished = pyqtSignal(object)  # Query result / Результат запроса
+    failed = pyqtSignal(str)  # Error message / Сообщение об ошибке
+    progress = pyqtSignal(int)  # Progress value (rows processed) / Прогресс (обработано строк)
+    chunk = pyqtSignal(object)  # Partial result of a streaming query / Частичный результат потокового запроса
+    cancelled = pyqtSignal()  # Query was cancelled / Запрос отменён
+    _relay = pyqtSignal(str, object)  # Worker event to re-emit / Событие рабочего потока для повторного испускания
+
+    # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
+    def __init__(self, parent=None):
+        """
+        Initialize empty handle / Инициализация пустого дескриптора
+
+        Args:
+            parent: Parent object / Родительский объект
+        """
+        super().__init__(parent)
+
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._cancelled = False
+        self._connection = None
+        self._result: Any = None
+        self._error: str | None = None
+
+        # Queued to the handle's thread when emitted by a worker / Ставится в очередь потока дескриптора при испускании из рабочего потока
+        self._relay.connect(self._on_relay)
+
+    # ===== PUBLIC METHODS - STATE / ПУБЛИЧНЫЕ МЕТОДЫ - СОСТОЯНИЕ =====
+
+    def cancel(self) -> None:
+        """
+        Cancel the query / Отмена запроса
+
+        A query that is already running on the server is interrupted with a cancel request.
+        Уже выполняющийся на сервере запрос прерывается запросом отмены.
+        """
+        with self._lock:
+            if self._cancelled or self._done.is_set():
+                return
+            self._cancelled = True
+            conn = self._connection
+        if conn is not None and not conn.closed:
+            try:
+                conn.cancel()
+            except psycopg2.Error:
+                pass
+
+    def is_cancelled(self) -> bool:
+        """Check if cancel() was requested / Проверка, был ли запрошен cancel()"""
+        return self._cancelled
+
+    def done(self) -> bool:
+        """Check if the query has completed in any way / Проверка, завершён ли запрос любым образом"""
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until the query completes / Блокировка до завершения запроса
+
+        Not for use on the GUI thread / Не для использования в GUI потоке.
+
+        Args:
+            timeout: Seconds to wait, None for no limit / Секунд ожидания, None без ограничения
+
+        Returns:
+            bool: True if completed / True если завершён
+        """
+        return self._done.wait(timeout)
+
+    def result(self) -> Any:
+        """Result of a finished query / Результат завершённого запроса"""
+        return self._result
+
+    def error(self) -> str | None:
+        """Error message of a failed query / Сообщение об ошибке неудавшегося запроса"""
+        return self._error
+
+    def report_progress(self, value: int) -> None:
+        """
+        Emit progress from inside the worker function / Испускание прогресса изнутри рабочей функции
+
+        Args:
+            value: Progress value / Значение прогресса
+        """
+        if not self._cancelled:
+            self._relay.emit("progress", value)
+
+    def report_chunk(self, data: Any) -> None:
+        """
+        Emit a partial result from inside the worker function / Испускание частичного результата изнутри рабочей функции
+
+        Args:
+            data: Partial result / Частичный результат
+        """
+        if not self._cancelled:
+            self._relay.emit("chunk", data)
+
+    # ===== PRIVATE METHODS - WORKER SIDE / ПРИВАТНЫЕ МЕТОДЫ - СТОРОНА РАБОЧЕГО ПОТОКА =====
+
+    def _attach_connection(self, conn) -> None:
+        """Remember connection used by the worker for cancel() / Запоминание соединения рабочего потока для cancel()"""
+        with self._lock:
+            self._connection = conn
+
+    def _set_result(self, result: Any) -> None:
+        with self._lock:
+            self._connection = None
+            self._result = result
+            cancelled = self._cancelled
+            self._done.set()
+        self._relay.emit("cancelled" if cancelled else "finished", result)
+
+    def _set_error(self, message: str) -> None:
+        with self._lock:
+            self._connection = None
+            self._error = message
+            cancelled = self._cancelled
+            self._done.set()
+        self._relay.emit("cancelled" if cancelled else "failed", message)
+
+    def _on_relay(self, name: str, payload: Any) -> None:
+        """Re-emit a worker event in the handle's thread / Повторное испускание события рабочего потока в потоке дескриптора"""
+        if name == "cancelled":
+            self.cancelled.emit()
+        elif name in ("progress", "chunk") and self._cancelled:
+            # Stale partial results queued before cancel() / Устаревшие частичные результаты, поставленные в очередь до cancel()
+            return
+        else:
+            getattr(self, name).emit(payload)
+
+
+# ===== QUERY TASK CLASS / КЛАСС ЗАДАЧИ ЗАПРОСА =====
+class QueryTask(QRunnable):
+    """
+    QRunnable that runs one function on a pooled connection / QRunnable, выполняющий одну функцию на соединении из пула
+
+    The connection is checked out for the whole task so that nested Connection calls share it
+    and the handle can cancel the running statement.
+    Соединение получается на всю задачу, чтобы вложенные вызовы Connection использовали его
+    и дескриптор мог отменить выполняющийся запрос.
+    """
+
+    def __init__(self, handle: QueryHandle, fn: Callable, args: tuple, kwargs: dict):
+        """
+        Args:
+            handle: Handle to report to / Дескриптор для отчёта
+            fn: Function called as fn(handle, *args, **kwargs) / Функция, вызываемая как fn(handle, *args, **kwargs)
+            args: Positional arguments / Позиционные аргументы
+            kwargs: Keyword arguments / Именованные аргументы
+        """
+        super().__init__()
+        self.setAutoDelete(True)
+
+        self.handle = handle
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        """Worker thread body / Тело рабочего потока"""
+        handle = self.handle
+        if handle.is_cancelled():
+            handle._set_result(None)
+            return
+
+        pool = ConnectionPool()
+        try:
+            with (
+                Tracer().span("QueryTask.run", "worker", fn=getattr(self.fn, "__qualname__", self.fn)),
+                pool.connection() as conn,
+            ):
+                handle._attach_connection(conn)
+                result = self.fn(handle, *self.args, **self.kwargs)
+            handle._set_result(result)
+        except Exception as e:
+            handle._set_error(str(e).strip())
+
+
+# ===== THREAD COUNT RELAY CLASS / КЛАСС ПЕРЕДАЧИ ЧИСЛА ПОТОКОВ =====
+class _ThreadCountRelay(QObject):
+    """
+    Applies a new worker count in the thread it lives in / Применяет новое число рабочих потоков в своём потоке
+
+    Settings callbacks come from the file watcher thread, the signal queues them to the executor's thread.
+    Обратные вызовы настроек приходят из потока наблюдателя файлов, сигнал ставит их в очередь потока исполнителя.
+    """
+
+    # ===== SIGNALS / СИГНАЛЫ =====
+    resize = pyqtSignal(int)  # New maximum thread count / Новое максимальное число потоков
+
+    def __init__(self, thread_pool: QThreadPool):
+        """
+        Args:
+            thread_pool: Thread pool to resize / Пул потоков для изменения размера
+        """
+        super().__init__()
+        self._thread_pool = thread_pool
+        self.resize.connect(self._on_resize)
+
+    def _on_resize(self, size: int) -> None:
+        """Set the maximum thread count / Установка максимального числа потоков"""
+        self._thread_pool.setMaxThreadCount(size)
+
+
+# ===== QUERY EXECUTOR CLASS / КЛАСС ИСПОЛНИТЕЛЯ ЗАПРОСОВ =====
+class QueryExecutor:
+    """
+    Background query executor / Фоновый исполнитель запросов
+    Singleton pattern implementation shared by all models / Реализация паттерна Singleton, общая для всех моделей
+
+    Owns a QThreadPool sized to the connection pool so workers never wait for connections.
+    The size follows pool_max_size when perf_settings.json is reloaded.
+    Владеет QThreadPool, размер которого равен пулу соединений, чтобы рабочие потоки не ждали соединений.
+    Размер следует за pool_max_size при перезагрузке perf_settings.json.
+    """
+
+    # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
+    _instanse_Executor = None  # Stores single instance / Хранит единственный экземпляр
+    _initialized_Executor = (
+        False  # Single initialization flag / Флаг на единственную инициализацию
+    )
+
+    # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
+    def __new__(cls):
+        """
+        Create single class instance / Создание единого объекта класса
+
+        Returns:
+            QueryExecutor: Single instance of the executor class
+        """
+        if cls._instanse_Executor is None:
+            # If no class instance exists, create one / Если экземпляра класса нет создаём
+            cls._instanse_Executor = super().__new__(cls)
+        return cls._instanse_Executor
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self):
+        """
+        Initialize executor only once / Инициализация исполнителя только один раз
+        """
+        if QueryExecutor._initialized_Executor:
+            return
+        QueryExecutor._initialized_Executor = True
+
+        # ===== LOGGING SETUP / НАСТРОЙКА ЛОГИРОВАНИЯ =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        # ===== THREAD POOL SETUP / НАСТРОЙКА ПУЛА ПОТОКОВ =====
+        self._thread_pool = QThreadPool()
+        self._thread_pool.setMaxThreadCount(ConnectionPool().max_size)
+        self._relay = _ThreadCountRelay(self._thread_pool)
+        appcfg = AppConfig()
+        appcfg.subscribe(appcfg.save_set_perf_file, self._apply_perf)
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def submit(self, fn: Callable, *args, **kwargs) -> QueryHandle:
+        """
+        Run fn(handle, *args, **kwargs) in the background / Выполнение fn(handle, *args, **kwargs) в фоне
+
+        Args:
+            fn: Function with database work / Функция с работой с БД
+
+        Returns:
+            QueryHandle: Handle with result/error/progress signals /
+                         Дескриптор с сигналами результата/ошибки/прогресса
+        """
+        handle = QueryHandle()
+        self._thread_pool.start(QueryTask(handle, fn, args, kwargs))
+        return handle
+
+    def execute(self, connection, query, params: Any | None = None) -> QueryHandle:
+        """
+        Run Connection.execute_query in the background / Выполнение Connection.execute_query в фоне
+
+        Args:
+            connection: Connection handler / Обработчик соединения
+            query (str): SQL query string / SQL запрос
+            params (tuple, optional): Query parameters / Параметры запроса
+
+        Returns:
+            QueryHandle: Handle whose finished signal carries the rows (or None for DML) /
+                         Дескриптор, сигнал finished которого несёт строки (или None для DML)
+        """
+        return self.submit(
+            lambda handle: connection.execute_query(query, params)
+        )
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """
+        Wait for all queued queries, used on shutdown / Ожидание всех запросов в очереди, используется при завершении
+
+        Args:
+            msecs: Timeout in milliseconds, -1 for no limit / Таймаут в миллисекундах, -1 без ограничения
+        """
+        return self._thread_pool.waitForDone(msecs)
+
+    # ===== PRIVATE METHODS / ПРИВАТНЫЕ МЕТОДЫ =====
+
+    def _apply_perf(self, perf: dict) -> None:
+        """Follow pool_max_size from perf_settings.json / Следование за pool_max_size из perf_settings.json"""
+        size = perf["pool_max_size"]
+        self.lg.debug("Worker threads: %s.", size)
+        self._relay.resize.emit(size)
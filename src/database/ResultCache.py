@@ -0,0 +1,252 @@
+# ===== QUERY RESULT CACHE / КЭШ РЕЗУЛЬТАТОВ ЗАПРОСОВ =====
+# Keeps recent SELECT results per table and drops them when the table is written
+# Хранит недавние результаты SELECT по таблицам и удаляет их при записи в таблицу
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Local application imports / Импорты локального приложения
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+
+
+# ===== RESULT CACHE CLASS / КЛАСС КЭША РЕЗУЛЬТАТОВ =====
+class ResultCache:
+    """
+    LRU cache of query results with per-table invalidation / LRU кэш результатов запросов с инвалидацией по таблицам
+    Singleton pattern implementation shared by all connections / Реализация паттерна Singleton, общая для всех соединений
+
+    Switching between modes builds a new model that loads the same table again. Connection looks up
+    SELECT results here by normalised SQL and parameters before going to the server.
+    - Entries expire after result_cache_ttl_s, so changes by other users show up / Записи устаревают через result_cache_ttl_s, поэтому изменения других пользователей становятся видны
+    - At most result_cache_size entries, least recently used are evicted / Не более result_cache_size записей, давно не использованные вытесняются
+    - Results over result_cache_max_rows rows are not kept / Результаты больше result_cache_max_rows строк не хранятся
+    - Every write through Connection drops the entries of its table / Каждая запись через Connection удаляет записи своей таблицы
+
+    Переключение режимов создаёт новую модель, которая снова загружает ту же таблицу. Connection ищет
+    результаты SELECT здесь по нормализованному SQL и параметрам, прежде чем идти на сервер.
+
+    A write bumps the generation of its table; a result read while the generation changed is not stored,
+    so a SELECT that raced a write never brings stale rows back.
+    Запись увеличивает поколение своей таблицы; результат, прочитанный во время смены поколения, не сохраняется,
+    поэтому SELECT, выполнявшийся одновременно с записью, никогда не вернёт устаревшие строки.
+    """
+
+    # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
+    _instanse_ResultCache = None  # Stores single instance / Хранит единственный экземпляр
+    _initialized_ResultCache = (
+        False  # Single initialization flag / Флаг на единственную инициализацию
+    )
+
+    # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
+    def __new__(cls):
+        """
+        Create single class instance / Создание единого объекта класса
+
+        Returns:
+            ResultCache: Single instance of the cache class
+        """
+        if cls._instanse_ResultCache is None:
+            # If no class instance exists, create one / Если экземпляра класса нет создаём
+            cls._instanse_ResultCache = super().__new__(cls)
+        return cls._instanse_ResultCache
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self):
+        """
+        Initialize cache only once / Инициализация кэша только один раз
+        """
+        if ResultCache._initialized_ResultCache:
+            return
+        ResultCache._initialized_ResultCache = True
+
+        # ===== LOGGING SETUP / НАСТРОЙКА ЛОГИРОВАНИЯ =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        # ===== CACHE LIMITS / ОГРАНИЧЕНИЯ КЭША =====
+        appcfg = AppConfig()
+        self._apply_perf(appcfg.perf_settings)
+        appcfg.subscribe(appcfg.save_set_perf_file, self._apply_perf)
+
+        # ===== CACHE STATE / СОСТОЯНИЕ КЭША =====
+        # key -> (table, value, rows, expires at) in LRU order / ключ -> (таблица, значение, строки, истекает) в порядке LRU
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        # table -> write generation, epoch counts invalidations of all tables /
+        # таблица -> поколение записи, эпоха считает инвалидации всех таблиц
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+
+        # ===== STATISTICS / СТАТИСТИКА =====
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expired": 0,
+            "invalidations": 0,
+            "too_large": 0,
+        }
+
+        atexit.register(self.log_stats)
+        Metrics().register_gauge("result_cache", self.stats)
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    @staticmethod
+    def key(kind: str, query: str, params: Any | None) -> tuple | None:
+        """
+        Cache key of a query / Ключ кэша запроса
+
+        Whitespace of the SQL is normalised and list parameters become tuples.
+        Пробелы в SQL нормализуются, а параметры-списки становятся кортежами.
+
+        Args:
+            kind (str): "rows" for execute_query, "stream" for stream_query / "rows" для execute_query, "stream" для stream_query
+            query (str): SQL query / SQL запрос
+            params: Query parameters / Параметры запроса
+
+        Returns:
+            tuple | None: Hashable key, None if the parameters cannot be a key /
+                          Хешируемый ключ, None если параметры не могут быть ключом
+        """
+
+        def freeze(value: Any) -> Any:
+            if isinstance(value, (list, tuple)):
+                return tuple(freeze(item) for item in value)
+            return value
+
+        key = (kind, " ".join(query.split()), freeze(params))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: tuple | None) -> tuple[bool, Any]:
+        """
+        Look up a result / Поиск результата
+
+        Args:
+            key: Key from key() / Ключ из key()
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss / (True, значение) при попадании, (False, None) при промахе
+        """
+        if key is None or self.capacity <= 0:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[3] < time.monotonic():
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, entry[1]
+
+    def generation(self, table: str) -> tuple[int, int]:
+        """
+        Write generation of a table, taken before a read / Поколение записи таблицы, берётся перед чтением
+        """
+        with self._lock:
+            return self._epoch, self._generations.get(table, 0)
+
+    def put(
+        self, key: tuple | None, table: str, value: Any, rows: int, generation: tuple[int, int]
+    ) -> None:
+        """
+        Store a result unless the table was written since the read started /
+        Сохранение результата, если в таблицу не писали с начала чтения
+
+        Args:
+            key: Key from key() / Ключ из key()
+            table (str): Table the query reads / Таблица, которую читает запрос
+            value: Result to keep, must not be changed afterwards / Хранимый результат, не должен меняться после
+            rows (int): Number of rows in the result / Количество строк в результате
+            generation (tuple): generation(table) before the read / generation(table) перед чтением
+        """
+        if key is None or self.capacity <= 0:
+            return
+        with self._lock:
+            if rows > self.max_rows:
+                self._stats["too_large"] += 1
+                return
+            if (self._epoch, self._generations.get(table, 0)) != generation:
+                return
+            self._entries[key] = (table, value, rows, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            self._stats["stores"] += 1
+            self._evict()
+
+    def invalidate(self, table: str | None = None) -> None:
+        """
+        Drop results of a table, all results if None / Удаление результатов таблицы, всех результатов если None
+
+        Args:
+            table (str, optional): Written table / Таблица, в которую писали
+        """
+        with self._lock:
+            if table is None:
+                self._epoch += 1
+                self._entries.clear()
+            else:
+                self._generations[table] = self._generations.get(table, 0) + 1
+                for key in [key for key, entry in self._entries.items() if entry[0] == table]:
+                    del self._entries[key]
+            self._stats["invalidations"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of cache statistics / Снимок статистики кэша
+
+        Returns:
+            dict: Counters, size and hit rate / Счётчики, размер и доля попаданий
+        """
+        with self._lock:
+            snapshot: dict[str, Any] = dict(self._stats)
+            snapshot["entries"] = len(self._entries)
+            snapshot["rows"] = sum(entry[2] for entry in self._entries.values())
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_rate"] = round(snapshot["hits"] / lookups, 3) if lookups else 0.0
+        return snapshot
+
+    def log_stats(self) -> None:
+        """
+        Write cache statistics to the log / Запись статистики кэша в лог
+        """
+        self.lg.info(lambda: f"Result cache stats: {self.stats()}")
+
+    # ===== PRIVATE METHODS / ПРИВАТНЫЕ МЕТОДЫ =====
+
+    def _apply_perf(self, perf: dict) -> None:
+        """
+        Apply result_cache_* settings from perf_settings.json / Применение настроек result_cache_* из perf_settings.json
+        """
+        self.capacity = perf["result_cache_size"]
+        self.ttl = perf["result_cache_ttl_s"]
+        self.max_rows = perf["result_cache_max_rows"]
+        if hasattr(self, "_entries"):
+            with self._lock:
+                self._evict()
+
+    def _evict(self) -> None:
+        """
+        Evict least recently used entries above the capacity / Вытеснение давно не использованных записей сверх ёмкости
+
+        ! Called with the lock held. / ! Вызывается под блокировкой.
+        """
+        while len(self._entries) > max(self.capacity, 0):
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
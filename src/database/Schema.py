@@ -0,0 +1,199 @@
+# ===== SCHEMA STEPS / ШАГИ СХЕМЫ =====
+# Idempotent database objects the application relies on for performance
+# Идемпотентные объекты базы данных, на которые приложение опирается ради производительности
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import threading
+
+# PostgreSQL database adapter imports / Импорты адаптера базы данных PostgreSQL
+import psycopg2
+from psycopg2 import sql
+
+# Local application imports / Импорты локального приложения
+from src.core.Logger import Logger
+from src.database.Connection import Connection
+from src.database.queries.QueryBuilder import AdvancedQueryBuilder
+
+
+# ===== SCHEMA CLASS / КЛАСС СХЕМЫ =====
+class Schema:
+    """
+    Idempotent schema steps / Идемпотентные шаги схемы
+
+    Every step checks what exists and only creates what is missing, so it is safe to run on every start.
+    Steps need CREATE privileges; without them the application still works, only slower, and a warning is logged.
+
+    Каждый шаг проверяет, что уже есть, и создаёт только недостающее, поэтому его безопасно выполнять при каждом запуске.
+    Шагам нужны права CREATE; без них приложение всё равно работает, только медленнее, и в лог пишется предупреждение.
+    """
+
+    # (step, table) pairs already checked in this process / Пары (шаг, таблица), уже проверенные в этом процессе
+    _checked: set[tuple[str, str]] = set()
+    _checked_lock = threading.Lock()
+    # pg_trgm is installed: None until checked / pg_trgm установлен: None до проверки
+    _trigram: bool | None = None
+
+    # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
+    def __init__(self, connection: Connection | None = None):
+        """
+        Args:
+            connection: Connection handler, a new one if None / Обработчик соединения, новый если None
+        """
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        self.condb = connection or Connection()
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    @classmethod
+    def is_checked(cls, table_name: str, step: str = "search_index") -> bool:
+        """Check if a step of a table already ran in this process / Проверка, выполнялся ли уже шаг таблицы в этом процессе"""
+        with cls._checked_lock:
+            return (step, table_name) in cls._checked
+
+    @classmethod
+    def trigram_available(cls) -> bool:
+        """
+        Check if search may use pg_trgm functions / Проверка, может ли поиск использовать функции pg_trgm
+
+        Assumed until ensure_search_index finds the extension missing.
+        Предполагается, пока ensure_search_index не обнаружит отсутствие расширения.
+        """
+        return cls._trigram is not False
+
+    @classmethod
+    def _claim(cls, table_name: str, step: str) -> bool:
+        """Mark a step as checked, False if it already was / Отметка шага как проверенного, False если он уже был"""
+        with cls._checked_lock:
+            if (step, table_name) in cls._checked:
+                return False
+            cls._checked.add((step, table_name))
+            return True
+
+    def ensure_search_index(self, handle, table_name: str, columns: list) -> bool:
+        """
+        Create the pg_trgm extension and the trigram search index of a table if missing /
+        Создание расширения pg_trgm и триграммного индекса поиска таблицы, если их нет
+
+        The index is built CONCURRENTLY, so writes continue meanwhile; a build that failed earlier
+        leaves an invalid index, which is dropped and built again. Runs once per table and process.
+
+        Индекс строится CONCURRENTLY, поэтому запись в это время продолжается; прерванное ранее построение
+        оставляет недействительный индекс, который удаляется и строится заново. Выполняется один раз на таблицу и процесс.
+
+        ! Runs in a worker thread through QueryExecutor.submit. / ! Выполняется в рабочем потоке через QueryExecutor.submit.
+
+        Args:
+            handle: Query handle of the step / Дескриптор запроса шага
+            table_name (str): Name of the database table / Имя таблицы в БД
+            columns (list): Searched columns / Колонки поиска
+
+        Returns:
+            bool: True if the index is usable / True если индекс можно использовать
+        """
+        if not self._claim(table_name, "search_index"):
+            return True
+
+        index_name = AdvancedQueryBuilder.search_index_name(table_name)
+        try:
+            with self.condb.pool.connection() as conn:
+                # CREATE INDEX CONCURRENTLY cannot run inside a transaction /
+                # CREATE INDEX CONCURRENTLY не может выполняться внутри транзакции
+                autocommit = conn.autocommit
+                conn.autocommit = True
+                try:
+                    with conn.cursor() as cursor:
+                        try:
+                            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                        except psycopg2.Error as e:
+                            # No privilege or not shipped, it may still be installed by an administrator /
+                            # Нет прав или не поставляется, но его мог установить администратор
+                            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                            if cursor.fetchone() is None:
+                                Schema._trigram = False
+                                self.lg.warning(
+                                    "pg_trgm not available, search falls back to ILIKE: %s.", e
+                                )
+                                return False
+                        Schema._trigram = True
+                        cursor.execute(
+                            "SELECT i.indisvalid FROM pg_index i "
+                            "JOIN pg_class c ON c.oid = i.indexrelid "
+                            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+                            (index_name,),
+                        )
+                        row = cursor.fetchone()
+                        if row is not None and row[0]:
+                            return True
+                        if row is not None:
+                            self.lg.warning("Rebuilding invalid index %s.", index_name)
+                            cursor.execute(
+                                sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(
+                                    sql.Identifier(index_name)
+                                )
+                            )
+                        # Building may take longer than statement_timeout / Построение может занять больше statement_timeout
+                        cursor.execute("SET statement_timeout = 0")
+                        try:
+                            cursor.execute(
+                                AdvancedQueryBuilder.create_search_index(table_name, columns)
+                            )
+                        finally:
+                            cursor.execute("RESET statement_timeout")
+                        self.lg.info("Created search index %s.", index_name)
+                        return True
+                finally:
+                    conn.autocommit = autocommit
+        except Exception as e:
+            # With pg_trgm installed search still works without the index, with a full scan /
+            # При установленном pg_trgm поиск работает и без индекса, полным просмотром
+            self.lg.warning("Search index %s not available: %s.", index_name, e)
+            return False
+
+    def ensure_change_triggers(self, handle, table_name: str) -> bool:
+        """
+        Create the triggers announcing row changes of a table if missing /
+        Создание триггеров, сообщающих об изменениях строк таблицы, если их нет
+
+        Every committed INSERT, UPDATE and DELETE sends a NOTIFY with table, operation and id on
+        AdvancedQueryBuilder.CHANGE_CHANNEL, which ChangeListener turns into row patches in other clients.
+        Runs once per table and process.
+
+        Каждый зафиксированный INSERT, UPDATE и DELETE отправляет NOTIFY с таблицей, операцией и id в
+        AdvancedQueryBuilder.CHANGE_CHANNEL, который ChangeListener превращает в точечные обновления строк в других клиентах.
+        Выполняется один раз на таблицу и процесс.
+
+        ! Runs in a worker thread through QueryExecutor.submit. / ! Выполняется в рабочем потоке через QueryExecutor.submit.
+
+        Args:
+            handle: Query handle of the step / Дескриптор запроса шага
+            table_name (str): Name of the database table / Имя таблицы в БД
+
+        Returns:
+            bool: True if the triggers exist / True если триггеры существуют
+        """
+        if not self._claim(table_name, "change_triggers"):
+            return True
+
+        row_trigger, _truncate_trigger = AdvancedQueryBuilder.change_trigger_names(table_name)
+        try:
+            with self.condb.transaction() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM pg_trigger "
+                    "WHERE tgname = %s AND tgrelid = to_regclass(quote_ident(%s))",
+                    (row_trigger, table_name),
+                )
+                if cursor.fetchone() is not None:
+                    return True
+                cursor.execute(AdvancedQueryBuilder.create_change_function())
+                for query in AdvancedQueryBuilder.create_change_triggers(table_name):
+                    cursor.execute(query)
+            self.lg.info("Created change triggers of %s.", table_name)
+            return True
+        except Exception as e:
+            # Other clients then only see changes after a reload / Другие клиенты тогда видят изменения только после перезагрузки
+            self.lg.warning("Change triggers of %s not available: %s.", table_name, e)
+            return False
@@ -0,0 +1,323 @@
+# ===== PREPARED STATEMENT CACHE / КЭШ ПОДГОТОВЛЕННЫХ ЗАПРОСОВ =====
+# Prepares each distinct statement once per pooled connection and executes it by name
+# Подготавливает каждый отдельный запрос один раз на соединение пула и выполняет его по имени
+
+# ===== IMPORTS / ИМПОРТЫ =====
+# Standard library imports / Импорты стандартной библиотеки
+import atexit
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+# PostgreSQL database adapter imports / Импорты адаптера базы данных PostgreSQL
+import psycopg2
+from psycopg2 import errors, extensions
+
+# Local application imports / Импорты локального приложения
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+
+
+# ===== STATEMENT CACHE CLASS / КЛАСС КЭША ЗАПРОСОВ =====
+class StatementCache:
+    """
+    Per-connection LRU cache of server-side prepared statements / LRU кэш серверных подготовленных запросов для каждого соединения
+    Singleton pattern implementation shared by all connections / Реализация паттерна Singleton, общая для всех соединений
+
+    QueryBuilder produces a handful of statements per table that repeat thousands of times.
+    The first execution on a connection sends PREPARE, later ones send only EXECUTE with the
+    parameters, so PostgreSQL skips parsing and planning.
+    - Least recently used statements are DEALLOCATEd above the capacity / Давно не использованные запросы освобождаются сверх ёмкости
+    - A new physical connection starts with an empty cache, so statements are re-prepared after a reconnect /
+      Новое физическое соединение начинает с пустого кэша, поэтому после переподключения запросы подготавливаются заново
+    - Hit rate is tracked and written to the Logger / Доля попаданий отслеживается и записывается в Logger
+
+    QueryBuilder создаёт несколько запросов на таблицу, которые повторяются тысячи раз.
+    Первое выполнение на соединении отправляет PREPARE, последующие - только EXECUTE с
+    параметрами, поэтому PostgreSQL пропускает разбор и планирование.
+    """
+
+    # ===== SINGLETON PATTERN IMPLEMENTATION / РЕАЛИЗАЦИЯ ПАТТЕРНА СИНГЛТОН =====
+    _instanse_StmtCache = None  # Stores single instance / Хранит единственный экземпляр
+    _initialized_StmtCache = (
+        False  # Single initialization flag / Флаг на единственную инициализацию
+    )
+
+    # ===== CACHE SETTINGS / НАСТРОЙКИ КЭША =====
+    # Capacity per connection is statement_cache_size in perf_settings.json /
+    # Ёмкость на соединение - statement_cache_size в perf_settings.json
+    # Only these statements can be prepared / Подготовить можно только эти запросы
+    _PREPARABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "VALUES", "WITH")
+
+    # ===== SINGLETON CREATION METHOD / МЕТОД СОЗДАНИЯ СИНГЛТОНА =====
+    def __new__(cls):
+        """
+        Create single class instance / Создание единого объекта класса
+
+        Returns:
+            StatementCache: Single instance of the cache class
+        """
+        if cls._instanse_StmtCache is None:
+            # If no class instance exists, create one / Если экземпляра класса нет создаём
+            cls._instanse_StmtCache = super().__new__(cls)
+        return cls._instanse_StmtCache
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self):
+        """
+        Initialize cache only once / Инициализация кэша только один раз
+        """
+        if StatementCache._initialized_StmtCache:
+            return
+        StatementCache._initialized_StmtCache = True
+
+        # ===== LOGGING SETUP / НАСТРОЙКА ЛОГИРОВАНИЯ =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        appcfg = AppConfig()
+        self.capacity = appcfg.perf_settings["statement_cache_size"]
+        appcfg.subscribe(appcfg.save_set_perf_file, self._apply_perf)
+
+        # ===== CACHE STATE / СОСТОЯНИЕ КЭША =====
+        # connection -> OrderedDict(sql -> statement name), dropped with the connection /
+        # соединение -> OrderedDict(sql -> имя запроса), удаляется вместе с соединением
+        self._lock = threading.Lock()
+        self._per_conn: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._names = itertools.count(1)
+        # sql -> converted sql with $n placeholders, None if not preparable /
+        # sql -> преобразованный sql с $n, None если подготовить нельзя
+        # Bounded like the per-connection caches, search and filter texts keep varying /
+        # Ограничен как кэши соединений, тексты поиска и фильтров постоянно меняются
+        self._converted: OrderedDict[str, str | None] = OrderedDict()
+
+        # ===== STATISTICS / СТАТИСТИКА =====
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "reprepares": 0,
+            "bypassed": 0,
+        }
+
+        atexit.register(self.log_stats)
+        Metrics().register_gauge("statement_cache", self.stats)
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def execute(self, cursor, query: str, params: Any | None = None) -> None:
+        """
+        Execute a query through a prepared statement / Выполнение запроса через подготовленный запрос
+
+        Statements that cannot be prepared (DDL, named parameters) are executed as is.
+        A lost or outdated statement is prepared again only outside an explicit transaction,
+        inside one the rollback would discard its earlier statements, so the error is raised.
+
+        Запросы, которые нельзя подготовить (DDL, именованные параметры), выполняются как есть.
+        Потерянный или устаревший запрос подготавливается заново только вне явной транзакции,
+        внутри неё откат отбросил бы её предыдущие запросы, поэтому ошибка пробрасывается.
+
+        Args:
+            cursor: Cursor of a pooled connection / Курсор соединения из пула
+            query (str): SQL query with %s placeholders / SQL запрос с заполнителями %s
+            params (tuple, optional): Query parameters / Параметры запроса
+        """
+        if params is None:
+            # Without parameters psycopg2 sends the text untouched / Без параметров psycopg2 отправляет текст без изменений
+            converted = query if self._is_preparable(query) else None
+        elif isinstance(params, (tuple, list)):
+            converted = self._convert(query)
+        else:
+            converted = None
+        # Capacity 0 switches preparing off / Ёмкость 0 выключает подготовку
+        if converted is None or self.capacity <= 0:
+            self._count("bypassed")
+            cursor.execute(query, params)
+            return
+
+        conn = cursor.connection
+        # Checked before PREPARE, which itself opens a transaction /
+        # Проверяется до PREPARE, который сам открывает транзакцию
+        in_transaction = conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE
+        name = self._prepare(cursor, conn, query, converted)
+        args = tuple(params or ())
+        placeholders = ", ".join(["%s"] * len(args))
+        execute_sql = f"EXECUTE {name} ({placeholders})" if args else f"EXECUTE {name}"
+
+        try:
+            cursor.execute(execute_sql, args or None)
+        except (errors.InvalidSqlStatementName, errors.FeatureNotSupported) as e:
+            stale = None
+            if isinstance(e, errors.InvalidSqlStatementName):
+                # Server lost the statements (DISCARD ALL, pooler reset) /
+                # Сервер потерял запросы (DISCARD ALL, сброс пулером)
+                self.forget(conn)
+            else:
+                # Cached plan must not change result type, the table changed after DDL /
+                # Кэшированный план не должен менять тип результата, таблица изменилась после DDL
+                self._drop(conn, query)
+                stale = name
+            if in_transaction:
+                # Retrying needs a rollback of the caller's transaction / Повтор требует отката транзакции вызывающего
+                raise
+
+            # Prepare again once / Подготавливаем заново один раз
+            conn.rollback()
+            if stale is not None:
+                try:
+                    cursor.execute(f"DEALLOCATE {stale}")
+                except psycopg2.Error as e:
+                    conn.rollback()
+                    self.lg.warning("Could not deallocate %s: %s.", stale, e)
+            self._count("reprepares")
+            name = self._prepare(cursor, conn, query, converted)
+            execute_sql = f"EXECUTE {name} ({placeholders})" if args else f"EXECUTE {name}"
+            cursor.execute(execute_sql, args or None)
+
+    def forget(self, conn) -> None:
+        """
+        Drop cache entries of a connection / Удаление записей кэша соединения
+
+        Args:
+            conn: psycopg2 connection / Соединение psycopg2
+        """
+        with self._lock:
+            self._per_conn.pop(conn, None)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of cache statistics / Снимок статистики кэша
+
+        Returns:
+            dict: Counters and hit rate / Счётчики и доля попаданий
+        """
+        with self._lock:
+            snapshot: dict[str, Any] = dict(self._stats)
+            snapshot["connections"] = len(self._per_conn)
+            snapshot["statements"] = sum(len(cache) for cache in self._per_conn.values())
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_rate"] = round(snapshot["hits"] / lookups, 3) if lookups else 0.0
+        return snapshot
+
+    def log_stats(self) -> None:
+        """
+        Write cache statistics to the log / Запись статистики кэша в лог
+        """
+        self.lg.info(lambda: f"Statement cache stats: {self.stats()}")
+
+    # ===== PRIVATE METHODS / ПРИВАТНЫЕ МЕТОДЫ =====
+
+    def _apply_perf(self, perf: dict) -> None:
+        """Apply statement_cache_size from perf_settings.json / Применение statement_cache_size из perf_settings.json"""
+        self.capacity = perf["statement_cache_size"]
+
+    def _drop(self, conn, query: str) -> None:
+        """Drop one statement from the cache of a connection / Удаление одного запроса из кэша соединения"""
+        with self._lock:
+            cache = self._per_conn.get(conn)
+        if cache is not None:
+            cache.pop(query, None)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _prepare(self, cursor, conn, query: str, converted: str) -> str:
+        """
+        Name of the prepared statement, PREPARE on a miss / Имя подготовленного запроса, PREPARE при промахе
+
+        A connection is used by one thread at a time, so its own cache needs no lock.
+        Соединение используется одним потоком одновременно, поэтому его кэшу блокировка не нужна.
+
+        Args:
+            cursor: Cursor of the connection / Курсор соединения
+            conn: psycopg2 connection / Соединение psycopg2
+            query (str): Original query, the cache key / Исходный запрос, ключ кэша
+            converted (str): Query with $n placeholders / Запрос с заполнителями $n
+
+        Returns:
+            str: Statement name / Имя запроса
+        """
+        with self._lock:
+            cache = self._per_conn.get(conn)
+            if cache is None:
+                cache = self._per_conn[conn] = OrderedDict()
+
+        name = cache.get(query)
+        if name is not None:
+            cache.move_to_end(query)
+            self._count("hits")
+            return name
+
+        self._count("misses")
+        name = f"stmt_{next(self._names)}"
+        cursor.execute(f"PREPARE {name} AS {converted}")
+        cache[query] = name
+
+        # Least recently used statements are released / Давно не использованные запросы освобождаются
+        while len(cache) > self.capacity:
+            _, evicted = cache.popitem(last=False)
+            try:
+                cursor.execute(f"DEALLOCATE {evicted}")
+            except psycopg2.Error as e:
+                self.lg.warning("Could not deallocate %s: %s.", evicted, e)
+            self._count("evictions")
+        return name
+
+    def _is_preparable(self, query: str) -> bool:
+        """Check if PREPARE accepts the statement / Проверка, принимает ли PREPARE запрос"""
+        words = query.split(None, 1)
+        return bool(words) and words[0].upper() in self._PREPARABLE
+
+    def _convert(self, query: str) -> str | None:
+        """
+        Convert %s placeholders to $n / Преобразование заполнителей %s в $n
+
+        Args:
+            query (str): SQL with %s placeholders / SQL с заполнителями %s
+
+        Returns:
+            str | None: SQL with $1..$n, None if the statement cannot be prepared /
+                        SQL с $1..$n, None если запрос нельзя подготовить
+        """
+        with self._lock:
+            if query in self._converted:
+                self._converted.move_to_end(query)
+                return self._converted[query]
+
+        converted: str | None = None
+        if self._is_preparable(query):
+            parts = []
+            number = 0
+            i = 0
+            while i < len(query):
+                char = query[i]
+                if char == "%" and i + 1 < len(query):
+                    following = query[i + 1]
+                    if following == "s":
+                        number += 1
+                        parts.append(f"${number}")
+                        i += 2
+                        continue
+                    if following == "%":
+                        parts.append("%")
+                        i += 2
+                        continue
+                    # Named or other placeholders are not supported / Именованные и другие заполнители не поддерживаются
+                    parts = None
+                    break
+                parts.append(char)
+                i += 1
+            if parts is not None:
+                converted = "".join(parts)
+
+        # Least recently used texts are dropped above the capacity / Давно не использованные тексты удаляются сверх ёмкости
+        with self._lock:
+            self._converted[query] = converted
+            while len(self._converted) > self.capacity:
+                self._converted.popitem(last=False)
+        return converted
@@ -2,6 +2,12 @@
 # Automated SQL query generation for database operations
 # Автоматическая генерация SQL запросов для операций с базой данных
 
+# ===== IMPORTS / ИМПОРТЫ =====
+from typing import Any
+
+# Safe composition of identifiers / Безопасная сборка идентификаторов
+from psycopg2 import sql
+
 
 # ===== BASE QUERY BUILDER CLASS / БАЗОВЫЙ КЛАСС КОНСТРУКТОРА ЗАПРОСОВ =====
 class QueryBuilder:
@@ -67,7 +73,7 @@ class QueryBuilder:
     # ===== CREATE OPERATIONS / ОПЕРАЦИИ СОЗДАНИЯ =====
 
     @staticmethod
-    def insert(table_name: str, columns: list) -> str:
+    def insert(table_name: str, columns: list, returning: bool = False) -> str:
         """
         Generate query to insert a new record / Генерирует запрос для вставки новой записи
 
@@ -82,6 +88,7 @@ class QueryBuilder:
         Args:
             table_name (str): Name of the database table / Имя таблицы базы данных
             columns (list): List of column names to insert into / Список названий столбцов для вставки
+            returning (bool): Return the inserted row / Вернуть вставленную строку
 
         Returns:
             str: SQL INSERT query string / Строка SQL INSERT запроса
@@ -91,6 +98,7 @@ class QueryBuilder:
 
         Example:
             INSERT INTO "Teacher" (f_fio, f_phone, f_email, f_comment) VALUES (%s, %s, %s, %s)
+            INSERT INTO "Teacher" (f_fio, f_phone, f_email, f_comment) VALUES (%s, %s, %s, %s) RETURNING *
         """
         if not columns:
             raise ValueError("Columns list cannot be empty")
@@ -99,12 +107,13 @@ class QueryBuilder:
         placeholders = ", ".join(["%s"] * len(columns))
         # Join column names / Соединение имен столбцов
         columns_str = ", ".join(columns)
-        return f'INSERT INTO "{table_name}" ({columns_str}) VALUES ({placeholders})'
+        query = f'INSERT INTO "{table_name}" ({columns_str}) VALUES ({placeholders})'
+        return QueryBuilder._returning(query, returning)
 
     # ===== UPDATE OPERATIONS / ОПЕРАЦИИ ОБНОВЛЕНИЯ =====
 
     @staticmethod
-    def update(table_name: str, columns: list) -> str:
+    def update(table_name: str, columns: list, returning: bool = False) -> str:
         """
         Generate query to update a record / Генерирует запрос для обновления записи
 
@@ -119,6 +128,7 @@ class QueryBuilder:
         Args:
             table_name (str): Name of the database table / Имя таблицы базы данных
             columns (list): List of column names to update (excluding ID) / Список названий столбцов для обновления (без ID)
+            returning (bool): Return the updated row / Вернуть обновлённую строку
 
         Returns:
             str: SQL UPDATE query string / Строка SQL UPDATE запроса
@@ -134,12 +144,13 @@ class QueryBuilder:
 
         # Generate SET clause with parameter placeholders / Генерация SET клаузулы с заполнителями параметров
         set_clause = ", ".join([f"{col} = %s" for col in columns])
-        return f'UPDATE "{table_name}" SET {set_clause} WHERE id = %s'
+        query = f'UPDATE "{table_name}" SET {set_clause} WHERE id = %s'
+        return QueryBuilder._returning(query, returning)
 
     # ===== DELETE OPERATIONS / ОПЕРАЦИИ УДАЛЕНИЯ =====
 
     @staticmethod
-    def delete(table_name: str) -> str:
+    def delete(table_name: str, returning: bool = False) -> str:
         """
         Generate query to delete a record / Генерирует запрос для удаления записи
 
@@ -151,17 +162,60 @@ class QueryBuilder:
 
         Args:
             table_name (str): Name of the database table / Имя таблицы базы данных
+            returning (bool): Return the deleted row / Вернуть удалённую строку
 
         Returns:
             str: SQL DELETE query string / Строка SQL DELETE запроса
 
         Example:
             DELETE FROM "Teacher" WHERE id = %s
+            DELETE FROM "Teacher" WHERE id = %s RETURNING *
+        """
+        return QueryBuilder._returning(
+            f'DELETE FROM "{table_name}" WHERE id = %s', returning
+        )
+
+    @staticmethod
+    def delete_many(table_name: str, returning: bool = False) -> str:
+        """
+        Generate query to delete several records at once / Генерирует запрос для удаления нескольких записей сразу
+
+        Creates one set-based DELETE for a list of IDs passed as a single array parameter.
+        Создает один DELETE по множеству для списка ID, переданного одним параметром-массивом.
+
+        Args:
+            table_name (str): Name of the database table / Имя таблицы базы данных
+            returning (bool): Return the deleted rows / Вернуть удалённые строки
+
+        Returns:
+            str: SQL DELETE query string / Строка SQL DELETE запроса
+
+        Example:
+            DELETE FROM "Teacher" WHERE id = ANY(%s) RETURNING *
         """
-        return f'DELETE FROM "{table_name}" WHERE id = %s'
+        return QueryBuilder._returning(
+            f'DELETE FROM "{table_name}" WHERE id = ANY(%s)', returning
+        )
 
     # ===== UTILITY OPERATIONS / УТИЛИТАРНЫЕ ОПЕРАЦИИ =====
 
+    @staticmethod
+    def _returning(query: str, returning: bool) -> str:
+        """
+        Append RETURNING * to a DML query / Добавление RETURNING * к DML запросу
+
+        Lets the caller patch its model with the affected rows instead of reloading the table.
+        Позволяет вызывающему обновить модель затронутыми строками вместо перезагрузки таблицы.
+
+        Args:
+            query (str): INSERT, UPDATE or DELETE query / Запрос INSERT, UPDATE или DELETE
+            returning (bool): Whether to append the clause / Добавлять ли клаузулу
+
+        Returns:
+            str: SQL query string / Строка SQL запроса
+        """
+        return f"{query} RETURNING *" if returning else query
+
     @staticmethod
     def count(table_name: str) -> str:
         """
@@ -185,6 +239,107 @@ class QueryBuilder:
         return f'SELECT COUNT(*) FROM "{table_name}"'
 
 
+# ===== QUERY CRITERIA CLASS / КЛАСС КРИТЕРИЕВ ЗАПРОСА =====
+class QueryCriteria:
+    """
+    What to select from a table / Что выбрать из таблицы
+
+    Filters, sort order, projection and limit of a SELECT built by AdvancedQueryBuilder.select.
+    Column names come from the UI, so they are quoted as identifiers and operators are taken from a fixed list;
+    values are always passed as query parameters.
+
+    Фильтры, порядок сортировки, проекция и лимит SELECT, собираемого AdvancedQueryBuilder.select.
+    Имена колонок приходят из UI, поэтому они экранируются как идентификаторы, а операторы берутся из фиксированного списка;
+    значения всегда передаются как параметры запроса.
+
+    Example / Пример:
+        QueryCriteria().where("f_fio", "CONTAINS", "ivan").order("f_fio")
+    """
+
+    # Allowed filter operators / Разрешённые операторы фильтров
+    # CONTAINS - case-insensitive substring / подстрока без учёта регистра
+    # IN - value is a list / значение - список
+    OPERATORS = (
+        "=",
+        "<>",
+        "<",
+        "<=",
+        ">",
+        ">=",
+        "CONTAINS",
+        "IN",
+        "IS NULL",
+        "IS NOT NULL",
+    )
+
+    def __init__(
+        self,
+        filters: list | None = None,
+        order_by: list | None = None,
+        columns: list | None = None,
+        limit: int | None = None,
+    ):
+        """
+        Args:
+            filters (list, optional): (column, operator, value) conditions joined with AND /
+                                      Условия (колонка, оператор, значение), объединённые через AND
+            order_by (list, optional): (column, ascending) pairs / Пары (колонка, по возрастанию)
+            columns (list, optional): Selected columns, all if empty / Выбираемые колонки, все если пусто
+            limit (int, optional): Maximum number of rows / Максимальное число строк
+        """
+        self.filters: list[tuple[str, str, Any]] = []
+        for condition in filters or ():
+            self.where(*condition)
+        self.order_by: list[tuple[str, bool]] = list(order_by or ())
+        self.columns: list[str] = list(columns or ())
+        self.limit = limit
+        # Ranked text search, see AdvancedQueryBuilder.search_document / Ранжированный текстовый поиск, см. AdvancedQueryBuilder.search_document
+        self.search_text = ""
+        self.search_columns: list[str] = []
+
+    def where(
+        self, column: str, operator: str = "=", value: Any = None
+    ) -> "QueryCriteria":
+        """
+        Add a filter condition / Добавление условия фильтра
+
+        Raises:
+            ValueError: Unknown operator / Неизвестный оператор
+        """
+        operator = operator.upper()
+        if operator not in self.OPERATORS:
+            raise ValueError(f"Unknown filter operator: {operator}")
+        self.filters.append((column, operator, value))
+        return self
+
+    def order(self, column: str, ascending: bool = True) -> "QueryCriteria":
+        """Add a sort key / Добавление ключа сортировки"""
+        self.order_by.append((column, ascending))
+        return self
+
+    def search(self, text: str, columns: list) -> "QueryCriteria":
+        """
+        Search words in several columns, best matches first / Поиск слов в нескольких колонках, лучшие совпадения первыми
+
+        Every word of 3+ characters must occur in one of the columns, shorter words only rank the rows
+        (or match by word similarity when there is nothing else); empty text switches the search off.
+        Каждое слово из 3+ символов должно встречаться в одной из колонок, более короткие только ранжируют строки
+        (или совпадают по сходству слов, если других нет); пустой текст выключает поиск.
+
+        Args:
+            text (str): Words to search for / Искомые слова
+            columns (list): Searched columns / Колонки поиска
+        """
+        self.search_text = " ".join(text.split())
+        self.search_columns = list(columns)
+        return self
+
+    def copy(self) -> "QueryCriteria":
+        """Independent copy / Независимая копия"""
+        criteria = QueryCriteria(self.filters, self.order_by, self.columns, self.limit)
+        return criteria.search(self.search_text, self.search_columns)
+
+
 # ===== ADVANCED QUERY BUILDER CLASS / РАСШИРЕННЫЙ КЛАСС КОНСТРУКТОРА ЗАПРОСОВ =====
 class AdvancedQueryBuilder(QueryBuilder):
     """
@@ -199,6 +354,8 @@ class AdvancedQueryBuilder(QueryBuilder):
 
     # ===== SEARCH OPERATIONS / ОПЕРАЦИИ ПОИСКА =====
 
+    SEARCH_MIN_WORD = 3  # Shortest word matched by ILIKE, shorter ones have no trigram to look up / Самое короткое слово для ILIKE, у более коротких нет триграммы для поиска
+
     @staticmethod
     def search_by_field(table_name: str, field_name: str) -> str:
         """
@@ -224,6 +381,123 @@ class AdvancedQueryBuilder(QueryBuilder):
         """
         return f'SELECT * FROM "{table_name}" WHERE {field_name} ILIKE %s ORDER BY id'
 
+    @staticmethod
+    def search_document(columns: list) -> sql.Composed:
+        """
+        Searched text of a row / Текст строки для поиска
+
+        The same expression is used by the trigram index and by search queries, so the planner
+        can match them; it must not change without recreating the index.
+        Одно и то же выражение используется триграммным индексом и поисковыми запросами, поэтому планировщик
+        может их сопоставить; его нельзя менять без пересоздания индекса.
+
+        Args:
+            columns (list): Searched columns / Колонки поиска
+
+        Returns:
+            sql.Composed: Text expression / Текстовое выражение
+
+        Example:
+            (coalesce("f_fio", '') || ' ' || coalesce("f_email", ''))
+        """
+        return sql.Composed(
+            [
+                sql.SQL("("),
+                sql.SQL(" || ' ' || ").join(
+                    sql.SQL("coalesce({}, '')").format(sql.Identifier(column))
+                    for column in columns
+                ),
+                sql.SQL(")"),
+            ]
+        )
+
+    @staticmethod
+    def search_index_name(table_name: str) -> str:
+        """Name of the trigram search index of a table / Имя триграммного индекса поиска таблицы"""
+        return f"{table_name}_search_trgm"
+
+    @staticmethod
+    def create_search_index(table_name: str, columns: list) -> sql.Composed:
+        """
+        Generate query creating the trigram search index / Генерирует запрос создания триграммного индекса поиска
+
+        A GIN index with gin_trgm_ops (extension pg_trgm) answers ILIKE '%word%' without reading the whole table.
+        CONCURRENTLY does not block writes while the index is built, so it must run outside a transaction.
+
+        GIN индекс с gin_trgm_ops (расширение pg_trgm) отвечает на ILIKE '%слово%' без чтения всей таблицы.
+        CONCURRENTLY не блокирует запись во время построения индекса, поэтому запрос выполняется вне транзакции.
+
+        Example:
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS "Student_search_trgm" ON "Student"
+            USING gin ((coalesce("f_fio", '') || ...) gin_trgm_ops)
+        """
+        return sql.SQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS {} ON {} USING gin ({} gin_trgm_ops)"
+        ).format(
+            sql.Identifier(AdvancedQueryBuilder.search_index_name(table_name)),
+            sql.Identifier(table_name),
+            AdvancedQueryBuilder.search_document(columns),
+        )
+
+    # ===== CHANGE NOTIFICATIONS / УВЕДОМЛЕНИЯ ОБ ИЗМЕНЕНИЯХ =====
+
+    CHANGE_CHANNEL = "app_changes"  # LISTEN/NOTIFY channel of row changes / Канал LISTEN/NOTIFY изменений строк
+    CHANGE_FUNCTION = "app_notify_change"  # Trigger function shared by all tables / Триггерная функция, общая для всех таблиц
+
+    @staticmethod
+    def change_trigger_names(table_name: str) -> tuple[str, str]:
+        """Names of the row and TRUNCATE change triggers of a table / Имена триггеров изменений строк и TRUNCATE таблицы"""
+        return f"{table_name}_notify_change", f"{table_name}_notify_truncate"
+
+    @staticmethod
+    def create_change_function() -> sql.Composed:
+        """
+        Generate query creating the change notification function / Генерирует запрос создания функции уведомления об изменениях
+
+        The payload is JSON {"table", "op", "id"}; TRUNCATE has no id. It is sent on commit only,
+        rolled back changes are never reported.
+
+        Содержимое - JSON {"table", "op", "id"}; у TRUNCATE нет id. Оно отправляется только при фиксации,
+        об откаченных изменениях не сообщается.
+        """
+        return sql.SQL(
+            "CREATE OR REPLACE FUNCTION {}() RETURNS trigger LANGUAGE plpgsql AS $$ "
+            "BEGIN "
+            "IF TG_OP = 'TRUNCATE' THEN "
+            "PERFORM pg_notify({}, json_build_object('table', TG_TABLE_NAME, 'op', TG_OP)::text); "
+            "ELSE "
+            "PERFORM pg_notify({}, json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, "
+            "'id', CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END)::text); "
+            "END IF; "
+            "RETURN NULL; "
+            "END $$"
+        ).format(
+            sql.Identifier(AdvancedQueryBuilder.CHANGE_FUNCTION),
+            sql.Literal(AdvancedQueryBuilder.CHANGE_CHANNEL),
+            sql.Literal(AdvancedQueryBuilder.CHANGE_CHANNEL),
+        )
+
+    @staticmethod
+    def create_change_triggers(table_name: str) -> list:
+        """
+        Generate queries creating the change triggers of a table / Генерирует запросы создания триггеров изменений таблицы
+
+        Example:
+            CREATE TRIGGER "Student_notify_change" AFTER INSERT OR UPDATE OR DELETE ON "Student"
+            FOR EACH ROW EXECUTE FUNCTION "app_notify_change"()
+        """
+        row_trigger, truncate_trigger = AdvancedQueryBuilder.change_trigger_names(table_name)
+        function = sql.Identifier(AdvancedQueryBuilder.CHANGE_FUNCTION)
+        return [
+            sql.SQL(
+                "CREATE TRIGGER {} AFTER INSERT OR UPDATE OR DELETE ON {} "
+                "FOR EACH ROW EXECUTE FUNCTION {}()"
+            ).format(sql.Identifier(row_trigger), sql.Identifier(table_name), function),
+            sql.SQL(
+                "CREATE TRIGGER {} AFTER TRUNCATE ON {} FOR EACH STATEMENT EXECUTE FUNCTION {}()"
+            ).format(sql.Identifier(truncate_trigger), sql.Identifier(table_name), function),
+        ]
+
     # ===== PAGINATION OPERATIONS / ОПЕРАЦИИ ПАГИНАЦИИ =====
 
     @staticmethod
@@ -232,12 +506,12 @@ class AdvancedQueryBuilder(QueryBuilder):
         Generate query with record limit and offset / Генерирует запрос с ограничением количества записей и смещением
 
         Creates a SELECT query that retrieves a specific number of records starting from an offset.
-        Useful for implementing pagination in large datasets.
         Results are ordered by ID to ensure consistent pagination.
+        ! The server still reads every skipped row, so deep pages get slower; use select with after for browsing.
 
         Создает SELECT запрос, который получает определенное количество записей, начиная со смещения.
-        Полезно для реализации пагинации в больших наборах данных.
         Результаты упорядочены по ID для обеспечения согласованной пагинации.
+        ! Сервер всё равно читает каждую пропущенную строку, поэтому дальние страницы медленнее; для просмотра используйте select с after.
 
         Args:
             table_name (str): Name of the database table / Имя таблицы базы данных
@@ -252,6 +526,200 @@ class AdvancedQueryBuilder(QueryBuilder):
         """
         return f'SELECT * FROM "{table_name}" ORDER BY id LIMIT {limit} OFFSET {offset}'
 
+    # ===== CRITERIA QUERIES / ЗАПРОСЫ ПО КРИТЕРИЯМ =====
+
+    @staticmethod
+    def select(
+        table_name: str,
+        criteria: QueryCriteria | None = None,
+        after: dict | None = None,
+        limit: int | None = None,
+        trigram: bool = True,
+    ) -> tuple[sql.Composed, list]:
+        """
+        Generate query from criteria / Генерирует запрос по критериям
+
+        Filtering and sorting run on the server, where indexes can be used, instead of on loaded rows.
+        id is added as the last sort key, so the order is total and pages are stable.
+        With after the query continues after that row (keyset pagination): the next page starts right after
+        the last row of the previous one, so every page costs the same at any depth.
+        A search puts the best matches (pg_trgm word_similarity) before the sort keys.
+        Without pg_trgm (trigram=False) every word is matched by plain ILIKE and the rows are not ranked.
+
+        Фильтрация и сортировка выполняются на сервере, где могут использоваться индексы, а не на загруженных строках.
+        id добавляется последним ключом сортировки, поэтому порядок полный и страницы стабильны.
+        С after запрос продолжается после этой строки (keyset пагинация): следующая страница начинается сразу после
+        последней строки предыдущей, поэтому каждая страница стоит одинаково на любой глубине.
+        Поиск ставит лучшие совпадения (pg_trgm word_similarity) перед ключами сортировки.
+        Без pg_trgm (trigram=False) каждое слово ищется простым ILIKE, и строки не ранжируются.
+
+        NULL sort values go last in both directions, and the condition for after treats them the same way,
+        so rows with NULL keys are neither skipped nor repeated.
+        NULL значения сортировки идут последними в обоих направлениях, и условие для after трактует их так же,
+        поэтому строки с NULL ключами не пропускаются и не повторяются.
+
+        Args:
+            table_name (str): Name of the database table / Имя таблицы базы данных
+            criteria (QueryCriteria, optional): Filters, order, projection, limit / Фильтры, порядок, проекция, лимит
+            after (dict, optional): Last row of the previous page / Последняя строка предыдущей страницы
+            limit (int, optional): Overrides criteria.limit / Заменяет criteria.limit
+            trigram (bool): pg_trgm is installed / pg_trgm установлен
+
+        Returns:
+            tuple: (composed query, parameters), render with as_string(connection) /
+                   (собранный запрос, параметры), текст через as_string(connection)
+
+        Raises:
+            ValueError: Unknown operator, or after with a ranked search / Неизвестный оператор или after с ранжированным поиском
+
+        Example:
+            SELECT * FROM "Teacher" WHERE "f_fio"::text ILIKE %s ORDER BY "f_fio" DESC NULLS LAST, "id" DESC LIMIT %s
+        """
+        criteria = criteria or QueryCriteria()
+        params: list = []
+
+        fields = (
+            sql.SQL(", ").join(map(sql.Identifier, criteria.columns))
+            if criteria.columns
+            else sql.SQL("*")
+        )
+        conditions = [
+            AdvancedQueryBuilder._condition(column, operator, value, params)
+            for column, operator, value in criteria.filters
+        ]
+
+        document = None
+        if criteria.search_text and not trigram:
+            # No trigram functions, every word is a plain ILIKE / Нет триграммных функций, каждое слово - простой ILIKE
+            plain = AdvancedQueryBuilder.search_document(criteria.search_columns)
+            for word in criteria.search_text.split():
+                conditions.append(sql.SQL("{} ILIKE %s").format(plain))
+                params.append(AdvancedQueryBuilder._like_pattern(word))
+        elif criteria.search_text:
+            # Each word narrows the result, the index serves every ILIKE / Каждое слово сужает результат, индекс обслуживает каждый ILIKE
+            # Shorter words only rank the rows / Более короткие слова только ранжируют строки
+            document = AdvancedQueryBuilder.search_document(criteria.search_columns)
+            words = [
+                word
+                for word in criteria.search_text.split()
+                if len(word) >= AdvancedQueryBuilder.SEARCH_MIN_WORD
+            ]
+            for word in words:
+                conditions.append(sql.SQL("{} ILIKE %s").format(document))
+                params.append(AdvancedQueryBuilder._like_pattern(word))
+            if not words:
+                # Only short words: ILIKE '%ab%' would read the whole table, word similarity (<%) uses the index /
+                # Только короткие слова: ILIKE '%ab%' прочитал бы всю таблицу, сходство слов (<%) использует индекс
+                conditions.append(sql.SQL("%s <%% {}").format(document))
+                params.append(criteria.search_text)
+
+        order = list(criteria.order_by)
+        if not any(column == "id" for column, _ in order):
+            order.append(("id", order[-1][1] if order else True))
+
+        if after is not None:
+            if document is not None:
+                raise ValueError("Ranked search results are not paged")
+            conditions.append(AdvancedQueryBuilder._after(order, after, params))
+
+        query = sql.SQL("SELECT {} FROM {}").format(fields, sql.Identifier(table_name))
+        if conditions:
+            query += sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions)
+        # The primary key keeps a plain order, so its index serves both directions /
+        # Первичный ключ сохраняет простой порядок, поэтому его индекс обслуживает оба направления
+        sort_keys = [
+            sql.SQL("{} {}{}").format(
+                sql.Identifier(column),
+                sql.SQL("ASC" if ascending else "DESC"),
+                sql.SQL("" if column == "id" else " NULLS LAST"),
+            )
+            for column, ascending in order
+        ]
+        if document is not None:
+            sort_keys.insert(0, sql.SQL("word_similarity(%s, {}) DESC").format(document))
+            params.append(criteria.search_text)
+        query += sql.SQL(" ORDER BY ") + sql.SQL(", ").join(sort_keys)
+
+        limit = limit if limit is not None else criteria.limit
+        if limit is not None:
+            query += sql.SQL(" LIMIT %s")
+            params.append(limit)
+        return query, params
+
+    @staticmethod
+    def _after(order: list, after: dict, params: list) -> sql.Composed:
+        """
+        Keyset condition: rows that sort after a given row, its parameters are appended to params /
+        Условие keyset: строки, идущие после данной строки, его параметры добавляются в params
+
+        A row comparison (a, b) > (x, y) is NULL as soon as a key is NULL, which would end the paging
+        at the first NULL value. The comparison is therefore spelled out key by key, with NULL as
+        the last value (NULLS LAST): the row is after if its earlier keys are equal and one key is after.
+        Сравнение строк (a, b) > (x, y) даёт NULL, как только ключ равен NULL, что оборвало бы
+        пагинацию на первом NULL значении. Поэтому сравнение расписано по ключам, с NULL как
+        последним значением (NULLS LAST): строка идёт после, если её ранние ключи равны, а один ключ идёт после.
+
+        Args:
+            order (list): (column, ascending) pairs ending with id / Пары (колонка, по возрастанию), заканчивающиеся id
+            after (dict): Last row of the previous page / Последняя строка предыдущей страницы
+            params (list): Query parameters / Параметры запроса
+
+        Example:
+            (("f_fio" < %s OR "f_fio" IS NULL) OR ("f_fio" = %s AND "id" < %s))
+        """
+        terms = []
+        equal: list = []  # Conditions of equal earlier keys / Условия равенства ранних ключей
+        equal_params: list = []
+        for column, ascending in order:
+            identifier = sql.Identifier(column)
+            value = after[column]
+            if value is None:
+                # Nothing but equal NULLs follows NULL in this key / В этом ключе за NULL следуют только равные NULL
+                equal.append(sql.SQL("{} IS NULL").format(identifier))
+                continue
+            term = sql.SQL("{} {} %s").format(identifier, sql.SQL(">" if ascending else "<"))
+            if column != "id":
+                # Every NULL comes after a value, the primary key is never NULL /
+                # Все NULL идут после значения, первичный ключ никогда не NULL
+                term = sql.SQL("({} OR {} IS NULL)").format(term, identifier)
+            terms.append(sql.SQL(" AND ").join([*equal, term]))
+            params.extend([*equal_params, value])
+            equal.append(sql.SQL("{} = %s").format(identifier))
+            equal_params.append(value)
+        return sql.SQL("({})").format(
+            sql.SQL(" OR ").join(sql.SQL("({})").format(term) for term in terms)
+        )
+
+    @staticmethod
+    def _condition(column: str, operator: str, value: Any, params: list) -> sql.Composed:
+        """
+        One WHERE condition, its parameter is appended to params /
+        Одно условие WHERE, его параметр добавляется в params
+        """
+        if operator not in QueryCriteria.OPERATORS:
+            raise ValueError(f"Unknown filter operator: {operator}")
+        identifier = sql.Identifier(column)
+
+        if operator in ("IS NULL", "IS NOT NULL"):
+            return sql.SQL("{} " + operator).format(identifier)
+        if operator == "IN":
+            params.append(list(value))
+            return sql.SQL("{} = ANY(%s)").format(identifier)
+        if operator == "CONTAINS":
+            params.append(AdvancedQueryBuilder._like_pattern(value))
+            return sql.SQL("{}::text ILIKE %s").format(identifier)
+        params.append(value)
+        return sql.SQL("{} {} %s").format(identifier, sql.SQL(operator))
+
+    @staticmethod
+    def _like_pattern(value: Any) -> str:
+        """
+        LIKE pattern matching value anywhere, its wildcards are literal /
+        Шаблон LIKE, находящий значение в любом месте, его символы шаблона буквальны
+        """
+        escaped = str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"%{escaped}%"
+
     # ===== SORTING OPERATIONS / ОПЕРАЦИИ СОРТИРОВКИ =====
 
     @staticmethod
@@ -393,6 +861,16 @@ if __name__ == "__main__":
     print(
         f"  PAGINATION (10 records, skip 20): {AdvancedQueryBuilder.select_with_limit('Teacher', 10, 20)}"
     )
+    criteria = QueryCriteria().where("f_fio", "CONTAINS", "ivan").order("f_fio", False)
+    query, params = AdvancedQueryBuilder.select("Teacher", criteria, limit=500)
+    print(f"  CRITERIA: {query!r} {params}")
+    query, params = AdvancedQueryBuilder.select(
+        "Teacher", criteria, after={"id": 1042, "f_fio": "Ivanov"}, limit=500
+    )
+    print(f"  KEYSET NEXT PAGE: {query!r} {params}")
+    criteria = QueryCriteria().search("ivan gmail", ["f_fio", "f_email"])
+    query, params = AdvancedQueryBuilder.select("Student", criteria, limit=200)
+    print(f"  SEARCH: {query!r} {params}")
     print(
         f"  ORDER BY NAME ASC: {AdvancedQueryBuilder.select_ordered_by('Teacher', 'f_fio', True)}"
     )
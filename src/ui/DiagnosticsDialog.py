@@ -0,0 +1,150 @@
+# ===== DIAGNOSTICS DIALOG / ДИАЛОГ ДИАГНОСТИКИ =====
+# Live view of the metrics registry: latency percentiles, counters and gauges
+# Живое представление реестра метрик: процентили задержек, счётчики и показатели
+
+# ===== IMPORTS / ИМПОРТЫ =====
+import json
+from PyQt6.QtCore import QTimer, pyqtSlot
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QTabWidget,
+    QTableWidget,
+    QTableWidgetItem,
+    QPlainTextEdit,
+    QPushButton,
+    QLabel,
+    QHeaderView,
+)
+from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+
+
+# ===== DIAGNOSTICS DIALOG CLASS / КЛАСС ДИАЛОГА ДИАГНОСТИКИ =====
+class DiagnosticsDialog(QDialog):
+    """
+    Diagnostics dialog / Диалог диагностики
+
+    Shows live percentiles of query, refresh and pool wait latencies, counters of queries and rows,
+    and gauges of the pool, statement cache and log queue. Refreshes every second while open.
+    "Save snapshot" appends the current values to logs/metrics-YYYY-MM-DD.jsonl.
+
+    Показывает живые процентили задержек запросов, обновлений и ожидания пула, счётчики запросов и строк,
+    и показатели пула, кэша запросов и очереди логов. Обновляется каждую секунду, пока открыт.
+    "Save snapshot" добавляет текущие значения в logs/metrics-YYYY-MM-DD.jsonl.
+    """
+
+    REFRESH_MS = 1000  # Refresh period / Период обновления
+    _LATENCY_COLUMNS = ["Metric", "Count", "Mean ms", "p50 ms", "p90 ms", "p99 ms", "Max ms"]
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self, parent=None):
+        """
+        Build the dialog and start live refresh / Построение диалога и запуск живого обновления
+
+        Args:
+            parent: Parent widget / Родительский виджет
+        """
+        super().__init__(parent)
+
+        # ===== LOGGER INITIALIZATION / ИНИЦИАЛИЗАЦИЯ ЛОГЕРА =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        self.metrics = Metrics()
+
+        # ===== WINDOW SETUP / НАСТРОЙКА ОКНА =====
+        self.setWindowTitle("Diagnostics")
+        self.resize(760, 480)
+        layout = QVBoxLayout(self)
+
+        self._tabs = QTabWidget(self)
+        self._latency = self._make_table(self._LATENCY_COLUMNS)
+        self._counters = self._make_table(["Metric", "Value"])
+        self._gauges = QPlainTextEdit(self)
+        self._gauges.setReadOnly(True)
+        self._tabs.addTab(self._latency, "Latency")
+        self._tabs.addTab(self._counters, "Counters")
+        self._tabs.addTab(self._gauges, "Gauges")
+        layout.addWidget(self._tabs)
+
+        # ===== BUTTONS / КНОПКИ =====
+        buttons = QHBoxLayout()
+        self._status = QLabel(self)
+        save_button = QPushButton("Save snapshot", self)
+        save_button.clicked.connect(self.save_snapshot)
+        close_button = QPushButton("Close", self)
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(self._status, 1)
+        buttons.addWidget(save_button)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+        # ===== LIVE REFRESH / ЖИВОЕ ОБНОВЛЕНИЕ =====
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    # ===== PRIVATE METHODS - UI SETUP / ПРИВАТНЫЕ МЕТОДЫ - НАСТРОЙКА UI =====
+
+    def _make_table(self, headers: list) -> QTableWidget:
+        """Read-only table with headers / Таблица только для чтения с заголовками"""
+        table = QTableWidget(0, len(headers), self)
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    @staticmethod
+    def _fill(table: QTableWidget, rows: list) -> None:
+        """Replace table contents / Замена содержимого таблицы"""
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(str(value)))
+
+    # ===== EVENT HANDLERS / ОБРАБОТЧИКИ СОБЫТИЙ =====
+
+    def showEvent(self, event) -> None:
+        """Refresh only while visible / Обновление только пока виден"""
+        self._timer.start(self.REFRESH_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self._timer.stop()
+        super().hideEvent(event)
+
+    # ===== SLOT METHODS / МЕТОДЫ-СЛОТЫ =====
+
+    @pyqtSlot()
+    def refresh(self) -> None:
+        """
+        Show the current snapshot / Показ текущего снимка
+        """
+        try:
+            snapshot = self.metrics.snapshot()
+            self._fill(
+                self._latency,
+                [
+                    [name, h["count"], h["mean"], h["p50"], h["p90"], h["p99"], h["max"]]
+                    for name, h in snapshot["histograms"].items()
+                ],
+            )
+            self._fill(self._counters, list(snapshot["counters"].items()))
+            self._gauges.setPlainText(
+                json.dumps(snapshot["gauges"], indent=2, ensure_ascii=False, default=str)
+            )
+            self._status.setText(f"Uptime {snapshot['uptime_s']:.0f} s")
+        except Exception as e:
+            self.lg.error("Internal error: %s.", e)
+
+    @pyqtSlot()
+    def save_snapshot(self) -> None:
+        """
+        Append the current snapshot to the metrics file / Добавление текущего снимка в файл метрик
+        """
+        path = self.metrics.dump()
+        self._status.setText(f"Saved to {path}" if path else "Snapshot not saved, see log")
@@ -0,0 +1,96 @@
+# ===== ENTITY REGISTRY / РЕЕСТР СУЩНОСТЕЙ =====
+# Metadata of the table modes, from which the menus and views are generated
+# Метаданные режимов таблиц, по которым генерируются меню и представления
+
+# ===== IMPORTS / ИМПОРТЫ =====
+import importlib
+from typing import Any
+
+
+# ===== ENTITY RECORD / ЗАПИСЬ СУЩНОСТИ =====
+class Entity:
+    """
+    One table mode / Один режим таблицы
+
+    The view module is imported on first use, so unused modes cost nothing at startup.
+    Модуль представления импортируется при первом использовании, поэтому неиспользуемые режимы ничего не стоят при запуске.
+    """
+
+    __slots__ = ("key", "title", "mode_title", "module")
+
+    def __init__(self, key: str, title: str, mode_title: str, module: str):
+        """
+        Args:
+            key (str): Unique key, also the view cache key / Уникальный ключ, также ключ кэша представлений
+            title (str): Title of the entity menu / Заголовок меню сущности
+            mode_title (str): Title of the action in the Mods menu / Заголовок действия в меню Mods
+            module (str): Module with a View class / Модуль с классом View
+        """
+        self.key = key
+        self.title = title
+        self.mode_title = mode_title
+        self.module = module
+
+    def view_class(self) -> Any:
+        """View class of the entity, imported on first call / Класс представления сущности, импортируется при первом вызове"""
+        return importlib.import_module(self.module).View
+
+
+# ===== ENTITY REGISTRY CLASS / КЛАСС РЕЕСТРА СУЩНОСТЕЙ =====
+class EntityRegistry:
+    """
+    Registered table modes in menu order / Зарегистрированные режимы таблиц в порядке меню
+
+    A new entity needs a controller module with a View class and one register() call;
+    MainMenu and MainWindow pick it up without changes.
+    Новой сущности нужны модуль контроллера с классом View и один вызов register();
+    MainMenu и MainWindow подхватывают её без изменений.
+    """
+
+    # Mode key -> entity, dicts keep insertion order, which is the menu order /
+    # Ключ режима -> сущность, словари сохраняют порядок вставки, это порядок меню
+    _entities: dict[str, Entity] = {}
+
+    # Actions of every entity menu: (text, BaseView method) / Действия меню каждой сущности: (текст, метод BaseView)
+    ACTIONS = [
+        ("Add", "add"),  # Add new record / Добавить новую запись
+        ("Update", "uppdate"),  # Update existing record / Обновить существующую запись
+        ("Delete", "delete"),  # Delete selected records / Удалить выбранные записи
+        ("Import...", "import_data"),  # Bulk import from CSV/XLSX / Массовый импорт из CSV/XLSX
+        ("Export...", "export_data"),  # Export to CSV/JSONL / Экспорт в CSV/JSONL
+    ]
+
+    @classmethod
+    def register(cls, entity: Entity) -> Entity:
+        """
+        Add or replace an entity / Добавление или замена сущности
+
+        Args:
+            entity: Entity to register / Регистрируемая сущность
+
+        Returns:
+            Entity: The registered entity / Зарегистрированная сущность
+        """
+        cls._entities[entity.key] = entity
+        return entity
+
+    @classmethod
+    def get(cls, key: str) -> Entity:
+        """
+        Entity by key / Сущность по ключу
+
+        Raises:
+            KeyError: Unknown entity / Неизвестная сущность
+        """
+        return cls._entities[key]
+
+    @classmethod
+    def all(cls) -> list[Entity]:
+        """Registered entities in menu order / Зарегистрированные сущности в порядке меню"""
+        return list(cls._entities.values())
+
+
+# ===== REGISTERED ENTITIES / ЗАРЕГИСТРИРОВАННЫЕ СУЩНОСТИ =====
+EntityRegistry.register(Entity("Teacher", "Teacher", "Teacher Mod", "src.controllers.Teacher"))
+EntityRegistry.register(Entity("Student", "Student", "Student Mod", "src.controllers.Student"))
+EntityRegistry.register(Entity("StGroup", "Group", "StGroup Mod", "src.controllers.StGroup"))
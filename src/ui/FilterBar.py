@@ -0,0 +1,139 @@
+# ===== FILTER BAR / ПАНЕЛЬ ФИЛЬТРА =====
+# Tool bar that filters the current table on the server
+# Панель инструментов, фильтрующая текущую таблицу на сервере
+
+# ===== IMPORTS / ИМПОРТЫ =====
+from typing import Any
+from PyQt6.QtCore import pyqtSlot
+from PyQt6.QtWidgets import QToolBar, QComboBox, QLineEdit, QLabel
+from src.core.Logger import Logger
+
+
+# ===== FILTER BAR CLASS / КЛАСС ПАНЕЛИ ФИЛЬТРА =====
+class FilterBar(QToolBar):
+    """
+    Filter bar of the current table / Панель фильтра текущей таблицы
+
+    A column and a text are sent to the model as a filter, which reloads with WHERE on the server,
+    so only matching rows are transferred. The text is a substring by default, a leading operator
+    compares instead: "=Ivanov", ">10", "<=2024-01-01", "<>x". Enter applies, clearing the text removes the filter.
+
+    Колонка и текст отправляются модели как фильтр, и она перезагружается с WHERE на сервере,
+    поэтому передаются только подходящие строки. Текст по умолчанию - подстрока, оператор в начале
+    задаёт сравнение: "=Ivanov", ">10", "<=2024-01-01", "<>x". Enter применяет, очистка текста снимает фильтр.
+    """
+
+    # Leading operators, longest first / Операторы в начале текста, сначала длинные
+    _PREFIXES = {">=": ">=", "<=": "<=", "<>": "<>", "!=": "<>", "=": "=", ">": ">", "<": "<"}
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self, parent=None):
+        """
+        Build the bar, disabled until a table is attached / Построение панели, отключена до подключения таблицы
+
+        Args:
+            parent: Parent widget / Родительский виджет
+        """
+        super().__init__("Filter", parent)
+
+        # ===== LOGGER INITIALIZATION / ИНИЦИАЛИЗАЦИЯ ЛОГЕРА =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        self._model = None
+
+        # ===== WIDGETS / ВИДЖЕТЫ =====
+        self._column = QComboBox(self)
+        self._text = QLineEdit(self)
+        self._text.setPlaceholderText("text, =value, >value ... Enter to apply")
+        self._text.setClearButtonEnabled(True)
+        self.addWidget(QLabel("Filter: ", self))
+        self.addWidget(self._column)
+        self.addWidget(self._text)
+
+        # ===== SIGNAL CONNECTIONS / ПОДКЛЮЧЕНИЕ СИГНАЛОВ =====
+        self._text.returnPressed.connect(self.apply)
+        self._text.textChanged.connect(self._on_text_changed)
+        self._column.currentIndexChanged.connect(self._on_column_changed)
+
+        self.setEnabled(False)
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def attach(self, model) -> None:
+        """
+        Filter another table model / Фильтрация другой модели таблицы
+
+        A cached model keeps its filter, which is shown again.
+        Кэшированная модель сохраняет свой фильтр, и он показывается снова.
+
+        Args:
+            model: DatabaseModelMixin model of the current view / Модель DatabaseModelMixin текущего представления
+        """
+        self._model = model
+        self._column.blockSignals(True)
+        self._text.blockSignals(True)
+        self._column.clear()
+        self._column.addItems(model.edit_columns)
+        self._text.clear()
+        if model.criteria.filters:
+            column, operator, value = model.criteria.filters[0]
+            self._column.setCurrentText(column)
+            self._text.setText(str(value) if operator == "CONTAINS" else f"{operator}{value}")
+        self._column.blockSignals(False)
+        self._text.blockSignals(False)
+        self.setEnabled(True)
+
+    @classmethod
+    def parse(cls, text: str) -> tuple[str, Any] | None:
+        """
+        Operator and value of the filter text / Оператор и значение текста фильтра
+
+        Args:
+            text: Text typed by the user / Текст, введённый пользователем
+
+        Returns:
+            tuple | None: (operator, value), None for empty text / (оператор, значение), None для пустого текста
+
+        Example:
+            parse(">=10") -> (">=", "10"); parse("ivan") -> ("CONTAINS", "ivan")
+        """
+        text = text.strip()
+        if not text:
+            return None
+        for prefix, operator in cls._PREFIXES.items():
+            if text.startswith(prefix):
+                value = text[len(prefix):].strip()
+                return (operator, value) if value else None
+        return "CONTAINS", text
+
+    # ===== SLOT METHODS / МЕТОДЫ-СЛОТЫ =====
+
+    @pyqtSlot()
+    def apply(self) -> None:
+        """
+        Send the filter to the model / Отправка фильтра модели
+        """
+        if self._model is None:
+            return
+        condition = self.parse(self._text.text())
+        try:
+            if condition is None:
+                self._model.set_filter(None)
+            else:
+                self._model.set_filter(self._column.currentText(), *condition)
+        except Exception as e:
+            self.lg.error("Internal error: %s.", e)
+
+    @pyqtSlot(str)
+    def _on_text_changed(self, text: str) -> None:
+        """Clearing the text removes the filter at once / Очистка текста сразу снимает фильтр"""
+        if not text:
+            self.apply()
+
+    @pyqtSlot(int)
+    def _on_column_changed(self, _index: int) -> None:
+        """Apply a typed filter to the new column / Применение введённого фильтра к новой колонке"""
+        if self._text.text().strip():
+            self.apply()
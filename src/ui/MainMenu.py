@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import QMenuBar
 
 # Local logging system import / Импорт локальной системы логирования
 from src.core.Logger import Logger
+from src.ui.EntityRegistry import EntityRegistry
 
 
 # ===== MAIN MENU CLASS / КЛАСС ГЛАВНОГО МЕНЮ =====
@@ -17,14 +18,19 @@ class MainMenu(QMenuBar):
 
     Creates and manages the complete menu structure including:
     Создает и управляет полной структурой меню, включая:
-    - Entity management menus (Teacher, Student, Group) / Меню управления сущностями (Учитель, Студент, Группа)
+    - Entity menus generated from EntityRegistry / Меню сущностей, сгенерированные из EntityRegistry
     - CRUD operation actions / Действия CRUD операций
     - Help and information menus / Меню справки и информации
+
+    Every action is connected once, at creation, to a dispatcher that calls the active view.
+    A mode switch only swaps the active view and the visible entity menu, so it costs the same
+    however many entities are registered.
+    Каждое действие подключается один раз, при создании, к диспетчеру, который вызывает активное представление.
+    Переключение режима лишь меняет активное представление и видимое меню сущности, поэтому стоит одинаково
+    при любом числе зарегистрированных сущностей.
     """
 
-    teacher_mode_request = pyqtSignal()
-    student_mode_request = pyqtSignal()
-    st_group_mode_request = pyqtSignal()
+    mode_request = pyqtSignal(str)  # Entity key of the requested mode / Ключ сущности запрошенного режима
 
     # ===== INITIALIZATION / ИНИЦИАЛИЗАЦИЯ =====
     def __init__(self, parent=None):
@@ -43,93 +49,52 @@ class MainMenu(QMenuBar):
         self.lg.debug("Constructor launched.")
         self.lg.debug("Logger created.")
 
+        # ===== MODE STATE / СОСТОЯНИЕ РЕЖИМА =====
+        # Entity key -> menu action and Mods action / Ключ сущности -> действие меню и действие Mods
+        self._entity_menus: dict = {}
+        self._mode_actions: dict = {}
+        self._active_key: str | None = None
+        self._active_view = None  # Receives the entity menu actions / Получает действия меню сущности
+
         # ===== MENU STRUCTURE CREATION / СОЗДАНИЕ СТРУКТУРЫ МЕНЮ =====
         # Create all menu sections in logical order / Создание всех секций меню в логическом порядке
-        self._create_teacher_menu()
-        self._create_student_menu()
-        self._create_group_menu()
+        for entity in EntityRegistry.all():
+            self._create_entity_menu(entity)
         self._create_mod_menu()
-        self.set_mode_default()
         self._create_help_menu()
 
-    # ===== TEACHER MENU SECTION / СЕКЦИЯ МЕНЮ УЧИТЕЛЯ =====
-    def _create_teacher_menu(self) -> None:
-        """Create teacher management menu with CRUD operations / Создание меню управления учителями с CRUD операциями"""
-        # Create main teacher menu / Создание основного меню учителя
-        teacher_menu = self.addMenu("Teacher")
-        self.__teacher_menu_action = teacher_menu.menuAction()
-
-        # Add CRUD operation actions / Добавление действий CRUD операций
-        self.__teacher_add = teacher_menu.addAction(
-            "Add"
-        )  # Add new teacher / Добавить нового учителя
-        self.__teacher_update = teacher_menu.addAction(
-            "Update"
-        )  # Update existing teacher / Обновить существующего учителя
-        self.__teacher_delete = teacher_menu.addAction(
-            "Delete"
-        )  # Delete selected teacher / Удалить выбранного учителя
-
-        self.lg.debug("Teacher_menu add successfully.")
-
-    # ===== STUDENT MENU SECTION / СЕКЦИЯ МЕНЮ СТУДЕНТА =====
-    def _create_student_menu(self) -> None:
-        """Create student management menu with CRUD operations / Создание меню управления студентами с CRUD операциями"""
-        # Create main student menu / Создание основного меню студента
-        student_menu = self.addMenu("Student")
-        self.__student_menu_action = student_menu.menuAction()
-
-        # Add CRUD operation actions / Добавление действий CRUD операций
-        self.__student_add = student_menu.addAction(
-            "Add"
-        )  # Add new student / Добавить нового студента
-        self.__student_update = student_menu.addAction(
-            "Update"
-        )  # Update existing student / Обновить существующего студента
-        self.__student_delete = student_menu.addAction(
-            "Delete"
-        )  # Delete selected student / Удалить выбранного студента
-
-        self.lg.debug("Student_menu add successfully.")
-
-    # ===== GROUP MENU SECTION / СЕКЦИЯ МЕНЮ ГРУППЫ =====
-    def _create_group_menu(self) -> None:
-        """Create group management menu with CRUD operations / Создание меню управления группами с CRUD операциями"""
-        # Create main group menu / Создание основного меню группы
-        st_group_menu = self.addMenu("Group")
-        self.__st_group_menu_action = st_group_menu.menuAction()
-
-        # Add CRUD operation actions / Добавление действий CRUD операций
-        self.__st_group_add = st_group_menu.addAction(
-            "Add"
-        )  # Add new group / Добавить новую группу
-        self.__st_group_update = st_group_menu.addAction(
-            "Update"
-        )  # Update existing group / Обновить существующую группу
-        self.__st_group_delete = st_group_menu.addAction(
-            "Delete"
-        )  # Delete selected group / Удалить выбранную группу
-
-        self.lg.debug("St_group_menu add successfully.")
+    # ===== ENTITY MENU SECTION / СЕКЦИЯ МЕНЮ СУЩНОСТЕЙ =====
+    def _create_entity_menu(self, entity) -> None:
+        """
+        Create a hidden entity menu with CRUD operations / Создание скрытого меню сущности с CRUD операциями
 
-    def _create_mod_menu(self) -> None:
-        mode_menu = menu = self.addMenu("Mods")
-        mode_action_group = ag = QActionGroup(self)
+        Args:
+            entity: Entity from EntityRegistry / Сущность из EntityRegistry
+        """
+        menu = self.addMenu(entity.title)
+        for text, slot in EntityRegistry.ACTIONS:
+            action = menu.addAction(text)
+            action.setData(slot)
+            action.triggered.connect(self._dispatch)
 
-        self.__teacher_mod = tm = menu.addAction("Teacher Mod")
-        tm.setCheckable(True)
-        tm.toggled.connect(self.toggle_teacher_mode)
-        ag.addAction(tm)
+        menu_action = menu.menuAction()
+        menu_action.setVisible(False)
+        self._entity_menus[entity.key] = menu_action
 
-        self.__student_mod = sm = menu.addAction("Student Mod")
-        sm.setCheckable(True)
-        sm.toggled.connect(self.toggle_student_mode)
-        ag.addAction(sm)
+        self.lg.debug("%s menu add successfully.", entity.key)
 
-        self._st_group_mod = sgm = menu.addAction("StGroup Mod")
-        sgm.setCheckable(True)
-        sgm.toggled.connect(self.toggle_st_group_mode)
-        ag.addAction(sgm)
+    def _create_mod_menu(self) -> None:
+        """Create the Mods menu, one exclusive action per entity / Создание меню Mods, одно исключающее действие на сущность"""
+        menu = self.addMenu("Mods")
+        group = QActionGroup(self)
+
+        for entity in EntityRegistry.all():
+            action = menu.addAction(entity.mode_title)
+            action.setCheckable(True)
+            action.setData(entity.key)
+            action.toggled.connect(self._on_mode_toggled)
+            group.addAction(action)
+            self._mode_actions[entity.key] = action
 
     # ===== HELP MENU SECTION / СЕКЦИЯ МЕНЮ СПРАВКИ =====
     def _create_help_menu(self) -> None:
@@ -144,6 +109,10 @@ class MainMenu(QMenuBar):
         self.__about_qt = help_menu.addAction(
             "About qt..."
         )  # Show Qt framework information / Показать информацию о фреймворке Qt
+        help_menu.addSeparator()
+        self.__diagnostics = help_menu.addAction(
+            "Diagnostics..."
+        )  # Show live performance metrics / Показать живые метрики производительности
 
         self.lg.debug("Help_menu add successfully.")
 
@@ -156,137 +125,56 @@ class MainMenu(QMenuBar):
     def about_qt(self):
         return self.__about_qt
 
-    @pyqtSlot(bool)
-    def toggle_teacher_mode(self, enable):
-        self.lg.debug(f"Teacher = {enable}")
-        if not enable:
-            self.lg.debug("Teacher set False")
-            self.__teacher_menu_action.setEnabled(False)
-            self.__teacher_menu_action.setVisible(False)
-            self.__teacher_add.setEnabled(False)
-            self.__teacher_update.setEnabled(False)
-            self.__teacher_delete.setEnabled(False)
-        else:
-            self.lg.debug("Teacher emit")
-            self.teacher_mode_request.emit()
+    @property
+    def diagnostics(self):
+        return self.__diagnostics
 
-    @pyqtSlot(bool)
-    def toggle_student_mode(self, enable):
-        self.lg.debug(f"Student = {enable}")
-        if not enable:
-            self.__student_menu_action.setEnabled(False)
-            self.__student_menu_action.setVisible(False)
-            self.__student_add.setEnabled(False)
-            self.__student_update.setEnabled(False)
-            self.__student_delete.setEnabled(False)
-        else:
-            self.student_mode_request.emit()
+    @property
+    def active_key(self) -> str | None:
+        """Entity key of the current mode / Ключ сущности текущего режима"""
+        return self._active_key
 
     @pyqtSlot(bool)
-    def toggle_st_group_mode(self, enable):
-        self.lg.debug(f"StGroup = {enable}")
-        if not enable:
-            self.__st_group_menu_action.setEnabled(False)
-            self.__st_group_menu_action.setVisible(False)
-            self.__st_group_add.setEnabled(False)
-            self.__st_group_update.setEnabled(False)
-            self.__st_group_delete.setEnabled(False)
-        else:
-            self.st_group_mode_request.emit()
+    def _on_mode_toggled(self, enable: bool) -> None:
+        """Request the mode of a checked Mods action / Запрос режима отмеченного действия Mods"""
+        key = self.sender().data()
+        self.lg.debug("%s = %s", key, enable)
+        if enable and key != self._active_key:
+            self.mode_request.emit(key)
+
+    @pyqtSlot()
+    def _dispatch(self) -> None:
+        """Call the active view method named by the triggered action / Вызов метода активного представления, названного сработавшим действием"""
+        if self._active_view is None:
+            return
+        getattr(self._active_view, self.sender().data())()
 
     # mods
+    def set_mode(self, key: str, widget) -> None:
+        """
+        Show the menu of an entity and send its actions to a view / Показ меню сущности и отправка его действий представлению
+
+        Args:
+            key: Entity key / Ключ сущности
+            widget: View of the mode / Представление режима
+        """
+        if self._active_key is not None and self._active_key != key:
+            self._entity_menus[self._active_key].setVisible(False)
+        self._entity_menus[key].setVisible(True)
+        self._active_key = key
+        self._active_view = widget
+
+        # Keep the Mods menu in step when the mode is set from code, the active key stops a second request /
+        # Синхронизация меню Mods, если режим задан из кода, активный ключ не даёт повторного запроса
+        self._mode_actions[key].setChecked(True)
+
+        self.lg.debug("Set mode %s success.", key)
+
     def set_mode_default(self) -> None:
-        self.__teacher_menu_action.setEnabled(False)
-        self.__teacher_menu_action.setVisible(False)
-        self.__teacher_add.setEnabled(False)
-        self.__teacher_update.setEnabled(False)
-        self.__teacher_delete.setEnabled(False)
-
-        self.__student_menu_action.setEnabled(False)
-        self.__student_menu_action.setVisible(False)
-        self.__student_add.setEnabled(False)
-        self.__student_update.setEnabled(False)
-        self.__student_delete.setEnabled(False)
-
-        self.__st_group_menu_action.setEnabled(False)
-        self.__st_group_menu_action.setVisible(False)
-        self.__st_group_add.setEnabled(False)
-        self.__st_group_update.setEnabled(False)
-        self.__st_group_delete.setEnabled(False)
+        """Hide every entity menu / Скрытие всех меню сущностей"""
+        if self._active_key is not None:
+            self._entity_menus[self._active_key].setVisible(False)
+        self._active_key = None
+        self._active_view = None
 
         self.lg.debug("Set DEFAULT mode success.")
-
-    def set_mode_teacher(self, widget) -> None:
-        self.__teacher_add.triggered.connect(widget.add)
-        self.__teacher_update.triggered.connect(widget.uppdate)
-        self.__teacher_delete.triggered.connect(widget.delete)
-
-        self.__teacher_menu_action.setEnabled(True)
-        self.__teacher_menu_action.setVisible(True)
-        self.__teacher_add.setEnabled(True)
-        self.__teacher_update.setEnabled(True)
-        self.__teacher_delete.setEnabled(True)
-
-        self.__student_menu_action.setEnabled(False)
-        self.__student_menu_action.setVisible(False)
-        self.__student_add.setEnabled(False)
-        self.__student_update.setEnabled(False)
-        self.__student_delete.setEnabled(False)
-
-        self.__st_group_menu_action.setEnabled(False)
-        self.__st_group_menu_action.setVisible(False)
-        self.__st_group_add.setEnabled(False)
-        self.__st_group_update.setEnabled(False)
-        self.__st_group_delete.setEnabled(False)
-
-        self.lg.debug("Set mode success.")
-
-    def set_mode_student(self, widget) -> None:
-        self.__student_add.triggered.connect(widget.add)
-        self.__student_update.triggered.connect(widget.uppdate)
-        self.__student_delete.triggered.connect(widget.delete)
-
-        self.__teacher_menu_action.setEnabled(False)
-        self.__teacher_menu_action.setVisible(False)
-        self.__teacher_add.setEnabled(False)
-        self.__teacher_update.setEnabled(False)
-        self.__teacher_delete.setEnabled(False)
-
-        self.__student_menu_action.setEnabled(True)
-        self.__student_menu_action.setVisible(True)
-        self.__student_add.setEnabled(True)
-        self.__student_update.setEnabled(True)
-        self.__student_delete.setEnabled(True)
-
-        self.__st_group_menu_action.setEnabled(False)
-        self.__st_group_menu_action.setVisible(False)
-        self.__st_group_add.setEnabled(False)
-        self.__st_group_update.setEnabled(False)
-        self.__st_group_delete.setEnabled(False)
-
-        self.lg.debug("Set mode success.")
-
-    def set_mode_st_group(self, widget) -> None:
-        self.__st_group_add.triggered.connect(widget.add)
-        self.__st_group_update.triggered.connect(widget.uppdate)
-        self.__st_group_delete.triggered.connect(widget.delete)
-
-        self.__teacher_menu_action.setEnabled(False)
-        self.__teacher_menu_action.setVisible(False)
-        self.__teacher_add.setEnabled(False)
-        self.__teacher_update.setEnabled(False)
-        self.__teacher_delete.setEnabled(False)
-
-        self.__student_menu_action.setEnabled(False)
-        self.__student_menu_action.setVisible(False)
-        self.__student_add.setEnabled(False)
-        self.__student_update.setEnabled(False)
-        self.__student_delete.setEnabled(False)
-
-        self.__st_group_menu_action.setEnabled(True)
-        self.__st_group_menu_action.setVisible(True)
-        self.__st_group_add.setEnabled(True)
-        self.__st_group_update.setEnabled(True)
-        self.__st_group_delete.setEnabled(True)
-
-        self.lg.debug("Set mode success.")
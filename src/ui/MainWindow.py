@@ -9,15 +9,15 @@ from PyQt6.QtCore import (
 )  # Slot function responds to program actions / Slot функция реагирует на действие в программе
 from PyQt6.QtGui import QIcon
 
-# ===== VIEW IMPORTS - ENTITY CONTROLLERS / ИМПОРТЫ ПРЕДСТАВЛЕНИЙ - КОНТРОЛЛЕРЫ СУЩНОСТЕЙ =====
-# ! Change display class here / ! Смена класса отображения здесь
-import src.controllers.Teacher as Teacher  # Teacher view / Представление учителя
-import src.controllers.Student as Student  # Student view / Представление ученика
-import src.controllers.StGroup as StGroup  # Group view / Представление группы
-
 # ===== UI COMPONENT IMPORTS / ИМПОРТЫ КОМПОНЕНТОВ UI =====
+# Entity views are listed in EntityRegistry / Представления сущностей перечислены в EntityRegistry
+from src.ui.EntityRegistry import EntityRegistry
 from src.ui.MainMenu import MainMenu
+from src.ui.FilterBar import FilterBar
+from src.ui.SearchBar import SearchBar
+from src.ui.ViewManager import ViewManager
 from src.core.Logger import Logger
+from src.core.Tracer import traced
 
 
 # ===== MAIN WINDOW CLASS / КЛАСС ГЛАВНОГО ОКНА =====
@@ -59,12 +59,29 @@ class MainWindow(QMainWindow):
         self.lg.debug("Constructor launched.")
         self.lg.debug("Logger created.")
 
+        # ===== DIALOGS / ДИАЛОГИ =====
+        # Diagnostics dialog is imported and created on first use / Диалог диагностики импортируется и создаётся при первом использовании
+        self._diagnostics = None
+
         # ===== WINDOW CONFIGURATION / КОНФИГУРАЦИЯ ОКНА =====
         self._setup_window_properties()
 
         # ===== MENU SYSTEM SETUP / НАСТРОЙКА СИСТЕМЫ МЕНЮ =====
         self._setup_menu_system()
 
+        # ===== VIEW CACHE SETUP / НАСТРОЙКА КЭША ПРЕДСТАВЛЕНИЙ =====
+        # Mode views live in a stack and survive mode switches / Представления режимов живут в стеке и переживают переключение режимов
+        self.views = ViewManager(parent=self)
+        self.setCentralWidget(self.views)
+
+        # ===== FILTER BAR SETUP / НАСТРОЙКА ПАНЕЛИ ФИЛЬТРА =====
+        # Filters the table of the current mode on the server / Фильтрует таблицу текущего режима на сервере
+        self.filter_bar = FilterBar(parent=self)
+        self.addToolBar(self.filter_bar)
+        # Ranked search across the text columns / Ранжированный поиск по текстовым колонкам
+        self.search_bar = SearchBar(parent=self)
+        self.addToolBar(self.search_bar)
+
         # ===== SIGNAL CONNECTIONS / ПОДКЛЮЧЕНИЕ СИГНАЛОВ =====
         self._connect_menu_signals()
 
@@ -126,19 +143,14 @@ class MainWindow(QMainWindow):
         Устанавливает связи сигнал-слот между элементами меню и их функциональностью.
         Связывает действия пользовательского интерфейса с операциями бизнес-логики.
         """
-        # ===== TEACHER MENU CONNECTIONS / ПОДКЛЮЧЕНИЯ МЕНЮ УЧИТЕЛЯ =====
-        self.main_menu.teacher_mode_request.connect(self.teacher_mode_on)
-
-        # ===== STUDENT MENU CONNECTIONS / ПОДКЛЮЧЕНИЯ МЕНЮ УЧЕНИКА =====
-        self.main_menu.student_mode_request.connect(self.student_mode_on)
-
-        # ===== GROUP MENU CONNECTIONS / ПОДКЛЮЧЕНИЯ МЕНЮ ГРУППЫ =====
-        self.main_menu.st_group_mode_request.connect(self.st_group_mode_on)
+        # ===== MODE MENU CONNECTIONS / ПОДКЛЮЧЕНИЯ МЕНЮ РЕЖИМОВ =====
+        self.main_menu.mode_request.connect(self.show_mode)
 
         # ===== HELP MENU CONNECTIONS / ПОДКЛЮЧЕНИЯ МЕНЮ ПОМОЩИ =====
         # Connect Help menu actions to information dialogs / Подключение действий меню помощи к информационным диалогам
         self.main_menu.about.triggered.connect(self.about)
         self.main_menu.about_qt.triggered.connect(self.about_qt)
+        self.main_menu.diagnostics.triggered.connect(self.diagnostics)
 
         self.lg.debug("Menu signals connected successfully.")
 
@@ -186,31 +198,35 @@ class MainWindow(QMainWindow):
         self.lg.debug("About Qt dialog shown.")
 
     @pyqtSlot()
-    def teacher_mode_on(self) -> None:
-        old = self.centralWidget()
-        v = Teacher.View(parent=self)
-        self.setCentralWidget(v)
-        self.menuBar().set_mode_teacher(v)
-        if old is not None:
-            old.deleteLater()
+    def diagnostics(self) -> None:
+        """
+        Show the diagnostics dialog / Показать диалог диагностики
 
-    @pyqtSlot()
-    def student_mode_on(self) -> None:
-        old = self.centralWidget()
-        v = Student.View(parent=self)
-        self.setCentralWidget(v)
-        self.menuBar().set_mode_student(v)
-        if old is not None:
-            old.deleteLater()
+        The dialog is not modal and is reused, so it can stay open while working.
+        Диалог не модальный и используется повторно, поэтому может оставаться открытым во время работы.
+        """
+        if self._diagnostics is None:
+            from src.ui.DiagnosticsDialog import DiagnosticsDialog
+
+            self._diagnostics = DiagnosticsDialog(parent=self)
+        self._diagnostics.show()
+        self._diagnostics.raise_()
+        self._diagnostics.activateWindow()
+        self.lg.debug("Diagnostics dialog shown.")
+
+    @pyqtSlot(str)
+    @traced()
+    def show_mode(self, key: str) -> None:
+        """
+        Show the table mode of an entity / Показ режима таблицы сущности
 
-    @pyqtSlot()
-    def st_group_mode_on(self) -> None:
-        old = self.centralWidget()
-        v = StGroup.View(parent=self)
-        self.setCentralWidget(v)
-        self.menuBar().set_mode_st_group(v)
-        if old is not None:
-            old.deleteLater()
+        Args:
+            key: Entity key from EntityRegistry / Ключ сущности из EntityRegistry
+        """
+        v = self.views.show_view(key, EntityRegistry.get(key).view_class())
+        self.main_menu.set_mode(key, v)
+        self.filter_bar.attach(v.model())
+        self.search_bar.attach(v.model())
 
 
 # ===== MAIN EXECUTION BLOCK - FOR TESTING / БЛОК ГЛАВНОГО ВЫПОЛНЕНИЯ - ДЛЯ ТЕСТИРОВАНИЯ =====
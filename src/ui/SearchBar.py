@@ -0,0 +1,100 @@
+# ===== SEARCH BAR / СТРОКА ПОИСКА =====
+# Incremental search over the current table, run on the server while typing
+# Инкрементальный поиск по текущей таблице, выполняемый на сервере во время набора
+
+# ===== IMPORTS / ИМПОРТЫ =====
+from PyQt6.QtCore import QTimer, pyqtSlot
+from PyQt6.QtWidgets import QToolBar, QLineEdit, QLabel
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+
+
+# ===== SEARCH BAR CLASS / КЛАСС СТРОКИ ПОИСКА =====
+class SearchBar(QToolBar):
+    """
+    Search bar of the current table / Строка поиска текущей таблицы
+
+    Keystrokes are debounced: the search starts after a pause of search_debounce_ms (perf_settings.json)
+    or at once on Enter, so typing a name sends one query instead of one per letter.
+    The model cancels a search that is still running when the next one starts.
+
+    Нажатия клавиш объединяются: поиск начинается после паузы search_debounce_ms (perf_settings.json)
+    или сразу по Enter, поэтому набор имени отправляет один запрос, а не по одному на букву.
+    Модель отменяет ещё выполняющийся поиск, когда начинается следующий.
+    """
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self, parent=None):
+        """
+        Build the bar, disabled until a table is attached / Построение строки, отключена до подключения таблицы
+
+        Args:
+            parent: Parent widget / Родительский виджет
+        """
+        super().__init__("Search", parent)
+
+        # ===== LOGGER INITIALIZATION / ИНИЦИАЛИЗАЦИЯ ЛОГЕРА =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        self.appcfg = AppConfig()
+        self._model = None
+
+        # ===== WIDGETS / ВИДЖЕТЫ =====
+        self._text = QLineEdit(self)
+        self._text.setPlaceholderText("Search...")
+        self._text.setClearButtonEnabled(True)
+        self.addWidget(QLabel("Search: ", self))
+        self.addWidget(self._text)
+
+        # ===== DEBOUNCE TIMER / ТАЙМЕР ОБЪЕДИНЕНИЯ НАЖАТИЙ =====
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.apply)
+
+        # ===== SIGNAL CONNECTIONS / ПОДКЛЮЧЕНИЕ СИГНАЛОВ =====
+        self._text.textChanged.connect(self._on_text_changed)
+        self._text.returnPressed.connect(self.apply)
+
+        self.setEnabled(False)
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def attach(self, model) -> None:
+        """
+        Search another table model / Поиск по другой модели таблицы
+
+        A cached model keeps its search, which is shown again.
+        Кэшированная модель сохраняет свой поиск, и он показывается снова.
+
+        Args:
+            model: DatabaseModelMixin model of the current view / Модель DatabaseModelMixin текущего представления
+        """
+        self._timer.stop()
+        self._model = model
+        self._text.blockSignals(True)
+        self._text.setText(model.criteria.search_text)
+        self._text.blockSignals(False)
+        self._text.setToolTip("Columns: " + ", ".join(model.search_columns))
+        self.setEnabled(True)
+
+    # ===== SLOT METHODS / МЕТОДЫ-СЛОТЫ =====
+
+    @pyqtSlot()
+    def apply(self) -> None:
+        """
+        Send the search text to the model now / Отправка текста поиска модели сейчас
+        """
+        self._timer.stop()
+        if self._model is None:
+            return
+        try:
+            self._model.search(self._text.text())
+        except Exception as e:
+            self.lg.error("Internal error: %s.", e)
+
+    @pyqtSlot(str)
+    def _on_text_changed(self, _text: str) -> None:
+        """Restart the pause after every keystroke / Перезапуск паузы после каждого нажатия"""
+        self._timer.start(self.appcfg.perf_settings["search_debounce_ms"])
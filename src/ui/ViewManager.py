@@ -0,0 +1,218 @@
+# ===== VIEW MANAGER / МЕНЕДЖЕР ПРЕДСТАВЛЕНИЙ =====
+# Central widget that keeps recently used views with their loaded models
+# Центральный виджет, хранящий недавно использованные представления с их загруженными моделями
+
+# ===== IMPORTS / ИМПОРТЫ =====
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+from PyQt6.QtCore import QTimer, pyqtSlot
+from PyQt6.QtWidgets import QStackedWidget
+from src.config.AppConfig import AppConfig
+from src.core.Logger import Logger
+from src.core.Metrics import Metrics
+
+
+# ===== VIEW MANAGER CLASS / КЛАСС МЕНЕДЖЕРА ПРЕДСТАВЛЕНИЙ =====
+class ViewManager(QStackedWidget):
+    """
+    Stack of cached table views / Стек кэшированных представлений таблиц
+
+    Switching to a mode shows its cached view at once, with data, column widths, sort, filters and scroll
+    position kept. Hidden views stay loaded (and live refresh keeps patching them) within a budget
+    from perf_settings.json, least recently used first out:
+    - view_cache_size: views kept, the current one included / хранимых представлений, включая текущее
+    - view_cache_max_cells: loaded cells (rows x columns) of hidden views / загруженных ячеек (строки x колонки) скрытых представлений
+    - view_cache_idle_s: hidden views unused longer are released, 0 - never / скрытые представления, не используемые дольше, освобождаются, 0 - никогда
+
+    Переключение на режим сразу показывает его кэшированное представление с сохранёнными данными, ширинами колонок,
+    сортировкой, фильтрами и позицией прокрутки. Скрытые представления остаются загруженными (и обновление на лету
+    продолжает их обновлять) в пределах бюджета из perf_settings.json, первыми уходят давно не использованные.
+    """
+
+    IDLE_CHECK_MS = 30000  # Period of the idle release check / Период проверки освобождения простаивающих
+
+    # ===== INITIALIZATION METHOD / МЕТОД ИНИЦИАЛИЗАЦИИ =====
+    def __init__(self, parent=None):
+        """
+        Create the empty stack / Создание пустого стека
+
+        Args:
+            parent: Parent widget (usually MainWindow) / Родительский виджет (обычно MainWindow)
+        """
+        super().__init__(parent)
+
+        # ===== LOGGER INITIALIZATION / ИНИЦИАЛИЗАЦИЯ ЛОГЕРА =====
+        self.lg = Logger()
+        self.lg.debug("Constructor launched.")
+        self.lg.debug("Logger created.")
+
+        # ===== CACHE STATE / СОСТОЯНИЕ КЭША =====
+        # key -> view in LRU order, last used at the end / ключ -> представление в порядке LRU, последнее в конце
+        self._views: OrderedDict[str, Any] = OrderedDict()
+        # key -> monotonic time the view was last shown or hidden / ключ -> время последнего показа или скрытия
+        self._last_used: dict[str, float] = {}
+        self._stats = {"hits": 0, "misses": 0, "released": 0}
+        # Published by the GUI thread for the metrics thread, which must not touch views /
+        # Публикуется GUI потоком для потока метрик, который не должен трогать представления
+        self._snapshot: dict[str, Any] = {**self._stats, "views": [], "cells": 0}
+
+        # ===== LIVE SETTINGS / НАСТРОЙКИ НА ЛЕТУ =====
+        # Applied at the next switch or idle check, callbacks come from the watcher thread /
+        # Применяются при следующем переключении или проверке простоя, обратные вызовы приходят из потока наблюдателя
+        appcfg = AppConfig()
+        self._apply_perf(appcfg.perf_settings)
+        appcfg.subscribe(appcfg.save_set_perf_file, self._apply_perf)
+
+        # ===== IDLE TIMER / ТАЙМЕР ПРОСТОЯ =====
+        self._idle_timer = QTimer(self)
+        self._idle_timer.timeout.connect(self.release_idle)
+        self._idle_timer.start(self.IDLE_CHECK_MS)
+
+        Metrics().register_gauge("views", self.stats)
+
+    # ===== PUBLIC METHODS / ПУБЛИЧНЫЕ МЕТОДЫ =====
+
+    def show_view(self, key: str, factory: Callable[..., Any]) -> Any:
+        """
+        Show the view of a mode, creating it if it is not cached / Показ представления режима, с созданием, если его нет в кэше
+
+        Args:
+            key (str): Mode key, e.g. the table name / Ключ режима, например имя таблицы
+            factory: View class or callable taking parent= / Класс представления или вызываемый объект с parent=
+
+        Returns:
+            BaseView: Current view / Текущее представление
+        """
+        previous = self.current_key()
+        if previous is not None:
+            self._last_used[previous] = time.monotonic()
+
+        view = self._views.get(key)
+        if view is None:
+            self._stats["misses"] += 1
+            view = factory(parent=self)
+            self._views[key] = view
+            self.addWidget(view)
+        else:
+            self._stats["hits"] += 1
+        self._views.move_to_end(key)
+        self._last_used[key] = time.monotonic()
+        self.setCurrentWidget(view)
+
+        self._trim()
+        self._publish()
+        return view
+
+    def current_key(self) -> str | None:
+        """Key of the shown view, None if nothing is shown / Ключ показанного представления, None если ничего не показано"""
+        current = self.currentWidget()
+        for key, view in self._views.items():
+            if view is current:
+                return key
+        return None
+
+    def release(self, key: str) -> bool:
+        """
+        Release a cached view and its model / Освобождение кэшированного представления и его модели
+
+        Args:
+            key (str): Mode key / Ключ режима
+
+        Returns:
+            bool: True if the view was cached / True если представление было в кэше
+        """
+        view = self._views.pop(key, None)
+        if view is None:
+            return False
+        self._last_used.pop(key, None)
+        # Released view must not keep loading in the background /
+        # Освобождённое представление не должно продолжать загрузку в фоне
+        view.cancel_pending()
+        self.removeWidget(view)
+        view.deleteLater()
+        self._stats["released"] += 1
+        self._publish()
+        self.lg.debug("Released view %s.", key)
+        return True
+
+    @pyqtSlot()
+    def release_idle(self) -> int:
+        """
+        Release hidden views unused longer than view_cache_idle_s / Освобождение скрытых представлений, не используемых дольше view_cache_idle_s
+
+        Returns:
+            int: Number of released views / Количество освобождённых представлений
+        """
+        # Loaded rows grow with pages and streams, the timer keeps the gauge current /
+        # Загруженные строки растут со страницами и потоками, таймер поддерживает датчик актуальным
+        self._publish()
+        if self.idle_s <= 0:
+            return self._trim()
+        current = self.current_key()
+        now = time.monotonic()
+        idle = [
+            key
+            for key in self._views
+            if key != current and now - self._last_used.get(key, now) >= self.idle_s
+        ]
+        for key in idle:
+            self.release(key)
+        return len(idle) + self._trim()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of view cache statistics / Снимок статистики кэша представлений
+
+        Safe from any thread: returns the copy last published by the GUI thread.
+        Безопасно из любого потока: возвращает копию, последней опубликованную GUI потоком.
+
+        Returns:
+            dict: Counters, cached views and their loaded cells / Счётчики, кэшированные представления и их загруженные ячейки
+        """
+        return dict(self._snapshot)
+
+    # ===== PRIVATE METHODS / ПРИВАТНЫЕ МЕТОДЫ =====
+
+    def _publish(self) -> None:
+        """
+        Rebuild the statistics snapshot, GUI thread only / Пересборка снимка статистики, только в GUI потоке
+        """
+        snapshot: dict[str, Any] = dict(self._stats)
+        snapshot["views"] = list(self._views)
+        snapshot["cells"] = sum(self._cells(view) for view in self._views.values())
+        # One reference assignment, readers see the old or the new dict / Одно присваивание ссылки, читатели видят старый или новый словарь
+        self._snapshot = snapshot
+
+    def _trim(self) -> int:
+        """
+        Release least recently used hidden views above the budget / Освобождение давно не использованных скрытых представлений сверх бюджета
+
+        Returns:
+            int: Number of released views / Количество освобождённых представлений
+        """
+        current = self.current_key()
+        released = 0
+        while True:
+            hidden = [key for key in self._views if key != current]
+            cells = sum(self._cells(self._views[key]) for key in hidden)
+            if not hidden or (
+                len(self._views) <= self.size and cells <= self.max_cells
+            ):
+                return released
+            self.release(hidden[0])
+            released += 1
+
+    @staticmethod
+    def _cells(view) -> int:
+        """Loaded cells of a view's model, a rough memory measure / Загруженные ячейки модели представления, грубая мера памяти"""
+        model = view.model()
+        return model.loaded_rows() * max(len(model.column_names), 1)
+
+    def _apply_perf(self, perf: dict) -> None:
+        """
+        Apply view_cache_* settings from perf_settings.json / Применение настроек view_cache_* из perf_settings.json
+        """
+        self.size = perf["view_cache_size"]
+        self.max_cells = perf["view_cache_max_cells"]
+        self.idle_s = perf["view_cache_idle_s"]